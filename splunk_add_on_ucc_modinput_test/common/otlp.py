@@ -0,0 +1,274 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+SCOPE_NAME = "splunk_add_on_ucc_modinput_test"
+SERVICE_NAME = "splunk-add-on-ucc-modinput-test"
+# span attributes copied from parent to child spans, so spans of REST
+# calls can be correlated with the session and the test they are made for
+INHERITED_ATTRIBUTES = ("session_id", "test_id")
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_ERROR = 2
+
+
+class OtlpSpan:
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        kind: int,
+        attributes: Dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @staticmethod
+    def _value(value: Any) -> Dict[str, Any]:
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        return {"stringValue": str(value)}
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time or time.time_ns()),
+            "attributes": [
+                {"key": key, "value": self._value(value)}
+                for key, value in self.attributes.items()
+            ],
+        }
+        if self.parent_id is not None:
+            span["parentSpanId"] = self.parent_id
+        if self.error is not None:
+            span["status"] = {
+                "code": STATUS_CODE_ERROR,
+                "message": self.error,
+            }
+        return span
+
+
+_current_span: contextvars.ContextVar[
+    Optional[OtlpSpan]
+] = contextvars.ContextVar("ucc_modinput_test_otlp_span", default=None)
+
+
+class OtlpTracer:
+    """
+    Records spans of the test session, tests, forge executions, probes,
+    teardowns, search jobs and Splunk REST calls and saves them to a file
+    in OTLP JSON format, so they can be imported to observability tools
+    without running an OpenTelemetry collector. Spans are recorded only
+    after the tracer is started.
+
+    Span activated in a thread or coroutine becomes the parent of spans
+    started there without explicit parent, e.g. REST calls made by forge.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: List[OtlpSpan] = []
+        self._session_span: Optional[OtlpSpan] = None
+        self._resource_attributes: Dict[str, Any] = {}
+
+    @property
+    def is_started(self) -> bool:
+        return self._session_span is not None
+
+    def start(self, attributes: Optional[Dict[str, Any]] = None) -> None:
+        trace_id = f"{random.getrandbits(128):032x}"
+        with self._lock:
+            self._spans = []
+            self._resource_attributes = dict(
+                {"service.name": SERVICE_NAME}, **(attributes or {})
+            )
+            self._session_span = OtlpSpan(
+                "test session",
+                trace_id,
+                None,
+                SPAN_KIND_INTERNAL,
+                dict(attributes or {}),
+            )
+        logger.debug("OTLP tracer has started")
+
+    @staticmethod
+    def current_span() -> Optional[OtlpSpan]:
+        return _current_span.get()
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[OtlpSpan] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> Optional[OtlpSpan]:
+        """
+        Starts span as a child of the parent span, of the span active in
+        the current context or of the session span. Span is recorded when
+        it ends, span that is not ended is discarded.
+        """
+        session_span = self._session_span
+        if session_span is None:
+            return None
+        parent = parent or self.current_span() or session_span
+        span_attributes = {
+            key: parent.attributes[key]
+            for key in INHERITED_ATTRIBUTES
+            if key in parent.attributes
+        }
+        span_attributes.update(attributes or {})
+        return OtlpSpan(
+            name, session_span.trace_id, parent.span_id, kind, span_attributes
+        )
+
+    def end_span(
+        self, span: Optional[OtlpSpan], error: Optional[str] = None
+    ) -> None:
+        if span is None or span.end_time is not None:
+            return
+        span.error = error
+        span.end_time = time.time_ns()
+        with self._lock:
+            self._spans.append(span)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def activate(span: Optional[OtlpSpan]) -> Iterator[None]:
+        if span is None:
+            yield
+            return
+        token = _current_span.set(span)
+        try:
+            yield
+        finally:
+            _current_span.reset(token)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        parent: Optional[OtlpSpan] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> Iterator[Optional[OtlpSpan]]:
+        span = self.start_span(name, parent, attributes, kind)
+        if span is None:
+            yield None
+            return
+        try:
+            with self.activate(span):
+                yield span
+        except (StopIteration, StopAsyncIteration):
+            # exhausted generator is not an error
+            self.end_span(span)
+            raise
+        except BaseException as e:
+            self.end_span(span, str(e) or type(e).__name__)
+            raise
+        self.end_span(span)
+
+    def save(self, path: Optional[str]) -> None:
+        if not self.is_started or not path:
+            return
+        self.end_span(self._session_span)
+        with self._lock:
+            self._session_span = None
+            spans = [span.to_otlp() for span in self._spans]
+            resource = [
+                {"key": key, "value": OtlpSpan._value(value)}
+                for key, value in self._resource_attributes.items()
+            ]
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": resource},
+                    "scopeSpans": [
+                        {"scope": {"name": SCOPE_NAME}, "spans": spans}
+                    ],
+                }
+            ]
+        }
+        # OTLP JSON file exporters write one export request per line
+        with open(path, "w") as f:
+            f.write(json.dumps(request) + "\n")
+        logger.info(f"OTLP trace with {len(spans)} spans saved to {path}")
+
+
+otlp_tracer = OtlpTracer()
+
+
+def traced_http_handler(
+    handler: Callable[..., Dict[str, Any]]
+) -> Callable[..., Dict[str, Any]]:
+    """
+    Wraps splunklib HTTP request handler to record every REST call as
+    a client span of the span active in the calling context.
+    """
+
+    def request(url: str, message: Dict[str, Any], **kwargs: Any) -> Any:
+        if not otlp_tracer.is_started:
+            return handler(url, message, **kwargs)
+        method = message.get("method", "GET")
+        path = urlsplit(url).path
+        span = otlp_tracer.start_span(
+            f"{method} {path}",
+            attributes={"http.method": method, "url.path": path},
+            kind=SPAN_KIND_CLIENT,
+        )
+        try:
+            response = handler(url, message, **kwargs)
+        except Exception as e:
+            otlp_tracer.end_span(span, str(e) or type(e).__name__)
+            raise
+        if span is not None:
+            span.set_attribute("http.status_code", response["status"])
+        error = response["reason"] if response["status"] >= 400 else None
+        otlp_tracer.end_span(span, error)
+        return response
+
+    return request
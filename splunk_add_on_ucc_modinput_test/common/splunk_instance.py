@@ -25,6 +25,7 @@ from splunklib.client import Index
 import splunklib.results as results
 from splunk_add_on_ucc_modinput_test.common import utils
 from .splunk_service_pool import SplunkServicePool
+from .otlp import otlp_tracer
 import json
 from urllib import request, error
 import ssl
@@ -492,13 +493,18 @@ class SearchState:
 def search(*, service: Service, searchquery: str) -> SearchState:
     search_state = None
     kwargs_normalsearch = {"exec_mode": "normal"}
-    job = service.jobs.create(searchquery, **kwargs_normalsearch)
-    while True:
-        while not job.is_ready():
-            pass
-        if job["isDone"] == "1":
-            search_state = SearchState(job)
-            break
-        time.sleep(1)
-    job.cancel()
+    with otlp_tracer.span(
+        "search job", attributes={"splunk.search": searchquery}
+    ) as span:
+        job = service.jobs.create(searchquery, **kwargs_normalsearch)
+        if span is not None:
+            span.set_attribute("splunk.search.sid", job.sid)
+        while True:
+            while not job.is_ready():
+                pass
+            if job["isDone"] == "1":
+                search_state = SearchState(job)
+                break
+            time.sleep(1)
+        job.cancel()
     return search_state
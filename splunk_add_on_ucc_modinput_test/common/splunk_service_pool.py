@@ -13,11 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from splunklib import client
+from splunklib import binding, client
 from threading import Lock
 from typing import Any, Union, List
 import logging
 
+from splunk_add_on_ucc_modinput_test.common.otlp import traced_http_handler
+
 logger = logging.getLogger("ucc-modinput-test")
 
 
@@ -42,6 +44,7 @@ class SplunkServiceProxy:
                 port=self._port,
                 username=self._username,
                 password=self._password,
+                handler=traced_http_handler(binding.handler()),
             )
 
 
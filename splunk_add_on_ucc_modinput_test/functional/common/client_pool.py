@@ -0,0 +1,91 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Iterator, Mapping, Tuple
+
+ClientFactoryType = Callable[[], Any]
+
+
+class ClientPool:
+    """
+    Clients of global builtin arguments, created lazily when a forge, probe
+    or test requests them for the first time. Clients of classes with
+    shared_between_tests attribute set are created once and shared by all
+    tests, so such classes are expected to be thread safe, as
+    SplunkClientBase is with its pool of Splunk services. Other clients
+    are created for every test that requests them.
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, Tuple[ClientFactoryType, bool]] = {}
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, name: str, factory: ClientFactoryType, shared: bool = True
+    ) -> None:
+        with self._lock:
+            self._factories[name] = (factory, shared)
+            self._clients.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._factories)
+
+    def get(self, name: str, test_clients: Dict[str, Any]) -> Any:
+        factory, shared = self._factories[name]
+        clients = self._clients if shared else test_clients
+        client = clients.get(name)
+        if client is None:
+            with self._lock:
+                client = clients.get(name)
+                if client is None:
+                    client = clients[name] = factory()
+        return client
+
+
+class GlobalBuiltinArgs(Mapping[str, Any]):
+    """
+    Global builtin arguments of a test. Clients are taken from the pool
+    only when the argument value is accessed.
+    """
+
+    def __init__(self, pool: ClientPool, static_args: Dict[str, Any]) -> None:
+        self._pool = pool
+        self._static_args = static_args
+        self._test_clients: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._static_args:
+            return self._static_args[name]
+        if name not in self._pool:
+            raise KeyError(name)
+        return self._pool.get(name, self._test_clients)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._static_args
+        yield from self._pool.names
+
+    def __len__(self) -> int:
+        return len(self._static_args) + len(self._pool.names)
+
+    def __repr__(self) -> str:
+        return f"GlobalBuiltinArgs({list(self)})"
@@ -0,0 +1,105 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Coroutine, Optional, TypeVar
+from splunk_add_on_ucc_modinput_test.functional import logger
+
+T = TypeVar("T")
+
+
+class FrameworkEventLoop:
+    """
+    Event loop running in a dedicated daemon thread. It is shared by the
+    whole session so async forges, their teardowns and async probes always
+    run in the same loop, no matter which thread invokes them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    @property
+    def in_loop_thread(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop, started),
+                    name="ucc-modinput-test-event-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+                logger.debug("Framework event loop has started")
+            return self._loop
+
+    @staticmethod
+    def _run_loop(
+        loop: asyncio.AbstractEventLoop, started: threading.Event
+    ) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+
+    def submit(
+        self, coro: Coroutine[Any, Any, T]
+    ) -> concurrent.futures.Future[T]:
+        return asyncio.run_coroutine_threadsafe(coro, self.get_loop())
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        assert (
+            not self.in_loop_thread
+        ), "Blocking call to the framework event loop from its own thread"
+
+        async def _await() -> T:
+            return await awaitable
+
+        future = self.submit(_await())
+        return future.result()
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None:
+            return
+
+        async def _shutdown() -> None:
+            await loop.shutdown_asyncgens()
+            loop.stop()
+
+        asyncio.run_coroutine_threadsafe(_shutdown(), loop)
+        thread.join()
+        loop.close()
+        logger.debug("Framework event loop has stopped")
+
+
+framework_loop = FrameworkEventLoop()
@@ -0,0 +1,99 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Hashable
+
+
+def same_args(args1: Any, args2: Any) -> bool:
+    if type(args1) is not type(args2):
+        return False
+
+    if isinstance(args1, (list, tuple)):
+        if len(args1) != len(args2):
+            return False
+        for arg1, arg2 in zip(args1, args2):
+            if not same_args(arg1, arg2):
+                return False
+        return True
+
+    if isinstance(args1, dict):
+        if len(args1) != len(args2):
+            return False
+        if set(args2.keys()).difference(set(args1.keys())):
+            return False
+        for k, v in args1.items():
+            if not same_args(v, args2[k]):
+                return False
+        return True
+
+    return args1 == args2
+
+
+def _fingerprint(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_fingerprint(v) for v in value)
+
+    if isinstance(value, dict):
+        return type(value), frozenset(
+            (k, _fingerprint(v)) for k, v in value.items()
+        )
+
+    hash(value)
+    return type(value), value
+
+
+def make_fingerprint(args: Any) -> Hashable | None:
+    """
+    Returns canonical hashable representation of forge arguments. Arguments
+    considered the same by same_args have equal fingerprints, so they can be
+    used as dictionary keys. Returns None if arguments contain unhashable
+    values and can only be compared by same_args.
+    """
+    try:
+        return _fingerprint(args)
+    except TypeError:
+        return None
+
+
+def _canonical(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        items = ",".join(_canonical(v) for v in value)
+        return f"{type(value).__qualname__}[{items}]"
+
+    if isinstance(value, dict):
+        pairs = sorted(
+            f"{_canonical(k)}:{_canonical(v)}" for k, v in value.items()
+        )
+        return f"{type(value).__qualname__}{{{','.join(pairs)}}}"
+
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return f"{type(value).__qualname__}:{value!r}"
+
+    raise TypeError(f"{type(value)} has no stable representation")
+
+
+def make_digest(args: Any) -> str | None:
+    """
+    Returns digest of forge arguments that stays the same between test
+    sessions. Returns None if arguments contain values other than builtin
+    scalars and containers, as their representation can not be trusted.
+    """
+    try:
+        return hashlib.sha256(_canonical(args).encode()).hexdigest()
+    except TypeError:
+        return None
@@ -0,0 +1,211 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
+from pytest import Config
+from splunk_add_on_ucc_modinput_test.functional import logger
+from splunk_add_on_ucc_modinput_test.functional.common.forge_args import (
+    make_digest,
+)
+from splunk_add_on_ucc_modinput_test.functional.constants import ForgeCache
+
+if TYPE_CHECKING:
+    from splunk_add_on_ucc_modinput_test.functional.entities.task import (
+        FrameworkTask,
+    )
+    from splunk_add_on_ucc_modinput_test.typing import ArtifactsType
+
+
+def call_cache_cleanup(
+    cleanup: Callable[..., Any],
+    kwargs: Mapping[str, Any],
+    global_builtin_args: Mapping[str, Any],
+) -> None:
+    """
+    Calls cache cleanup function of a forge with the forge arguments and
+    artifacts of its execution, or global builtin arguments it requires.
+    """
+    call_kwargs = {}
+    for name in inspect.signature(cleanup).parameters:
+        if name in kwargs:
+            call_kwargs[name] = kwargs[name]
+        elif name in global_builtin_args:
+            # builtin clients are created only when required
+            call_kwargs[name] = global_builtin_args[name]
+    cleanup(**call_kwargs)
+
+
+class ForgeResultCache:
+    """
+    Results of forges declared with cache_version, stored in pytest cache
+    directory to be reused by next test sessions until they expire.
+    Resources created by cached forges are kept between sessions, cache
+    cleanup function declared for the forge is stored together with the
+    result and called when the cache is purged.
+    """
+
+    def __init__(self) -> None:
+        self._dir: Path | None = None
+        self._ttl = float(ForgeCache.DEFAULT_TTL.value)
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._dir is not None
+
+    def load(
+        self,
+        pytest_config: Optional[Config],
+        ttl: int,
+        purge: bool,
+        global_builtin_args: Mapping[str, Any],
+    ) -> None:
+        cache = getattr(pytest_config, "cache", None)
+        if cache is None:
+            return
+        cache_dir = Path(cache.mkdir(ForgeCache.DIR_NAME.value))
+        self._ttl = float(ttl)
+        if purge:
+            self._purge(cache_dir, global_builtin_args)
+            self._dir = None
+        else:
+            self._dir = cache_dir
+
+    def _purge(
+        self, cache_dir: Path, global_builtin_args: Mapping[str, Any]
+    ) -> None:
+        for path in cache_dir.glob("*.tmp"):
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+        kept = 0
+        for path in cache_dir.glob("*.pickle"):
+            if not self._cleanup(path, global_builtin_args):
+                kept += 1
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+        logger.info(
+            f"Forge result cache has been purged, {kept} results with "
+            "failed cleanup are kept for next purge."
+        )
+
+    @staticmethod
+    def _cleanup(path: Path, global_builtin_args: Mapping[str, Any]) -> bool:
+        """
+        Calls cleanup function stored with cached result. Returns False if
+        the result has to be kept as its resources could not be released.
+        """
+        try:
+            with open(path, "rb") as f:
+                _, _, cleanup = pickle.load(f)
+        except (ImportError, AttributeError) as e:
+            # module of the cleanup function can not be imported now
+            logger.warning(
+                f"Cleanup function of cached forge result {path} can not "
+                f"be loaded: {e}"
+            )
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to read cached forge result {path}: {e}")
+            return True
+        if cleanup is None:
+            return True
+        cleanup_fn, kwargs = cleanup
+        try:
+            call_cache_cleanup(cleanup_fn, kwargs, global_builtin_args)
+        except Exception as e:
+            logger.warning(
+                f"Cleanup of cached forge result {path} has failed: {e}\n"
+                f"{traceback.format_exc()}"
+            )
+            return False
+        logger.info(f"Cached forge result {path} has been cleaned up")
+        return True
+
+    def _make_path(self, task: FrameworkTask) -> Path | None:
+        if self._dir is None or task.cache_version is None:
+            return None
+        digest = make_digest(task.comparable_args)
+        if digest is None:
+            logger.debug(f"Forge arguments can not be cached:{task.summary}")
+            return None
+        key = "\0".join([*task.forge_key, task.cache_version, digest])
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self._dir / f"{name}.pickle"
+
+    def get(self, task: FrameworkTask) -> ArtifactsType | None:
+        path = self._make_path(task)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                created, result, cleanup = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to read cached forge result {path}: {e}")
+            return None
+        if time.time() - created > self._ttl:
+            logger.debug(f"Cached forge result expired:{task.summary}")
+            # expired result with cleanup is kept until it is replaced by
+            # next execution of the forge or purged
+            if cleanup is None:
+                with contextlib.suppress(FileNotFoundError):
+                    path.unlink()
+            return None
+        return result
+
+    def put(self, task: FrameworkTask, result: ArtifactsType) -> bool:
+        path = self._make_path(task)
+        if path is None:
+            return False
+        cleanup = None
+        if task.cache_cleanup is not None:
+            cleanup = (
+                task.cache_cleanup,
+                {**task.comparable_args, **result},
+            )
+        try:
+            data = pickle.dumps((time.time(), result, cleanup))
+        except Exception as e:
+            logger.warning(
+                f"Forge result can not be cached: {e}{task.summary}"
+            )
+            return False
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            # readers never see partially written file
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(
+                f"Failed to write cached forge result {path}: {e}"
+                f"{task.summary}"
+            )
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            return False
+        return True
+
+
+forge_result_cache = ForgeResultCache()
@@ -0,0 +1,180 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import fnmatch
+import os
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+from splunk_add_on_ucc_modinput_test.functional import logger
+from splunk_add_on_ucc_modinput_test.functional.constants import (
+    ForgeProfiling,
+)
+
+T = TypeVar("T")
+
+
+def _profiled_call(fn: Callable[..., T], *args: Any) -> T:
+    # frames above this one belong to the framework and are not sampled
+    return fn(*args)
+
+
+class ForgeProfiler:
+    """
+    Sampling profiler of forges, probes and forge teardowns. Stacks of
+    threads executing profiled forges are sampled at fixed interval and
+    saved in collapsed stack format, one file per forge execution and one
+    merged file for the whole session, ready to be rendered as flamegraphs
+    with flamegraph.pl, speedscope or similar tools.
+
+    Coroutines are not profiled, as frames of coroutines sharing the
+    framework event loop thread can not be told apart.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pattern: Optional[str] = None
+        self._directory = ForgeProfiling.DEFAULT_DIRECTORY.value
+        # thread id -> (forge path, phase, stacks of forge execution)
+        self._active: Dict[int, Tuple[str, str, Counter[str]]] = {}
+        self._executions: Dict[Tuple[str, str], Counter[str]] = {}
+        self._sampler: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._pattern is not None
+
+    def start(self, pattern: str, directory: str) -> None:
+        with self._lock:
+            self._pattern = pattern
+            self._directory = directory
+            self._active = {}
+            self._executions = {}
+            self._stopped.clear()
+            self._sampler = threading.Thread(
+                target=self._sample, name="forge_profiler", daemon=True
+            )
+            self._sampler.start()
+        logger.debug(f"Forge profiler has started for forges {pattern}")
+
+    def matches(self, forge_path: str) -> bool:
+        """
+        Checks if forge with given full path, i.e. module path and forge
+        name separated by '::', or its name matches the glob filter.
+        """
+        if self._pattern is None:
+            return False
+        name = forge_path.rsplit("::", 1)[-1]
+        return fnmatch.fnmatch(forge_path, self._pattern) or fnmatch.fnmatch(
+            name, self._pattern
+        )
+
+    def profile(
+        self,
+        forge_path: str,
+        exec_id: Optional[str],
+        phase: str,
+        fn: Callable[..., T],
+        *args: Any,
+    ) -> T:
+        """
+        Calls fn with given args sampling its stacks as a phase (setup,
+        probe or teardown) of the forge execution with given exec_id.
+        """
+        tid = threading.get_ident()
+        if (
+            exec_id is None
+            or not self.matches(forge_path)
+            or tid in self._active
+        ):
+            return fn(*args)
+        with self._lock:
+            stacks = self._executions.setdefault(
+                (forge_path, exec_id), Counter()
+            )
+            self._active[tid] = (forge_path, phase, stacks)
+        try:
+            return _profiled_call(fn, *args)
+        finally:
+            with self._lock:
+                del self._active[tid]
+
+    @staticmethod
+    def _collapse(frame: Optional[FrameType]) -> str:
+        names = []
+        while frame is not None and frame.f_code is not _profiled_call_code:
+            code = frame.f_code
+            names.append(
+                f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                f":{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def _sample(self) -> None:
+        interval = ForgeProfiling.SAMPLING_INTERVAL.value
+        while not self._stopped.wait(interval):
+            frames = sys._current_frames()
+            with self._lock:
+                for tid, (_, phase, stacks) in self._active.items():
+                    stack = self._collapse(frames.get(tid))
+                    if stack:
+                        stacks[f"{phase};{stack}"] += 1
+
+    @staticmethod
+    def _file_stem(forge_path: str, exec_id: str) -> str:
+        module, _, name = forge_path.rpartition("::")
+        return f"{Path(module).stem}.{name}-{exec_id}"
+
+    def save(self) -> None:
+        if not self.is_enabled:
+            return
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        with self._lock:
+            self._pattern = None
+            executions = self._executions
+            self._executions = {}
+        os.makedirs(self._directory, exist_ok=True)
+        session: Counter[str] = Counter()
+        for (forge_path, exec_id), stacks in executions.items():
+            path = Path(self._directory) / (
+                self._file_stem(forge_path, exec_id) + ".collapsed"
+            )
+            path.write_text(
+                "".join(f"{s} {n}\n" for s, n in sorted(stacks.items()))
+            )
+            for stack, count in stacks.items():
+                session[f"{forge_path};{stack}"] += count
+        path = Path(self._directory) / ForgeProfiling.SESSION_FILE.value
+        path.write_text(
+            "".join(f"{s} {n}\n" for s, n in sorted(session.items()))
+        )
+        logger.info(
+            f"Forge profiles of {len(executions)} executions saved to "
+            f"{self._directory}"
+        )
+
+
+_profiled_call_code = _profiled_call.__code__
+
+forge_profiler = ForgeProfiler()
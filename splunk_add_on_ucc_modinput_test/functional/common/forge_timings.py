@@ -0,0 +1,166 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Set, Tuple
+from pytest import Config
+from splunk_add_on_ucc_modinput_test.functional import logger
+from splunk_add_on_ucc_modinput_test.functional.constants import ForgeTiming
+
+if TYPE_CHECKING:
+    from splunk_add_on_ucc_modinput_test.functional.entities.task import (
+        FrameworkTask,
+        TaskSetListType,
+    )
+
+
+class ForgeTimings:
+    """
+    Forge execution durations recorded in previous test sessions. Timings
+    are stored in pytest cache, so they are not available when pytest
+    cacheprovider plugin is disabled - default duration is used instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timings: Dict[str, float] = {}
+
+    def load(self, pytest_config: Optional[Config]) -> None:
+        cache = getattr(pytest_config, "cache", None)
+        if cache is None:
+            return
+        timings = cache.get(ForgeTiming.CACHE_KEY.value, {})
+        with self._lock:
+            self._timings.update(
+                {
+                    key: float(value)
+                    for key, value in timings.items()
+                    if isinstance(value, (int, float))
+                }
+            )
+        logger.debug(f"Forge timings loaded: {self._timings}")
+
+    def save(self, pytest_config: Optional[Config]) -> None:
+        cache = getattr(pytest_config, "cache", None)
+        if cache is None:
+            return
+        with self._lock:
+            cache.set(ForgeTiming.CACHE_KEY.value, self._timings)
+        logger.debug(f"Forge timings saved: {self._timings}")
+
+    def estimate(self, task: FrameworkTask) -> float:
+        with self._lock:
+            duration = self._timings.get(task.forge_full_path)
+            if duration is not None:
+                return duration
+            if self._timings:
+                return sum(self._timings.values()) / len(self._timings)
+        return float(ForgeTiming.DEFAULT_DURATION.value)
+
+    def record(self, task: FrameworkTask) -> None:
+        if task.duration is None or task.setup_failed:
+            return
+        key = task.forge_full_path
+        factor = ForgeTiming.SMOOTHING_FACTOR.value
+        with self._lock:
+            prev = self._timings.get(key)
+            if prev is None:
+                self._timings[key] = task.duration
+            else:
+                self._timings[key] = (
+                    factor * task.duration + (1 - factor) * prev
+                )
+
+    @staticmethod
+    def _task_identity(task: FrameworkTask) -> Hashable:
+        fingerprint = task.initial_args_fingerprint
+        if fingerprint is None:
+            return id(task)
+        return task.forge_key, fingerprint
+
+    def predict_readiness(
+        self, chains: List[TaskSetListType], worker_count: int
+    ) -> List[float]:
+        """
+        Simulates execution of chains by worker_count workers with forge
+        durations estimated from previous sessions and returns time in
+        seconds each chain is expected to be done. Like executors, the
+        simulation executes tasks of the same forge with the same explicit
+        arguments once and starts tasks of the longest chains first.
+        """
+        readiness = [0.0] * len(chains)
+        tails: List[List[float]] = []
+        for chain in chains:
+            # estimated duration of the chain part following each step
+            chain_tails = [0.0] * len(chain)
+            for step_index in range(len(chain) - 2, -1, -1):
+                next_step = chain[step_index + 1] or []
+                chain_tails[step_index] = chain_tails[step_index + 1] + max(
+                    (self.estimate(task) for task in next_step), default=0.0
+                )
+            tails.append(chain_tails)
+
+        now = 0.0
+        counter = itertools.count()
+        cursors = [0] * len(chains)
+        pending: List[Set[Hashable]] = [set() for _ in chains]
+        waiting: Dict[Hashable, List[int]] = {}
+        finished: Set[Hashable] = set()
+        ready: List[Tuple[float, int, Hashable, float]] = []
+        running: List[Tuple[float, int, Hashable]] = []
+
+        def advance(chain_index: int) -> None:
+            chain = chains[chain_index]
+            while cursors[chain_index] < len(chain):
+                step_index = cursors[chain_index]
+                cursors[chain_index] += 1
+                for task in chain[step_index] or []:
+                    identity = self._task_identity(task)
+                    if identity in finished:
+                        continue
+                    pending[chain_index].add(identity)
+                    if identity not in waiting:
+                        duration = self.estimate(task)
+                        priority = duration + tails[chain_index][step_index]
+                        heapq.heappush(
+                            ready,
+                            (-priority, next(counter), identity, duration),
+                        )
+                    waiting.setdefault(identity, []).append(chain_index)
+                if pending[chain_index]:
+                    return
+            readiness[chain_index] = now
+
+        for chain_index in range(len(chains)):
+            advance(chain_index)
+
+        while ready or running:
+            while ready and len(running) < worker_count:
+                _, _, identity, duration = heapq.heappop(ready)
+                heapq.heappush(
+                    running, (now + duration, next(counter), identity)
+                )
+            now, _, identity = heapq.heappop(running)
+            finished.add(identity)
+            for chain_index in waiting.pop(identity):
+                pending[chain_index].discard(identity)
+                if not pending[chain_index]:
+                    advance(chain_index)
+
+        return readiness
@@ -0,0 +1,181 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import math
+import threading
+from typing import Dict, List, Tuple
+from splunk_add_on_ucc_modinput_test.functional.constants import (
+    LatencySummary,
+)
+
+FORGE = "forge"
+PROBE = "probe"
+TEARDOWN = "teardown"
+
+
+class LatencyHistogram:
+    """
+    Streaming histogram of durations. Durations are counted in buckets
+    growing exponentially, BUCKETS_PER_DOUBLING buckets per every
+    doubling of duration, so percentiles are estimated with bounded
+    relative error and constant memory regardless of number of samples.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.reuse_count = 0
+
+    @staticmethod
+    def _bucket(duration: float) -> int:
+        min_duration = LatencySummary.MIN_DURATION.value
+        if duration <= min_duration:
+            return 0
+        ratio = math.log2(duration / min_duration)
+        return math.ceil(ratio * LatencySummary.BUCKETS_PER_DOUBLING.value)
+
+    @staticmethod
+    def _bucket_upper_bound(bucket: int) -> float:
+        per_doubling = LatencySummary.BUCKETS_PER_DOUBLING.value
+        return float(
+            LatencySummary.MIN_DURATION.value * 2 ** (bucket / per_doubling)
+        )
+
+    def add(self, duration: float) -> None:
+        bucket = self._bucket(duration)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def percentile(self, percent: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(self._bucket_upper_bound(bucket), self.max)
+        return self.max
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(95)
+
+
+class LatencyStats:
+    """
+    Aggregates durations of forge executions, probes and teardowns of the
+    test session per forge or probe into latency histograms, together with
+    time executor workers spent executing tasks and waiting for them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._worker_busy = 0.0
+        self._worker_idle = 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+            self._worker_busy = 0.0
+            self._worker_idle = 0.0
+
+    def _histogram(self, kind: str, name: str) -> LatencyHistogram:
+        return self._histograms.setdefault(kind, {}).setdefault(
+            name, LatencyHistogram()
+        )
+
+    def _record(self, kind: str, name: str, duration: float) -> None:
+        with self._lock:
+            self._histogram(kind, name).add(duration)
+
+    def record_forge(self, name: str, duration: float) -> None:
+        self._record(FORGE, name, duration)
+
+    def record_probe(self, name: str, duration: float) -> None:
+        self._record(PROBE, name, duration)
+
+    def record_teardown(self, name: str, duration: float) -> None:
+        self._record(TEARDOWN, name, duration)
+
+    def record_reuse(self, name: str) -> None:
+        with self._lock:
+            self._histogram(FORGE, name).reuse_count += 1
+
+    def add_worker_time(self, busy: float, idle: float = 0.0) -> None:
+        with self._lock:
+            self._worker_busy += busy
+            self._worker_idle += idle
+
+    @property
+    def worker_time(self) -> Tuple[float, float]:
+        return self._worker_busy, self._worker_idle
+
+    def histograms(self, kind: str) -> Dict[str, LatencyHistogram]:
+        with self._lock:
+            return dict(self._histograms.get(kind, {}))
+
+    def slowest(
+        self, kind: str, limit: int
+    ) -> List[Tuple[str, LatencyHistogram]]:
+        items = sorted(
+            self.histograms(kind).items(),
+            key=lambda item: (item[1].p95, item[1].max),
+            reverse=True,
+        )
+        return items[:limit]
+
+    def summary_lines(self, limit: int) -> List[str]:
+        lines: List[str] = []
+        for kind, title in (
+            (FORGE, "Slowest forges"),
+            (PROBE, "Slowest probes"),
+            (TEARDOWN, "Slowest teardowns"),
+        ):
+            slowest = self.slowest(kind, limit)
+            if not slowest:
+                continue
+            lines.append(f"{title}:")
+            lines.append(
+                f"{'count':>7} {'p50 s':>9} {'p95 s':>9} {'max s':>9} "
+                f"{'reused':>7}  name"
+            )
+            for name, histogram in slowest:
+                lines.append(
+                    f"{histogram.count:>7} {histogram.p50:>9.3f} "
+                    f"{histogram.p95:>9.3f} {histogram.max:>9.3f} "
+                    f"{histogram.reuse_count:>7}  {name}"
+                )
+        busy, idle = self.worker_time
+        if lines and busy + idle:
+            lines.append(
+                f"Worker busy time: {busy:.3f} seconds, idle time: "
+                f"{idle:.3f} seconds ({busy / (busy + idle):.0%} busy)"
+            )
+        return lines
+
+
+latency_stats = LatencyStats()
@@ -0,0 +1,267 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import inspect
+import multiprocessing
+import threading
+import traceback
+from multiprocessing.connection import Connection
+from queue import Queue
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from splunk_add_on_ucc_modinput_test.functional import logger
+from splunk_add_on_ucc_modinput_test.functional.exceptions import (
+    SplTaFwkProcessPoolError,
+)
+
+
+def _run_teardown(teardown: Any) -> None:
+    if inspect.isgenerator(teardown):
+        try:
+            next(teardown)
+        except StopIteration:
+            pass
+    elif callable(teardown):
+        teardown()
+
+
+def _worker_main(conn: Connection) -> None:
+    teardowns: Dict[int, Any] = {}
+    next_handle = 0
+    while True:
+        try:
+            # unpickling a command can fail, e.g. when the forge module can
+            # not be imported by the worker, which must not stop the worker
+            command = conn.recv()
+            if command is None:
+                break
+            if command[0] == "setup":
+                _, fn, kwargs = command
+                handle = None
+                if inspect.isgeneratorfunction(fn):
+                    it = fn(**kwargs)
+                    try:
+                        result = next(it)
+                        next_handle += 1
+                        handle = next_handle
+                        teardowns[handle] = it
+                    except StopIteration as sie:
+                        result = sie.value
+                else:
+                    result = fn(**kwargs)
+                    teardown = getattr(fn, "teardown", None)
+                    if not inspect.isfunction(fn) and callable(teardown):
+                        next_handle += 1
+                        handle = next_handle
+                        teardowns[handle] = teardown
+                conn.send(("ok", result, handle))
+            elif command[0] == "teardown":
+                _run_teardown(teardowns.pop(command[1]))
+                conn.send(("ok", None, None))
+        except EOFError:
+            break
+        except BaseException:
+            conn.send(("error", traceback.format_exc(), None))
+
+
+class ProcessTeardown:
+    """
+    Teardown of a forge executed in the process pool. Calling it runs the
+    teardown in the same worker process where the forge setup was executed.
+    """
+
+    def __init__(
+        self,
+        pool: ForgeProcessPool,
+        worker_index: int,
+        generation: int,
+        handle: int,
+    ) -> None:
+        self._pool = pool
+        self._worker_index = worker_index
+        self._generation = generation
+        self._handle = handle
+
+    def __call__(self) -> None:
+        self._pool.teardown(self._worker_index, self._generation, self._handle)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProcessTeardown worker={self._worker_index} "
+            f"handle={self._handle}>"
+        )
+
+
+class ForgeProcessPool:
+    """
+    Pool of worker processes executing CPU bound forges. Forge function,
+    its arguments and returned artifacts must be picklable. Worker
+    processes are forked where possible, so forge functions defined in
+    test modules are available to workers without re-importing them.
+
+    Worker process that dies is replaced by a new one, failing only the
+    job it was executing. Teardowns of forges executed by the dead worker
+    can not be executed anymore and fail as well.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._size = 0
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        self._connections: List[Connection] = []
+        self._worker_locks: List[threading.Lock] = []
+        # incremented every time worker process is replaced
+        self._generations: List[int] = []
+        self._idle_workers: Queue[int] = Queue()
+
+    @property
+    def is_deployed(self) -> bool:
+        return bool(self._processes)
+
+    @staticmethod
+    def _get_context() -> Any:
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+        return multiprocessing.get_context()
+
+    def deploy(self, size: int) -> None:
+        with self._lock:
+            if self._processes:
+                return
+            for index in range(size):
+                process, conn = self._start_process(index)
+                self._processes.append(process)
+                self._connections.append(conn)
+                self._worker_locks.append(threading.Lock())
+                self._generations.append(0)
+                self._idle_workers.put(index)
+            self._size = size
+        logger.info(f"Forge process pool deployed with {size} processes")
+
+    def _start_process(
+        self, index: int
+    ) -> Tuple[multiprocessing.process.BaseProcess, Connection]:
+        ctx = self._get_context()
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            name=f"ucc-modinput-test-forge-process-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _replace_process(self, worker_index: int) -> None:
+        # must be called with the worker lock acquired
+        old_process = self._processes[worker_index]
+        self._connections[worker_index].close()
+        if old_process.is_alive():
+            old_process.terminate()
+        old_process.join()
+        process, conn = self._start_process(worker_index)
+        self._processes[worker_index] = process
+        self._connections[worker_index] = conn
+        self._generations[worker_index] += 1
+        logger.warning(
+            f"Forge process {worker_index} exited with code "
+            f"{old_process.exitcode} and has been replaced"
+        )
+
+    def _call(
+        self,
+        worker_index: int,
+        command: Tuple[Any, ...],
+        generation: Optional[int] = None,
+    ) -> Tuple[Any, Optional[int], int]:
+        """
+        Sends command to the worker process and returns the value and the
+        teardown handle it responded with together with the generation of
+        the worker process. Command addressed to given generation fails if
+        the worker process has been replaced meanwhile.
+        """
+        with self._worker_locks[worker_index]:
+            if not self._processes[worker_index].is_alive():
+                self._replace_process(worker_index)
+            current_generation = self._generations[worker_index]
+            if generation is not None and generation != current_generation:
+                raise SplTaFwkProcessPoolError(
+                    f"Forge process {worker_index} that executed the forge "
+                    "has exited, its teardown can not be executed"
+                )
+            conn = self._connections[worker_index]
+            try:
+                conn.send(command)
+                status, value, handle = conn.recv()
+            except (EOFError, OSError) as e:
+                self._replace_process(worker_index)
+                raise SplTaFwkProcessPoolError(
+                    f"Forge process {worker_index} has exited unexpectedly: "
+                    f"{e!r}"
+                ) from e
+        if status == "error":
+            raise SplTaFwkProcessPoolError(
+                f"Forge process {worker_index} failed with error:\n{value}"
+            )
+        return value, handle, current_generation
+
+    def execute(
+        self, fn: Callable[..., Any], kwargs: Dict[str, Any]
+    ) -> Tuple[Any, Optional[ProcessTeardown]]:
+        assert self.is_deployed, "Forge process pool is not deployed"
+        worker_index = self._idle_workers.get()
+        try:
+            logger.debug(f"Forge {fn} is sent to process {worker_index}")
+            result, handle, generation = self._call(
+                worker_index, ("setup", fn, kwargs)
+            )
+        finally:
+            self._idle_workers.put(worker_index)
+
+        teardown = None
+        if handle is not None:
+            teardown = ProcessTeardown(self, worker_index, generation, handle)
+        return result, teardown
+
+    def teardown(
+        self, worker_index: int, generation: int, handle: int
+    ) -> None:
+        logger.debug(
+            f"Forge teardown {handle} is sent to process {worker_index}"
+        )
+        self._call(worker_index, ("teardown", handle), generation)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for conn, lock in zip(self._connections, self._worker_locks):
+                with lock:
+                    try:
+                        conn.send(None)
+                    except OSError:
+                        # worker process has already exited
+                        pass
+            for process in self._processes:
+                process.join()
+            for conn in self._connections:
+                conn.close()
+            self._processes, self._connections = [], []
+            self._worker_locks, self._generations = [], []
+            self._idle_workers = Queue()
+        logger.debug("Forge process pool has shutdown")
+
+
+forge_process_pool = ForgeProcessPool()
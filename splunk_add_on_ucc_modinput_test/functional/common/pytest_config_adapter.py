@@ -17,8 +17,12 @@ from typing import Optional
 from pytest import Config
 from splunk_add_on_ucc_modinput_test.functional.constants import (
     Executor,
+    ForgeCache,
     ForgeProbe,
+    ForgeProfiling,
+    LatencySummary,
     TasksWait,
+    WorkerPool,
 )
 
 
@@ -47,12 +51,42 @@ class PytestConfigAdapter:
             return self._pytest_config.getvalue("sequential_execution")
         return False
 
+    @property
+    def asyncio_execution(self) -> bool:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("asyncio_execution")
+        return False
+
+    @property
+    def asyncio_max_concurrency(self) -> int:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("asyncio_max_concurrency")
+        return Executor.DEFAULT_ASYNCIO_CONCURRENCY.value
+
     @property
     def number_of_threads(self) -> int:
         if self._pytest_config is not None:
             return self._pytest_config.getvalue("number_of_threads")
         return Executor.DEFAULT_THREAD_NUMBER.value
 
+    @property
+    def max_number_of_threads(self) -> int:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("max_number_of_threads")
+        return WorkerPool.DEFAULT_MAX_SIZE.value
+
+    @property
+    def number_of_processes(self) -> int:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("number_of_processes")
+        return Executor.DEFAULT_PROCESS_NUMBER.value
+
+    @property
+    def number_of_teardown_threads(self) -> int:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("number_of_teardown_threads")
+        return Executor.DEFAULT_TEARDOWN_THREAD_NUMBER.value
+
     @property
     def probe_invoke_interval(self) -> int:
         if self._pytest_config is not None:
@@ -89,6 +123,72 @@ class PytestConfigAdapter:
             return self._pytest_config.getvalue("do_not_delete_at_teardown")
         return False
 
+    @property
+    def history_test_order(self) -> bool:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("history_test_order")
+        return False
+
+    @property
+    def parallel_session_teardown(self) -> bool:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("parallel_session_teardown")
+        return False
+
+    @property
+    def stream_bootstrap(self) -> bool:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("stream_bootstrap")
+        return False
+
+    @property
+    def forge_cache_ttl(self) -> int:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("forge_cache_ttl")
+        return ForgeCache.DEFAULT_TTL.value
+
+    @property
+    def purge_forge_cache(self) -> bool:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("purge_forge_cache")
+        return False
+
+    @property
+    def latency_summary_size(self) -> int:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("latency_summary_size")
+        return LatencySummary.DEFAULT_SIZE.value
+
+    @property
+    def trace_file(self) -> Optional[str]:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("trace_file")
+        return None
+
+    @property
+    def otlp_file(self) -> Optional[str]:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("otlp_file")
+        return None
+
+    @property
+    def profile_forges(self) -> bool:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("profile_forges")
+        return False
+
+    @property
+    def profile_forges_filter(self) -> str:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("profile_forges_filter")
+        return ForgeProfiling.DEFAULT_FILTER.value
+
+    @property
+    def profile_forges_dir(self) -> str:
+        if self._pytest_config is not None:
+            return self._pytest_config.getvalue("profile_forges_dir")
+        return ForgeProfiling.DEFAULT_DIRECTORY.value
+
     @property
     def collectonly(self) -> bool:
         if self._pytest_config is not None:
@@ -0,0 +1,148 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Dict, Optional, Sequence
+from splunk_add_on_ucc_modinput_test.functional import logger
+
+
+class TokenBucket:
+    """
+    Allows rate operations per second on average and up to burst
+    operations at once after being idle.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def delay(self, now: float) -> float:
+        """
+        Returns time in seconds until a token is available.
+        """
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+
+class ResourceLimit:
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: Optional[int],
+        rate_limit: Optional[float],
+        burst: int,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.bucket = (
+            TokenBucket(rate_limit, burst) if rate_limit is not None else None
+        )
+        self.in_use = 0
+
+    @property
+    def definition(
+        self,
+    ) -> tuple[Optional[int], Optional[float], Optional[int]]:
+        rate = self.bucket.rate if self.bucket else None
+        burst = self.bucket.burst if self.bucket else None
+        return (self.max_concurrency, rate, burst)
+
+    def delay(self, now: float) -> float:
+        if (
+            self.max_concurrency is not None
+            and self.in_use >= self.max_concurrency
+        ):
+            return math.inf
+        if self.bucket is not None:
+            return self.bucket.delay(now)
+        return 0.0
+
+
+class ResourceLimiter:
+    """
+    Limits concurrency and rate of forge executions sharing resources like
+    splunkd restarts or rate limited vendor APIs. Executors acquire all
+    resources of a task at once before executing it and release them when
+    the task, including its probe, is finished.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limits: Dict[str, ResourceLimit] = {}
+
+    def register(
+        self,
+        name: str,
+        max_concurrency: Optional[int] = 1,
+        rate_limit: Optional[float] = None,
+        burst: int = 1,
+    ) -> None:
+        limit = ResourceLimit(name, max_concurrency, rate_limit, burst)
+        with self._lock:
+            registered = self._limits.setdefault(name, limit)
+        assert registered.definition == limit.definition, (
+            f"Resource {name} is already defined with different limits: "
+            f"{registered.definition}"
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._limits
+
+    def try_acquire(self, resources: Sequence[str]) -> float:
+        """
+        Acquires all resources if they are available and returns 0.
+        Otherwise nothing is acquired and the returned value is time in
+        seconds until resources may become available, or math.inf when
+        they are available only after release of some of them.
+        """
+        if not resources:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            limits = [self._limits[name] for name in resources]
+            delay = max(limit.delay(now) for limit in limits)
+            if delay > 0:
+                return delay
+            for limit in limits:
+                limit.in_use += 1
+                if limit.bucket is not None:
+                    limit.bucket.take()
+        logger.debug(f"Resources acquired: {', '.join(resources)}")
+        return 0.0
+
+    def release(self, resources: Sequence[str]) -> None:
+        if not resources:
+            return
+        with self._lock:
+            for name in resources:
+                self._limits[name].in_use -= 1
+        logger.debug(f"Resources released: {', '.join(resources)}")
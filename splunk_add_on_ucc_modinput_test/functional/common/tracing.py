@@ -0,0 +1,174 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+from splunk_add_on_ucc_modinput_test.functional import logger
+
+
+class SessionTracer:
+    """
+    Records spans of forge executions, probes, teardowns and waits of the
+    test session and saves them in Chrome trace event format, so they can
+    be inspected in chrome://tracing or Perfetto timeline viewers. Spans
+    are recorded only after the tracer is started.
+
+    Spans of coroutines sharing the framework event loop thread can
+    overlap, so they are recorded as async events shown on separate
+    tracks instead of the thread track.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self._async_ids = itertools.count()
+        self._is_started = False
+
+    @property
+    def is_started(self) -> bool:
+        return self._is_started
+
+    def start(self) -> None:
+        with self._lock:
+            self._events = []
+            self._threads = {}
+            self._is_started = True
+        logger.debug("Session tracer has started")
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def _add_events(self, *events: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        for event in events:
+            event.update(pid=os.getpid(), tid=tid)
+        with self._lock:
+            self._events += events
+            self._threads.setdefault(tid, thread.name)
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: Optional[Dict[str, Any]] = None,
+        is_async: bool = False,
+    ) -> None:
+        """
+        Records span of the current thread, start and end are values
+        returned by now().
+        """
+        if not self._is_started:
+            return
+        if not is_async:
+            self._add_events(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": max(end - start, 0.0) * 1e6,
+                    "args": args or {},
+                }
+            )
+            return
+        async_id = next(self._async_ids)
+        self._add_events(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "b",
+                "id": async_id,
+                "ts": start * 1e6,
+                "args": args or {},
+            },
+            {
+                "name": name,
+                "cat": category,
+                "ph": "e",
+                "id": async_id,
+                "ts": max(start, end) * 1e6,
+            },
+        )
+
+    def add_instant(
+        self,
+        name: str,
+        category: str,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if not self._is_started:
+            return
+        self._add_events(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "i",
+                "s": "t",
+                "ts": self.now() * 1e6,
+                "args": args or {},
+            }
+        )
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        args: Optional[Dict[str, Any]] = None,
+        is_async: bool = False,
+    ) -> Iterator[None]:
+        if not self._is_started:
+            yield
+            return
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.add_span(name, category, start, self.now(), args, is_async)
+
+    def save(self, path: Optional[str]) -> None:
+        if not self._is_started or not path:
+            return
+        with self._lock:
+            self._is_started = False
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._threads.items()
+            ]
+            events = metadata + self._events
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        logger.info(f"Session trace with {len(events)} events saved to {path}")
+
+
+session_tracer = SessionTracer()
@@ -54,3 +54,48 @@ class Executor(Enum):
     DEFAULT_THREAD_NUMBER = 10
     MIN_THREAD_NUMBER = 10
     MAX_THREAD_NUMBER = 20
+    DEFAULT_ASYNCIO_CONCURRENCY = 1000
+    MIN_ASYNCIO_CONCURRENCY = 1
+    MAX_ASYNCIO_CONCURRENCY = 10000
+    DEFAULT_PROCESS_NUMBER = 4
+    MIN_PROCESS_NUMBER = 1
+    MAX_PROCESS_NUMBER = 64
+    DEFAULT_TEARDOWN_THREAD_NUMBER = 0
+    MIN_TEARDOWN_THREAD_NUMBER = 0
+    MAX_TEARDOWN_THREAD_NUMBER = 50
+
+
+class WorkerPool(Enum):
+    DEFAULT_MAX_SIZE = 50
+    MIN_MAX_SIZE = 10
+    MAX_MAX_SIZE = 500
+    IDLE_TIMEOUT = 30
+    CHECK_INTERVAL = 1
+
+
+class ForgeTiming(Enum):
+    CACHE_KEY = "ucc_modinput_test/forge_timings"
+    DEFAULT_DURATION = 1.0
+    SMOOTHING_FACTOR = 0.5
+
+
+class ForgeCache(Enum):
+    DIR_NAME = "ucc_modinput_test_forge_results"
+    DEFAULT_TTL = 86400
+    MIN_TTL = 60
+    MAX_TTL = 604800
+
+
+class LatencySummary(Enum):
+    DEFAULT_SIZE = 10
+    MIN_SIZE = 0
+    MAX_SIZE = 100
+    BUCKETS_PER_DOUBLING = 8
+    MIN_DURATION = 0.001
+
+
+class ForgeProfiling(Enum):
+    DEFAULT_DIRECTORY = "forge_profiles"
+    DEFAULT_FILTER = "*"
+    SAMPLING_INTERVAL = 0.005
+    SESSION_FILE = "session.collapsed"
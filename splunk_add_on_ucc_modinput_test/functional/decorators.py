@@ -21,6 +21,7 @@ from splunk_add_on_ucc_modinput_test.functional.manager import (
     dependency_manager,
     forge,
     forges,
+    resource,
 )
 from splunk_add_on_ucc_modinput_test.functional.splunk import (
     SplunkClientBase,
@@ -18,7 +18,17 @@ from splunk_add_on_ucc_modinput_test.typing import (
 )
 
 
-from typing import Any, Callable, Generator, List, Dict, Optional, Tuple
+import threading
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    List,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+)
 from splunk_add_on_ucc_modinput_test.functional.entities.forge import (
     FrameworkForge,
 )
@@ -33,6 +43,15 @@ from splunk_add_on_ucc_modinput_test.functional import logger
 
 
 class TestCollection(Dict[ExecutableKeyType, FrameworkTest]):
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_original_key: Dict[
+            ExecutableKeyType, Set[ExecutableKeyType]
+        ] = {}
+        self._keys_by_function: Dict[
+            Tuple[Callable[..., Any], Optional[str]], ExecutableKeyType
+        ] = {}
+
     @property
     def is_empty(self) -> bool:
         return not bool(self)
@@ -41,27 +60,54 @@ class TestCollection(Dict[ExecutableKeyType, FrameworkTest]):
         assert isinstance(item, FrameworkTest)
         if item.key not in self:
             self[item.key] = item
+            self._by_original_key.setdefault(item.original_key, set()).add(
+                item.key
+            )
+
+    def pop(self, key: ExecutableKeyType, *args: Any) -> Any:
+        test = super().pop(key, *args)
+        if isinstance(test, FrameworkTest):
+            keys = self._by_original_key.get(test.original_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_original_key[test.original_key]
+        return test
+
+    def make_key(
+        self, fn: Callable[..., Any], altered_name: Optional[str] = None
+    ) -> ExecutableKeyType:
+        """
+        Returns key of the test created for the function and optional
+        parametrized name. Keys are memoized, as hooks look tests up several
+        times per pytest item.
+        """
+        lookup = (fn, altered_name)
+        try:
+            return self._keys_by_function[lookup]
+        except KeyError:
+            key = FrameworkTest(fn, altered_name).key
+            self._keys_by_function[lookup] = key
+            return key
+        except TypeError:
+            # unhashable callable object
+            return FrameworkTest(fn, altered_name).key
 
     def lookup_by_function(
-        self, fn: Callable[..., Any]
+        self, fn: Callable[..., Any], altered_name: Optional[str] = None
     ) -> Optional[FrameworkTest]:
-        test = FrameworkTest(fn)
-        return self.get(test.key)
+        return self.get(self.make_key(fn, altered_name))
 
     def lookup_by_original_function(
         self, fn: Callable[..., Any]
     ) -> List[ExecutableKeyType]:
-        found_tests_keys = set()
-        lookup_test = FrameworkTest(fn)
-        for key, test in self.items():
-            if lookup_test.key == test.original_key:
-                logger.debug(
-                    f"lookup_by_original_function found key: \
-                        {lookup_test.key} -> {test.key}|{test.original_key}"
-                )
-                found_tests_keys.add(key)
-
-        return list(found_tests_keys)
+        lookup_key = self.make_key(fn)
+        found_tests_keys = list(self._by_original_key.get(lookup_key, ()))
+        logger.debug(
+            f"lookup_by_original_function found keys: \
+                {lookup_key} -> {found_tests_keys}"
+        )
+        return found_tests_keys
 
 
 class ForgeCollection(Dict[ExecutableKeyType, FrameworkForge]):
@@ -75,8 +121,22 @@ class ForgeCollection(Dict[ExecutableKeyType, FrameworkForge]):
 
 
 class TaskCollection:
+    """
+    Tasks of each test grouped in steps. Bootstrap and attached steps are
+    partitioned when added, and number of pending bootstrap tasks as well
+    as failed ones are tracked per test as tasks are done, so readiness of
+    a test is checked without enumerating its tasks.
+    """
+
     def __init__(self) -> None:
         self._tasks: Dict[ExecutableKeyType, TaskSetListType] = {}
+        self._bootstrap_tasks: Dict[ExecutableKeyType, TaskSetListType] = {}
+        self._inplace_tasks: Dict[ExecutableKeyType, TaskSetListType] = {}
+        self._lock = threading.Lock()
+        self._pending_bootstrap_count: Dict[ExecutableKeyType, int] = {}
+        self._failed_bootstrap_tasks: Dict[
+            ExecutableKeyType, List[FrameworkTask]
+        ] = {}
 
     @property
     def is_empty(self) -> bool:
@@ -85,56 +145,71 @@ class TaskCollection:
     def remove_test_tasks(
         self, test_key: ExecutableKeyType
     ) -> Optional[TaskSetListType]:
+        self._bootstrap_tasks.pop(test_key, None)
+        self._inplace_tasks.pop(test_key, None)
+        with self._lock:
+            self._pending_bootstrap_count.pop(test_key, None)
+            self._failed_bootstrap_tasks.pop(test_key, None)
         return self._tasks.pop(test_key, None)
 
     def add(self, tasks: List[FrameworkTask]) -> None:
         if not tasks:
             return
         test_key = tasks[0].test_key
-        if test_key not in self._tasks:
-            self._tasks[test_key] = []
-        self._tasks[test_key].append(tasks)
+        self._tasks.setdefault(test_key, []).append(tasks)
+        if tasks[0].is_bootstrap:
+            self._bootstrap_tasks.setdefault(test_key, []).append(tasks)
+            with self._lock:
+                pending = self._pending_bootstrap_count.get(test_key, 0)
+                self._pending_bootstrap_count[test_key] = pending + len(tasks)
+        else:
+            self._inplace_tasks.setdefault(test_key, []).append(tasks)
+
+    def task_done(self, task: FrameworkTask) -> None:
+        if not task.is_bootstrap or task.is_speculative or task.is_done:
+            return
+        with self._lock:
+            test_key = task.test_key
+            if test_key not in self._pending_bootstrap_count:
+                return
+            self._pending_bootstrap_count[test_key] -= 1
+            if task.setup_failed:
+                self._failed_bootstrap_tasks.setdefault(test_key, []).append(
+                    task
+                )
+
+    def bootstrap_state(
+        self, test_key: ExecutableKeyType
+    ) -> Tuple[int, List[FrameworkTask]]:
+        """
+        Returns number of pending bootstrap tasks of the test and list of
+        its failed bootstrap tasks.
+        """
+        with self._lock:
+            return (
+                self._pending_bootstrap_count.get(test_key, 0),
+                list(self._failed_bootstrap_tasks.get(test_key, [])),
+            )
 
     def get_tasks_by_type(
         self, test_key: ExecutableKeyType
     ) -> Tuple[TaskSetListType, TaskSetListType]:
-        all_tasks = self.get_tasks(test_key)
-        inplace_tasks: TaskSetListType = []
-        bootstrap_tasks: TaskSetListType = []
-        for step_tasks in all_tasks:
-            if step_tasks is not None:
-                if step_tasks[0].is_bootstrap:
-                    bootstrap_tasks.append(step_tasks)
-                else:
-                    inplace_tasks.append(step_tasks)
-        return inplace_tasks, bootstrap_tasks
+        return self.get_inplace_tasks(test_key), self.get_bootstrap_tasks(
+            test_key
+        )
 
     def get_bootstrap_tasks(
         self, test_key: ExecutableKeyType
     ) -> TaskSetListType:
-        all_tasks = self.get_tasks(test_key)
-        bootstrap_tasks: TaskSetListType = []
-        for t in all_tasks:
-            if t is not None and t[0].is_bootstrap:
-                bootstrap_tasks.append(t)
-        logger.debug(f"get_bootstrap_tasks for {test_key}: {bootstrap_tasks}")
-        return bootstrap_tasks
+        return self._bootstrap_tasks.get(test_key, [])
 
     def get_inplace_tasks(
         self, test_key: ExecutableKeyType
     ) -> TaskSetListType:
-        all_tasks = self.get_tasks(test_key)
-        inplace_tasks: TaskSetListType = []
-        for t in all_tasks:
-            if t is not None and not t[0].is_bootstrap:
-                inplace_tasks.append(t)
-        logger.debug(f"get_inplace_tasks for {test_key}: {inplace_tasks}")
-        return inplace_tasks
+        return self._inplace_tasks.get(test_key, [])
 
     def get_tasks(self, test_key: ExecutableKeyType) -> TaskSetListType:
-        tasks = self._tasks.get(test_key, [])
-        logger.debug(f"get_tasks for {test_key}: {tasks}")
-        return tasks
+        return self._tasks.get(test_key, [])
 
     def enumerate_tasks(
         self, test_key: Tuple[str, ...]
@@ -145,6 +220,11 @@ class TaskCollection:
                 for j, task in enumerate(parralel_tasks):
                     yield i, j, task
 
+    def enumerate_all_tasks(self) -> Generator[FrameworkTask, None, None]:
+        for test_key in self._tasks:
+            for _, _, task in self.enumerate_tasks(test_key):
+                yield task
+
     def enumerate_bootstrap_tasks(
         self, test_key: ExecutableKeyType
     ) -> Generator[Tuple[int, int, FrameworkTask], None, None]:
@@ -168,7 +248,7 @@ class TaskCollection:
     ) -> Tuple[List[FrameworkTask], List[FrameworkTask]]:
         done, pending = [], []
         for _, _, task in self.enumerate_bootstrap_tasks(test_key):
-            if task.is_executed:
+            if task.is_done:
                 done.append(task)
             else:
                 pending.append(task)
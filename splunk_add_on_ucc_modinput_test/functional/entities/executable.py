@@ -23,8 +23,31 @@ if TYPE_CHECKING:
         ForgeFnType,
         TestFnType,
     )
+import contextlib
 import inspect
-from typing import Any
+import threading
+import weakref
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+
+class _Introspection(NamedTuple):
+    bound_class: Optional[str]
+    name: str
+    source_file: str
+    is_generatorfunction: bool
+    is_asyncgenfunction: bool
+    is_coroutinefunction: bool
+    required_args: Tuple[str, ...]
+
+
+# introspection results are reused by all executables created for the same
+# function object, entries are dropped together with the function; bound
+# methods are new objects on each attribute access, so they are cached
+# under the underlying function per class of the instance they are bound to
+_introspection_cache: weakref.WeakKeyDictionary[
+    Any, Dict[Optional[str], _Introspection]
+] = weakref.WeakKeyDictionary()
+_introspection_cache_lock = threading.Lock()
 
 
 class ExecutableBase:
@@ -72,33 +95,76 @@ class ExecutableBase:
         else:
             return self._original_name
 
+    @staticmethod
+    def _introspection_cache_key(
+        function: Callable[..., Any]
+    ) -> tuple[Any, str | None]:
+        if inspect.ismethod(function):
+            return function.__func__, function.__self__.__class__.__name__
+        return function, None
+
     def _inspect(self) -> None:
-        self._fn_bound_class: str | None = None
-        if inspect.ismethod(self._function):
-            self._fn_bound_class = self._function.__self__.__class__.__name__
-            self._fn_name = self._function.__name__
-            self._fn_source_file = inspect.getfile(self._function)
-        elif inspect.isfunction(self._function):
-            self._fn_bound_class = None
-            res = repr(self._function).split(" ")[1].split(".")
+        key, bound_class = self._introspection_cache_key(self._function)
+        with _introspection_cache_lock:
+            try:
+                introspection = _introspection_cache.get(key, {}).get(
+                    bound_class
+                )
+            except TypeError:
+                # function object can not be weakly referenced or hashed
+                introspection = None
+        if introspection is None:
+            introspection = self._introspect(self._function)
+            with _introspection_cache_lock, contextlib.suppress(TypeError):
+                _introspection_cache.setdefault(key, {})[
+                    bound_class
+                ] = introspection
+
+        self._fn_bound_class = introspection.bound_class
+        self._fn_name = introspection.name
+        self._fn_source_file = introspection.source_file
+        self._original_name = self._fn_name
+        self._is_generatorfunction = introspection.is_generatorfunction
+        self._is_asyncgenfunction = introspection.is_asyncgenfunction
+        self._is_coroutinefunction = introspection.is_coroutinefunction
+        self._required_args = list(introspection.required_args)
+
+    @staticmethod
+    def _introspect(function: Callable[..., Any]) -> _Introspection:
+        bound_class: str | None = None
+        if inspect.ismethod(function):
+            bound_class = function.__self__.__class__.__name__
+            name = function.__name__
+            source_file = inspect.getfile(function)
+        elif inspect.isfunction(function):
+            res = repr(function).split(" ")[1].split(".")
             if len(res) > 1:
-                self._fn_bound_class = res[0]
-                self._fn_name = res[1]
+                bound_class = res[0]
+                name = res[1]
             else:
-                self._fn_name = res[0]
-            self._fn_source_file = inspect.getfile(self._function)
+                name = res[0]
+            source_file = inspect.getfile(function)
         else:
-            self._fn_name = "__call__"
-            self._fn_bound_class = self._function.__class__.__name__
-            self._fn_source_file = inspect.getfile(self._function.__class__)
+            name = "__call__"
+            bound_class = function.__class__.__name__
+            source_file = inspect.getfile(function.__class__)
 
-        self._original_name = self._fn_name
-        self._is_generatorfunction = inspect.isgeneratorfunction(
-            self._function
+        return _Introspection(
+            bound_class=bound_class,
+            name=name,
+            source_file=source_file,
+            is_generatorfunction=inspect.isgeneratorfunction(function),
+            is_asyncgenfunction=inspect.isasyncgenfunction(function),
+            is_coroutinefunction=inspect.iscoroutinefunction(function)
+            or inspect.iscoroutinefunction(
+                getattr(function, "__call__", None)
+            ),
+            required_args=tuple(inspect.signature(function).parameters),
         )
 
-        sig = inspect.signature(self._function)
-        self._required_args = list(sig.parameters.keys())
+    @property
+    def is_async(self) -> bool:
+        return self._is_asyncgenfunction or self._is_coroutinefunction
 
     @property
     def required_args_names(self) -> tuple[str, ...]:
@@ -15,11 +15,13 @@
 #
 from __future__ import annotations
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Generator
+from typing import TYPE_CHECKING, Any, Hashable
 
 if TYPE_CHECKING:
     from splunk_add_on_ucc_modinput_test.typing import (
         ForgeFnType,
+        ForgeAsyncGenType,
+        ForgeTeardownType,
         ExecutableKeyType,
         ArtifactsType,
     )
@@ -30,6 +32,13 @@ import contextlib
 import time
 from dataclasses import dataclass, replace
 from splunk_add_on_ucc_modinput_test.functional import logger
+from splunk_add_on_ucc_modinput_test.functional.common.forge_args import (
+    make_fingerprint,
+    same_args,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.event_loop import (
+    framework_loop,
+)
 from splunk_add_on_ucc_modinput_test.functional.entities.executable import (
     ExecutableBase,
 )
@@ -38,7 +47,7 @@ from splunk_add_on_ucc_modinput_test.functional.entities.executable import (
 @dataclass
 class ForgeExecData:
     id: str
-    teardown: Generator[Any, None, None] | None
+    teardown: ForgeTeardownType | None
     kwargs: dict[str, Any]
     result: ArtifactsType
     errors: list[str]
@@ -49,7 +58,7 @@ class ForgeExecData:
     def __init__(
         self,
         id: str,
-        teardown: Generator[Any, None, None] | None,
+        teardown: ForgeTeardownType | None,
         kwargs: dict[str, Any],
         result: ArtifactsType,
         errors: list[str],
@@ -89,13 +98,36 @@ class ForgePostExec:
     def __init__(self) -> None:
         self.lock = threading.Lock()
         self._exec_store: dict[str, ForgeExecData] = {}
+        self._exec_index: dict[Hashable, list[str]] = {}
+        self._unhashable_exec_ids: list[str] = []
         self._teardown_is_blocked = False
+        self._teardown_is_deferred = False
 
     def summary(self, data: ForgeExecData) -> str:
         s = data.summary()
         s += f"\n\tteardown_is_blocked={self._teardown_is_blocked}"
+        s += f"\n\tteardown_is_deferred={self._teardown_is_deferred}"
         return s
 
+    @property
+    def teardown_is_deferred(self) -> bool:
+        return self._teardown_is_deferred
+
+    def defer_teardown(self) -> None:
+        self._teardown_is_deferred = True
+
+    def resume_teardown(self) -> None:
+        # unlike unblock_teardown, ready teardowns are left to the caller
+        self._teardown_is_deferred = False
+
+    def is_teardown_pending(self, id: str) -> bool:
+        data = self._exec_store.get(id)
+        return (
+            data is not None
+            and data.count == 0
+            and not data.is_teardown_executed
+        )
+
     def block_teardown(self) -> None:
         self._teardown_is_blocked = True
 
@@ -112,6 +144,7 @@ class ForgePostExec:
             can_execute = (
                 data.count == 0
                 and not self._teardown_is_blocked
+                and not self._teardown_is_deferred
                 and not data.is_teardown_executed
             )
             logger.debug(
@@ -124,15 +157,23 @@ class ForgePostExec:
     def add(
         self,
         id: str,
-        teardown: Generator[Any, None, None] | None,
+        teardown: ForgeTeardownType | None,
         kwargs: dict[str, Any],
         result: ArtifactsType,
         errors: list[str],
+        references: int = 1,
     ) -> None:
         if id not in self._exec_store:
             with self.lock:
-                data = ForgeExecData(id, teardown, kwargs, result, errors, 1)
+                data = ForgeExecData(
+                    id, teardown, kwargs, result, errors, references
+                )
                 self._exec_store[id] = data
+                fingerprint = make_fingerprint(kwargs)
+                if fingerprint is None:
+                    self._unhashable_exec_ids.append(id)
+                else:
+                    self._exec_index.setdefault(fingerprint, []).append(id)
             logger.debug(f"REGISTER TEARDOWN {id}: {self.summary(data)}")
         else:
             self.reuse(id)
@@ -149,7 +190,7 @@ class ForgePostExec:
         with data.lock:
             data.count += 1
 
-    def get_teardown(self, id: str) -> Generator[Any, None, None] | None:
+    def get_teardown(self, id: str) -> ForgeTeardownType | None:
         data = self._exec_store.get(id)
         assert data
         return data.teardown
@@ -172,17 +213,44 @@ class ForgePostExec:
     def list(self) -> tuple[ForgeExecData, ...]:
         return tuple(self._exec_store.values())
 
+    def find(self, kwargs: dict[str, Any]) -> ForgeExecData | None:
+        fingerprint = make_fingerprint(kwargs)
+        with self.lock:
+            if fingerprint is not None:
+                ids = self._exec_index.get(fingerprint)
+                return self._exec_store[ids[0]] if ids else None
+            for id in self._unhashable_exec_ids:
+                data = self._exec_store[id]
+                if same_args(data.kwargs, kwargs):
+                    return data
+        return None
+
     def execute_teardown(self, data: ForgeExecData) -> None:
         teardown = data.teardown
         if inspect.isgenerator(teardown):
             with contextlib.suppress(StopIteration):
                 next(teardown)
+        elif inspect.isasyncgen(teardown):
+            framework_loop.run(self._execute_async_teardown(teardown))
         elif callable(teardown):
-            teardown()
+            result = teardown()
+            if inspect.isawaitable(result):
+                framework_loop.run(result)
         else:
             pass
         data.is_teardown_executed = True
 
+    @staticmethod
+    async def _execute_async_teardown(teardown: ForgeAsyncGenType) -> None:
+        with contextlib.suppress(StopAsyncIteration):
+            await teardown.__anext__()
+
+    def teardown_unreferenced(self, id: str) -> bool:
+        data = self._exec_store.get(id)
+        if data is None:
+            return False
+        return self.exec_teardown_if_ready(data)
+
     def dereference_teardown(self, id: str) -> bool:
         data = self._exec_store.get(id)
         if data is None:
@@ -244,6 +312,15 @@ class FrameworkForge(ExecutableBase):
     def full_path(self) -> str:
         return "::".join(self.key[:2])
 
+    @property
+    def has_teardown(self) -> bool:
+        if self._is_generatorfunction or self._is_asyncgenfunction:
+            return True
+        # instances of classes implementing teardown method
+        return not inspect.isfunction(self._function) and callable(
+            getattr(self._function, "teardown", None)
+        )
+
     @property
     def executions(self) -> tuple[ForgeExecData, ...]:
         return self._executions.list()
@@ -254,19 +331,42 @@ class FrameworkForge(ExecutableBase):
     def unblock_teardown(self) -> None:
         self._executions.unblock_teardown()
 
+    @property
+    def teardown_is_deferred(self) -> bool:
+        return self._executions.teardown_is_deferred
+
+    def defer_teardown(self) -> None:
+        self._executions.defer_teardown()
+
+    def resume_teardown(self) -> None:
+        self._executions.resume_teardown()
+
+    def is_teardown_pending(self, id: str) -> bool:
+        return self._executions.is_teardown_pending(id)
+
     def teardown(self, id: str) -> bool:
         return self._executions.dereference_teardown(id)
 
+    def find_execution(self, kwargs: dict[str, Any]) -> ForgeExecData | None:
+        return self._executions.find(kwargs)
+
     def register_execution(
         self,
         id: str,
         *,
-        teardown: Generator[Any, None, None] | None,
+        teardown: ForgeTeardownType | None,
         kwargs: dict[str, Any],
         result: ArtifactsType,
         errors: list[str],
+        references: int = 1,
     ) -> None:
-        self._executions.add(id, teardown, kwargs, result, errors)
+        self._executions.add(id, teardown, kwargs, result, errors, references)
+
+    def teardown_unreferenced(self, id: str) -> bool:
+        return self._executions.teardown_unreferenced(id)
+
+    def teardown_unreferenced_executions(self) -> None:
+        self._executions.exec_ready_teardowns()
 
     def reuse_execution(self, prev_exec_id: str) -> None:
         self._executions.reuse(prev_exec_id)
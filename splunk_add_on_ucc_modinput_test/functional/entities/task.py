@@ -18,28 +18,69 @@ from typing import TYPE_CHECKING
 
 from splunk_add_on_ucc_modinput_test.typing import (
     ArtifactsType,
+    ForgeAsyncGenType,
     ForgeGenType,
+    ProbeAsyncGenType,
     ProbeGenType,
 )
 
 if TYPE_CHECKING:
     from splunk_add_on_ucc_modinput_test.typing import (
+        ForgeTeardownType,
         ProbeFnType,
         ProbeGenFnType,
+        ProbeAsyncGenFnType,
         ExecutableKeyType,
     )
 
+import asyncio
+import functools
 import inspect
 import time
 import types
 import random
 import traceback
 from copy import deepcopy
-from typing import Any, Generator, Optional, List
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generator,
+    Hashable,
+    Mapping,
+    Optional,
+    List,
+    Sequence,
+    cast,
+)
 from splunk_add_on_ucc_modinput_test.functional import logger
 from splunk_add_on_ucc_modinput_test.functional.common.pytest_config_adapter import (
     PytestConfigAdapter,
 )
+from splunk_add_on_ucc_modinput_test.functional.common.event_loop import (
+    framework_loop,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.process_pool import (
+    forge_process_pool,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_cache import (
+    call_cache_cleanup,
+    forge_result_cache,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_args import (
+    make_fingerprint,
+    same_args,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.tracing import (
+    session_tracer,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.latency_stats import (
+    latency_stats,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_profiler import (
+    forge_profiler,
+)
+from splunk_add_on_ucc_modinput_test.common.otlp import OtlpSpan, otlp_tracer
 from splunk_add_on_ucc_modinput_test.functional.constants import ForgeProbe
 
 from splunk_add_on_ucc_modinput_test.functional.entities.forge import (
@@ -67,23 +108,62 @@ class FrameworkTask:
         forge_kwargs: dict[str, Any],
         probe_fn: ProbeFnType | None,
         config: PytestConfigAdapter,
+        use_process_pool: bool = False,
+        cache_version: str | None = None,
+        cache_cleanup: Callable[..., Any] | None = None,
+        is_speculative: bool = False,
+        resources: tuple[str, ...] = (),
     ):
+        assert not (
+            use_process_pool and forge.is_async
+        ), f"Async forge {forge} can not be executed in process pool"
+        # teardown state of cached execution can not be passed to the later
+        # session purging the cache, resources are released by cache_cleanup
+        assert not (cache_version and forge.has_teardown), (
+            f"Forge {forge} with teardown can not be declared with "
+            "cache_version, move its teardown to cache_cleanup function"
+        )
+        assert cache_cleanup is None or (
+            cache_version and inspect.isfunction(cache_cleanup)
+        ), (
+            f"cache_cleanup of forge {forge} must be a function and requires "
+            "cache_version"
+        )
         self._config = config
         self._test = test
         self._forge = forge
         self._is_bootstrap = is_bootstrap
+        self._use_process_pool = use_process_pool
+        self._cache_version = cache_version
+        self._cache_cleanup = cache_cleanup
+        self._resources = resources
+        self._is_speculative = is_speculative
+        self._is_cached = False
         self._forge_initial_kwargs = forge_kwargs
         self._exec_id: str | None = None
         self._is_executed = False
-        self._teardown: Generator[None, None, None] | None = None
+        self._is_done = False
+        self._duration: float | None = None
+        self._execution: tuple[
+            ArtifactsType, bool, ArtifactsType
+        ] | None = None
+        self._execution_start_time = 0.0
+        self._otlp_span: OtlpSpan | None = None
+        self._probe_it: ProbeGenType | None = None
+        self._probe_start_time = 0.0
+        self._probe_expire_time = 0.0
+        self._probe_result: bool | None = None
+        self._teardown: ForgeTeardownType | None = None
         self._setup_errors: list[str] = []
         self._teardown_errors: list[str] = []
         self._result: object | None = None
-        self._global_builtin_args: dict[str, Any] = {}
+        self._global_builtin_args: Mapping[str, Any] = {}
         self._forge_kwargs: dict[str, Any] = {}
+        self._args_fingerprint: Hashable | None = make_fingerprint({})
         self._probe: ExecutableBase | None = None
         self._probe_fn: ProbeFnType | None = None
         self._probe_gen: ProbeGenFnType | None = None
+        self._probe_async_gen: ProbeAsyncGenFnType | None = None
         self._probe_kwargs: dict[str, Any] = {}
         self.apply_probe(probe_fn)
 
@@ -98,6 +178,10 @@ class FrameworkTask:
     def is_executed(self) -> bool:
         return self._is_executed
 
+    @property
+    def is_done(self) -> bool:
+        return self._is_done
+
     @property
     def error(self) -> str:
         errors = self._setup_errors + self._teardown_errors
@@ -185,6 +269,18 @@ class FrameworkTask:
             return "::".join(self._probe.key)
         return None
 
+    @property
+    def trace_args(self) -> dict[str, str]:
+        return dict(test="::".join(self.test_key), forge=self.forge_full_path)
+
+    @property
+    def otlp_attributes(self) -> dict[str, Any]:
+        return {
+            "forge.path": self.forge_full_path,
+            "forge.scope": self.forge_scope,
+            "forge.bootstrap": self.is_bootstrap,
+        }
+
     @property
     def summary(self) -> str:
         return (
@@ -225,7 +321,22 @@ class FrameworkTask:
         if callable(probe_fn):
             self._probe = ExecutableBase(probe_fn)
 
-        if inspect.isgeneratorfunction(self._probe_fn):
+        self._probe_gen = None
+        self._probe_async_gen = None
+        if self._probe is not None and self._probe._is_asyncgenfunction:
+            self._probe_async_gen = cast("ProbeAsyncGenFnType", probe_fn)
+        elif self._probe is not None and self._probe._is_coroutinefunction:
+            async_probe_fn = cast(Callable[..., Awaitable[Any]], probe_fn)
+
+            async def _probe_default_async_gen(
+                **probe_args: Any,
+            ) -> ProbeAsyncGenType:
+                while not await async_probe_fn(**probe_args):
+                    yield self._config.probe_invoke_interval
+                yield True
+
+            self._probe_async_gen = _probe_default_async_gen
+        elif inspect.isgeneratorfunction(self._probe_fn):
             self._probe_gen = probe_fn
         elif callable(self._probe_fn):
 
@@ -238,33 +349,94 @@ class FrameworkTask:
                 return True
 
             self._probe_gen = _probe_default_gen
-        else:
-            self._probe_gen = None
 
-        if self._probe_gen and self._probe_fn is not None:
-            sig = inspect.signature(self._probe_fn)
-            self._probe_required_args = list(sig.parameters.keys())
+        if self._probe is not None:
+            self._probe_required_args = list(self._probe.required_args_names)
         else:
             self._probe_required_args = []
 
-    def collect_available_kwargs(self) -> dict[str, Any]:
+    @property
+    def has_probe(self) -> bool:
+        return bool(self._probe_gen or self._probe_async_gen)
+
+    @property
+    def has_async_probe(self) -> bool:
+        return self._probe_async_gen is not None
+
+    @property
+    def is_async(self) -> bool:
+        return self._forge.is_async
+
+    @property
+    def is_probing(self) -> bool:
+        return self._probe_it is not None
+
+    @property
+    def duration(self) -> float | None:
+        return self._duration
+
+    @property
+    def use_process_pool(self) -> bool:
+        return self._use_process_pool
+
+    @property
+    def cache_version(self) -> str | None:
+        return self._cache_version
+
+    @property
+    def cache_cleanup(self) -> Callable[..., Any] | None:
+        return self._cache_cleanup
+
+    @property
+    def resources(self) -> tuple[str, ...]:
+        return self._resources
+
+    @property
+    def is_speculative(self) -> bool:
+        return self._is_speculative
+
+    @property
+    def comparable_args(self) -> dict[str, Any]:
+        return self._get_comparable_args()
+
+    @property
+    def args_fingerprint(self) -> Hashable | None:
+        return self._args_fingerprint
+
+    @property
+    def initial_args_fingerprint(self) -> Hashable | None:
+        return make_fingerprint(self._forge_initial_kwargs)
+
+    def collect_available_kwargs(
+        self, required_args: Sequence[str]
+    ) -> dict[str, Any]:
         available_kwargs = self._test.artifacts_copy
         available_kwargs.update(self.get_forge_kwargs_copy())
-        available_kwargs.update(self._global_builtin_args)
+        # clients are created only for arguments that are going to be used
+        available_kwargs.update(
+            {
+                k: self._global_builtin_args[k]
+                for k in self._global_builtin_args
+                if k in required_args
+            }
+        )
         available_kwargs.update(self._test.builtin_args)
         return available_kwargs
 
     def prepare_forge_call_args(
-        self, global_builtin_args: dict[str, Any]
+        self, global_builtin_args: Mapping[str, Any]
     ) -> None:
         logger.debug(f"EXECTASK: prepare_forge_call_args {self}")
 
         self._global_builtin_args = global_builtin_args
 
-        available_kwargs = self.collect_available_kwargs()
+        available_kwargs = self.collect_available_kwargs(
+            self._forge.required_args_names
+        )
         self._forge_kwargs = self._forge.filter_requied_kwargs(
             available_kwargs
         )
+        self._args_fingerprint = make_fingerprint(self._get_comparable_args())
 
         logger.debug(
             f"EXECTASK: prepare_forge_call_args for {self.forge_key}:\n\ttest required args: {self._test.required_args_names}\n\ttest artifacts: {self._test.artifacts}\n\tforge initial kwargs: {self._forge_initial_kwargs}\n\tforge kwargs: {self._forge_kwargs}\n\ttask available kwargs: {available_kwargs}"
@@ -297,8 +469,15 @@ class FrameworkTask:
             return result
         return None
 
+    def invoke_async_probe(self) -> ProbeAsyncGenType | None:
+        if callable(self._probe_async_gen):
+            return self._probe_async_gen(**self._probe_kwargs)
+        return None
+
     def prepare_probe_kwargs(self, extra_args: dict[str, Any] = {}) -> None:
-        available_kwargs = self.collect_available_kwargs()
+        available_kwargs = self.collect_available_kwargs(
+            self._probe_required_args
+        )
         available_kwargs.update(extra_args)
 
         self._probe_kwargs = {
@@ -307,45 +486,131 @@ class FrameworkTask:
             if k in self._probe_required_args
         }
 
-    def wait_for_probe(self, last_result: ArtifactsType) -> bool | None:
+    def _normalize_probe_interval(self, interval: Any) -> float:
+        if not isinstance(interval, int):
+            return self._config.probe_invoke_interval
+        elif interval > ForgeProbe.MAX_INTERVAL.value:
+            return ForgeProbe.MAX_INTERVAL.value
+        elif interval < ForgeProbe.MIN_INTERVAL.value:
+            return ForgeProbe.MIN_INTERVAL.value
+        return interval
+
+    def _check_probe_expiration(self, expire_time: float) -> None:
+        if time.time() > expire_time:
+            msg = f"Test {self.test_key}, forge {self.forge_key}: probe {self._probe_fn} exceeded {self._config.probe_wait_timeout} seconds timeout"
+            raise SplTaFwkWaitForProbeTimeout(msg)
+
+    def _start_probe(self, last_result: ArtifactsType) -> float:
         logger.debug(
             f"WAIT FOR PROBE started\n\ttest {self.test_key}\n\tforge {self.forge_key}\n\tprobe {self._probe_fn}"
         )
-        if not self._probe_gen:
-            return None
-
-        probe_start_time = time.time()
         self.prepare_probe_kwargs(last_result)
-        expire_time = time.time() + self._config.probe_wait_timeout
         logger.debug(
-            f"WAIT FOR PROBE\n\ttest {self.test_key}\n\tforge {self.forge_key}\n\tprobe {self._probe_fn}\n\tprobe_gen {self._probe_gen}\n\tprobe_args {self._probe_kwargs}"
+            f"WAIT FOR PROBE\n\ttest {self.test_key}\n\tforge {self.forge_key}\n\tprobe {self._probe_fn}\n\tprobe_gen {self._probe_gen or self._probe_async_gen}\n\tprobe_args {self._probe_kwargs}"
         )
+        return time.time() + self._config.probe_wait_timeout
 
-        result = None
+    def _finish_probe(
+        self, result: bool | None, probe_start_time: float
+    ) -> bool | None:
+        duration = time.time() - probe_start_time
+        latency_stats.record_probe(self.probe_full_path or "", duration)
+        logger.info(
+            f"Forge probe has finished execution, result: {result}, time taken {duration} seconds:{self.summary}"
+        )
+        return result
+
+    def probe_step(self) -> float | None:
+        """
+        Invokes generator probe once. Returns interval in seconds after
+        which probe has to be invoked again or None if probe has finished.
+        """
+        assert self._execution is not None, "Forge has not been executed"
         try:
-            it = self.invoke_probe()
-            while True:
-                interval = next(it)
-                if time.time() > expire_time:
-                    result = False
-                    msg = f"Test {self.test_key}, forge {self.forge_key}: probe {self._probe_fn} exceeded {self._config.probe_wait_timeout} seconds timeout"
-                    raise SplTaFwkWaitForProbeTimeout(msg)
-
-                if not isinstance(interval, int):
-                    interval = self._config.probe_invoke_interval
-                elif interval > ForgeProbe.MAX_INTERVAL.value:
-                    interval = ForgeProbe.MAX_INTERVAL.value
-                elif interval < ForgeProbe.MIN_INTERVAL.value:
-                    interval = ForgeProbe.MIN_INTERVAL.value
-                time.sleep(interval)
+            if self._probe_it is None:
+                self._probe_start_time = time.time()
+                self._probe_expire_time = self._start_probe(self._execution[2])
+                self._probe_it = self.invoke_probe()
+            with session_tracer.span(
+                self._probe_name, "probe", self.trace_args
+            ), otlp_tracer.span(self._probe_name, parent=self._otlp_span):
+                interval = self._profile("probe", next, self._probe_it)
+            self._check_probe_expiration(self._probe_expire_time)
+            return self._normalize_probe_interval(interval)
         except StopIteration as sie:
-            result = sie.value
+            self._probe_result = self._finish_probe(
+                sie.value, self._probe_start_time
+            )
+        except Exception as e:
+            self._report_failure(e, "Forge probe has failed to execute")
+        self._probe_it = None
+        return None
 
-        logger.info(
-            f"Forge probe has finished execution, result: {result}, time taken {time.time() - probe_start_time} seconds:{self.summary}"
-        )
+    @property
+    def _probe_name(self) -> str:
+        return getattr(self._probe_fn, "__name__", "probe")
 
-        return result
+    def _probe_step(self, it: ProbeGenType) -> tuple[bool, Any]:
+        # StopIteration can not be propagated through asyncio futures
+        try:
+            with session_tracer.span(
+                self._probe_name, "probe", self.trace_args
+            ), otlp_tracer.span(self._probe_name, parent=self._otlp_span):
+                return False, self._profile("probe", next, it)
+        except StopIteration as sie:
+            return True, sie.value
+
+    async def wait_for_probe_async(
+        self, last_result: ArtifactsType
+    ) -> bool | None:
+        if not self.has_probe:
+            return None
+
+        probe_start_time = time.time()
+        expire_time = self._start_probe(last_result)
+
+        result = None
+        async_it = self.invoke_async_probe()
+        if async_it is not None:
+            while True:
+                iteration_start = session_tracer.now()
+                try:
+                    with otlp_tracer.span(
+                        self._probe_name, parent=self._otlp_span
+                    ):
+                        interval = await async_it.__anext__()
+                except StopAsyncIteration:
+                    break
+                session_tracer.add_span(
+                    self._probe_name,
+                    "probe",
+                    iteration_start,
+                    session_tracer.now(),
+                    self.trace_args,
+                    is_async=True,
+                )
+                if isinstance(interval, bool):
+                    # async generators can not return values, so async probe
+                    # reports its result by yielding a boolean value
+                    result = interval
+                    break
+                self._check_probe_expiration(expire_time)
+                await asyncio.sleep(self._normalize_probe_interval(interval))
+            await async_it.aclose()
+        else:
+            loop = asyncio.get_event_loop()
+            it = self.invoke_probe()
+            while True:
+                done, value = await loop.run_in_executor(
+                    None, self._probe_step, it
+                )
+                if done:
+                    result = value
+                    break
+                self._check_probe_expiration(expire_time)
+                await asyncio.sleep(self._normalize_probe_interval(value))
+
+        return self._finish_probe(result, probe_start_time)
 
     def mark_as_failed(self, error: str | Exception, prefix: str) -> None:
         if isinstance(error, Exception):
@@ -363,7 +628,17 @@ class FrameworkTask:
             f"MARK TASK EXECUTED: {self.forge_full_path},\n\tself id: {id(self)},\n\tscope: {self.forge_scope},\n\texec_id: {self._exec_id},\n\ttest: {self.test_key},\n\tis_executed: {self.is_executed},\n\tis_failed: {self.failed},\n\terrors: {self._setup_errors}"
         )
 
-    def _save_generator_teardown(self, gen: ForgeGenType | None) -> None:
+    def mark_as_done(self) -> None:
+        """
+        Marks task as done when its results are propagated to the test
+        artifacts and notifies the test waiting for it.
+        """
+        self._is_done = True
+        self._test.notify_task_state_changed()
+
+    def _save_generator_teardown(
+        self, gen: ForgeGenType | ForgeAsyncGenType | None
+    ) -> None:
         self._teardown = gen
 
     def _save_class_teardown(self) -> None:
@@ -372,35 +647,20 @@ class FrameworkTask:
             if callable(attr):
                 self._teardown = attr
 
+    def _call_cache_cleanup(self, result: ArtifactsType) -> None:
+        assert self._cache_cleanup is not None
+        call_cache_cleanup(
+            self._cache_cleanup,
+            {**self._get_comparable_args(), **result},
+            self._global_builtin_args,
+        )
+
     def update_test_artifacts(self, artifacts: dict[str, Any]) -> None:
         self._test.update_artifacts(artifacts)
 
     @staticmethod
     def same_args(args1: Any, args2: Any) -> bool:
-        if type(args1) != type(args2):
-            return False
-
-        if isinstance(args1, (list, tuple)):
-            if len(args1) != len(args2):
-                return False
-            for arg1, arg2 in zip(args1, args2):
-                if not FrameworkTask.same_args(arg1, arg2):
-                    return False
-            return True
-
-        if isinstance(args1, dict):
-            if len(args1) != len(args2):
-                return False
-            if set(args1.keys()).difference(set(args1.keys())):
-                return False
-            if set(args2.keys()).difference(set(args1.keys())):
-                return False
-            for k, v in args1.items():
-                if not FrameworkTask.same_args(v, args2[k]):
-                    return False
-            return True
-
-        return args1 == args2
+        return same_args(args1, args2)
 
     def same_tasks(self, other_task: FrameworkTask) -> bool:
         if self.forge_key != other_task.forge_key:
@@ -408,7 +668,7 @@ class FrameworkTask:
 
         args1 = self._get_comparable_args()
         args2 = other_task._get_comparable_args()
-        return FrameworkTask.same_args(args1, args2)
+        return same_args(args1, args2)
 
     def reuse_forge_execution(
         self, exec_id: str, result: Any, errors: list[str]
@@ -416,7 +676,14 @@ class FrameworkTask:
         logger.debug(
             f"reuse execution {exec_id}:\n\tTask: {self.test_key}\n\tDep: {self.forge_key}\n\tresult: {result}\n\terrors: {errors}"
         )
-        self._forge.reuse_execution(exec_id)
+        if not self._is_speculative:
+            self._forge.reuse_execution(exec_id)
+            latency_stats.record_reuse(self.forge_full_path)
+        session_tracer.add_instant(
+            f"{self._forge.name} reused",
+            "forge",
+            dict(self.trace_args, exec_id=exec_id),
+        )
         self._exec_id = exec_id
         self._result = result
         self._setup_errors = errors
@@ -425,21 +692,19 @@ class FrameworkTask:
         self, args_to_match: ArtifactsType
     ) -> tuple[bool, ArtifactsType]:
         logger.debug(
-            f"Dep {self.forge_key}: look for {self._forge_kwargs} in {self._forge.executions}"
+            f"Dep {self.forge_key}: look for {args_to_match} in {self._forge.executions}"
         )
-        for prev_exec in self._forge.executions:
-            logger.debug(
-                f"EXECTASK: COMPARE ARGS:\n\tprev exec: {prev_exec.kwargs}\n\tcurrent args {args_to_match}"
-            )
-            if self.same_args(prev_exec.kwargs, args_to_match):
-                self.reuse_forge_execution(
-                    prev_exec.id, prev_exec.result, prev_exec.errors
-                )
-                logger.info(f"Forge execution has been REUSED:{self.summary}")
-                return True, prev_exec.result
-        return False, {}
+        prev_exec = self._forge.find_execution(args_to_match)
+        if prev_exec is None:
+            return False, {}
 
-    def execute(self) -> None:
+        self.reuse_forge_execution(
+            prev_exec.id, prev_exec.result, prev_exec.errors
+        )
+        logger.info(f"Forge execution has been REUSED:{self.summary}")
+        return True, prev_exec.result
+
+    def _start_execution(self) -> tuple[ArtifactsType, bool, ArtifactsType]:
         logger.debug(
             f"EXECTASK: execute {self}:\n\texecutions {self._forge.executions}\n\tdep_kwargs: {self._forge_kwargs}\n\tprobe {self._probe_fn}"
         )
@@ -449,77 +714,327 @@ class FrameworkTask:
             self._exec_id = (
                 f"{int(time.time()*1000000)}{random.randint(0, 1000):03}"
             )
+            cached_result = forge_result_cache.get(self)
+            if cached_result is not None:
+                self._is_cached = True
+                latency_stats.record_reuse(self.forge_full_path)
+                session_tracer.add_instant(
+                    f"{self._forge.name} cached", "forge", self.trace_args
+                )
+                logger.info(
+                    f"Cached forge result has been USED:{self.summary}"
+                )
+                return comp_kwargs, reuse, cached_result
             logger.debug(
                 f"\nEXECTASK self id: {id(self)}: execute {self} - similar executions not found,\n\tTEST: {self.test_key},\n\tself._required_args: {self._forge._required_args},\n\tself._forge_initial_kwargs: {self._forge_initial_kwargs},\n\tcall_args: {self._forge_kwargs},\n\ttest artifacts: {self._test.artifacts}"
             )
+        return comp_kwargs, reuse, result
+
+    def _report_forge_success(self, forge_start_time: float) -> None:
+        logger.info(
+            f"Forge has been executed successfully, time taken {time.time() - forge_start_time} seconds:{self.summary}"
+        )
+
+    def _record_forge_latency(self, forge_start_time: float) -> None:
+        latency_stats.record_forge(
+            self.forge_full_path, time.time() - forge_start_time
+        )
+
+    def _report_failure(self, error: Exception, prefix: str) -> None:
+        traceback_info = traceback.format_exc()
+        report = f"{prefix}: {error}{self.summary}\n{traceback_info}"
+        logger.error(report)
+        self._setup_errors.append(report)
+
+    def _call_forge_in_process(self) -> ArtifactsType:
+        logger.debug(
+            f"EXECTASK: dependency {self._forge} is sent to process pool"
+        )
+        result, teardown = forge_process_pool.execute(
+            self._forge._function, self._forge_kwargs
+        )
+        if teardown is not None:
+            self._teardown = teardown
+        return self.make_kwarg(result)
+
+    def _profile(self, phase: str, fn: Callable[..., Any], *args: Any) -> Any:
+        return forge_profiler.profile(
+            self.forge_full_path, self._exec_id, phase, fn, *args
+        )
+
+    def _call_forge(self) -> ArtifactsType:
+        with session_tracer.span(
+            self._forge.name, "forge", self.trace_args
+        ), otlp_tracer.activate(self._otlp_span):
+            return self._profile("setup", self._call_sync_forge)
+
+    def _call_sync_forge(self) -> ArtifactsType:
+        if self._use_process_pool:
+            return self._call_forge_in_process()
+        if self._forge._is_generatorfunction:
+            logger.debug(
+                f"EXECTASK: dependency {self._forge} is a generator function"
+            )
+            it = self._forge._function(**self._forge_kwargs)
             try:
-                forge_start_time = time.time()
-                if self._forge._is_generatorfunction:
-                    logger.debug(
-                        f"EXECTASK: dependency {self._forge} is a generator function"
-                    )
-                    it = self._forge._function(**self._forge_kwargs)
-                    try:
-                        result = self.make_kwarg(next(it))
-                        self._save_generator_teardown(it)
-                    except StopIteration as sie:
-                        result = self.make_kwarg(sie.value)
-                else:
-                    result = self.make_kwarg(
-                        self._forge._function(**self._forge_kwargs)
-                    )
-                    self._save_class_teardown()
-                logger.info(
-                    f"Forge has been executed successfully, time taken {time.time() - forge_start_time} seconds:{self.summary}"
-                )
-            except Exception as e:
-                traceback_info = traceback.format_exc()
-                report = f"Forge has failed to execute: {e}{self.summary}\n{traceback_info}"
-                logger.error(report)
-                self._setup_errors.append(report)
+                result = self.make_kwarg(next(it))
+                self._save_generator_teardown(it)
+            except StopIteration as sie:
+                result = self.make_kwarg(sie.value)
+        else:
+            result = self.make_kwarg(
+                self._forge._function(**self._forge_kwargs)
+            )
+            self._save_class_teardown()
+        return result
 
+    async def _call_async_forge(self) -> ArtifactsType:
+        with session_tracer.span(
+            self._forge.name, "forge", self.trace_args, is_async=True
+        ), otlp_tracer.activate(self._otlp_span):
+            return await self._call_async_forge_fn()
+
+    async def _call_async_forge_fn(self) -> ArtifactsType:
+        if self._forge._is_asyncgenfunction:
+            logger.debug(
+                f"EXECTASK: dependency {self._forge} is an async generator function"
+            )
+            async_gen_fn = cast(
+                Callable[..., ForgeAsyncGenType], self._forge._function
+            )
+            it = async_gen_fn(**self._forge_kwargs)
+            try:
+                result = self.make_kwarg(await it.__anext__())
+                self._save_generator_teardown(it)
+            except StopAsyncIteration:
+                result = self.make_kwarg(None)
+        else:
+            async_fn = cast(
+                Callable[..., Awaitable[Any]], self._forge._function
+            )
+            result = self.make_kwarg(await async_fn(**self._forge_kwargs))
+            self._save_class_teardown()
+        return result
+
+    def _execute_forge(self) -> ArtifactsType:
+        result: ArtifactsType = {}
+        forge_start_time = time.time()
         try:
-            if not self.setup_failed:
-                probe_res = self.wait_for_probe(result)
-                probe_fn = self.get_probe_fn()
-                if probe_res is not None and probe_fn is not None:
-                    result[probe_fn.__name__] = probe_res
+            if self.is_async:
+                result = framework_loop.run(self._call_async_forge())
+            else:
+                result = self._call_forge()
+            self._report_forge_success(forge_start_time)
         except Exception as e:
-            traceback_info = traceback.format_exc()
-            report = f"Forge probe has failed to execute: {e}{self.summary}\n{traceback_info}"
-            logger.error(report)
-            self._setup_errors.append(report)
+            self._report_failure(e, "Forge has failed to execute")
+        self._record_forge_latency(forge_start_time)
+        return result
+
+    async def _execute_forge_async(self) -> ArtifactsType:
+        result: ArtifactsType = {}
+        forge_start_time = time.time()
+        try:
+            if self.is_async:
+                result = await self._call_async_forge()
+            else:
+                loop = asyncio.get_event_loop()
+                result = await loop.run_in_executor(None, self._call_forge)
+            self._report_forge_success(forge_start_time)
+        except Exception as e:
+            self._report_failure(e, "Forge has failed to execute")
+        self._record_forge_latency(forge_start_time)
+        return result
 
+    def _apply_probe_result(
+        self, result: ArtifactsType, probe_res: bool | None
+    ) -> None:
+        probe_fn = self.get_probe_fn()
+        if probe_res is not None and probe_fn is not None:
+            result[probe_fn.__name__] = probe_res
+
+    def _complete_execution(
+        self, comp_kwargs: ArtifactsType, reuse: bool, result: ArtifactsType
+    ) -> None:
         if not reuse:
             self._result = result
             assert (
                 self._exec_id is not None
             ), "_exec_id must be assigned earlier in this method"
+            teardown = self._teardown
+            if self._is_cached or (
+                not self.setup_failed and forge_result_cache.put(self, result)
+            ):
+                # cleanup of cached execution is deferred to cache purge
+                teardown = None
+            elif self._cache_cleanup is not None and not self.setup_failed:
+                # result is not cached, e.g. when the cache is purged, so
+                # cleanup is executed as teardown of the execution
+                teardown = functools.partial(self._call_cache_cleanup, result)
             self._forge.register_execution(
                 self._exec_id,
-                teardown=self._teardown,
+                teardown=teardown,
                 kwargs=comp_kwargs,
                 result=self._result,
                 errors=self._setup_errors,
+                # speculative execution is kept only for tasks reusing it
+                references=0 if self._is_speculative else 1,
             )
             if not self.is_bootstrap:
                 self.block_forge_teardown()
 
         self.mark_as_executed()
 
+    def _start_otlp_span(self) -> None:
+        self._otlp_span = otlp_tracer.start_span(
+            self._forge.name,
+            parent=self._test.otlp_span,
+            attributes=self.otlp_attributes,
+        )
+
+    def _end_otlp_span(self, reuse: bool) -> None:
+        span = self._otlp_span
+        if span is None:
+            return
+        span.set_attribute("forge.exec_id", self._exec_id or "")
+        span.set_attribute("forge.reused", reuse)
+        span.set_attribute("forge.cached", self._is_cached)
+        error = self.setup_error.splitlines()[0] if self.setup_failed else None
+        otlp_tracer.end_span(span, error)
+
+    def execute_forge_step(self) -> bool:
+        """
+        Executes forge or reuses its previous execution. Returns True if
+        forge probe has to be awaited before finishing task execution.
+        """
+        self._execution_start_time = time.time()
+        self._start_otlp_span()
+        comp_kwargs, reuse, result = self._start_execution()
+        if not reuse and not self._is_cached:
+            result = self._execute_forge()
+        self._execution = (comp_kwargs, reuse, result)
+        return self.has_probe and not self.setup_failed and not self._is_cached
+
+    async def execute_forge_step_async(self) -> bool:
+        self._execution_start_time = time.time()
+        self._start_otlp_span()
+        comp_kwargs, reuse, result = self._start_execution()
+        if not reuse and not self._is_cached:
+            result = await self._execute_forge_async()
+        self._execution = (comp_kwargs, reuse, result)
+        return self.has_probe and not self.setup_failed and not self._is_cached
+
+    async def probe_async(self) -> None:
+        assert self._execution is not None, "Forge has not been executed"
+        try:
+            self._probe_result = await self.wait_for_probe_async(
+                self._execution[2]
+            )
+        except Exception as e:
+            self._report_failure(e, "Forge probe has failed to execute")
+
+    def finish_execution(self) -> None:
+        assert self._execution is not None, "Forge has not been executed"
+        comp_kwargs, reuse, result = self._execution
+        self._apply_probe_result(result, self._probe_result)
+        if not reuse and not self._is_cached:
+            self._duration = time.time() - self._execution_start_time
+        self._complete_execution(comp_kwargs, reuse, result)
+        self._end_otlp_span(reuse)
+
+    def execute(self) -> None:
+        if self.execute_forge_step():
+            if self.has_async_probe:
+                framework_loop.run(self.probe_async())
+            else:
+                interval = self.probe_step()
+                while interval is not None:
+                    time.sleep(interval)
+                    interval = self.probe_step()
+        self.finish_execution()
+
+    async def execute_async(self) -> None:
+        if await self.execute_forge_step_async():
+            await self.probe_async()
+        self.finish_execution()
+
+    def release_speculative_execution(self) -> None:
+        """
+        Executes teardown of speculative forge execution that has not been
+        reused by any task.
+        """
+        try:
+            if (
+                self._exec_id is not None
+                and self._forge.teardown_unreferenced(self._exec_id)
+            ):
+                logger.info(
+                    f"Speculative forge execution has been torn down:{self.summary}"
+                )
+        except Exception as e:
+            logger.error(
+                f"Speculative forge teardown has failed to execute: {e}{self.summary}\n{traceback.format_exc()}"
+            )
+
+    @property
+    def exec_id(self) -> str | None:
+        return self._exec_id
+
+    @property
+    def is_teardown_pending(self) -> bool:
+        return self._exec_id is not None and self._forge.is_teardown_pending(
+            self._exec_id
+        )
+
     def teardown(self) -> None:
         logger.debug(
             f"Teardown task\n\t_exec_id: {self._exec_id}\n\tforge: {self.forge_full_path},\n\tscope: {self.forge_scope},\n\ttask: {self.test_key}\n\tteardown {self._teardown}"
         )
+        self._execute_teardown(self._forge.teardown)
+
+    def deferred_teardown(self) -> None:
+        # forge execution has been already dereferenced by all tests
+        self._execute_teardown(self._forge.teardown_unreferenced)
+
+    def _execute_teardown(self, teardown_fn: Callable[[str], bool]) -> None:
+        span_start = session_tracer.now()
+        # span is recorded only if the teardown has actually been executed
+        otlp_span = otlp_tracer.start_span(
+            f"{self._forge.name} teardown",
+            parent=self._test.otlp_span,
+            attributes=dict(
+                self.otlp_attributes, **{"forge.exec_id": self._exec_id or ""}
+            ),
+        )
         try:
             teardown_start_time = time.time()
-            if self._exec_id is not None and self._forge.teardown(
-                self._exec_id
-            ):
+            with otlp_tracer.activate(otlp_span):
+                executed = self._exec_id is not None and self._profile(
+                    "teardown", teardown_fn, self._exec_id
+                )
+            if executed:
+                otlp_tracer.end_span(otlp_span)
+                latency_stats.record_teardown(
+                    self.forge_full_path, time.time() - teardown_start_time
+                )
+                session_tracer.add_span(
+                    f"{self._forge.name} teardown",
+                    "teardown",
+                    span_start,
+                    session_tracer.now(),
+                    self.trace_args,
+                )
                 logger.info(
                     f"Forge teardown has been executed successfully, time taken {time.time() - teardown_start_time} seconds:{self.summary}"
                 )
         except Exception as e:
+            otlp_tracer.end_span(otlp_span, str(e))
+            session_tracer.add_span(
+                f"{self._forge.name} teardown",
+                "teardown",
+                span_start,
+                session_tracer.now(),
+                dict(self.trace_args, error=str(e)),
+            )
             traceback_info = traceback.format_exc()
             report = f"Forge teardown has failed to execute: {e}{self.summary}\n{traceback_info}"
             logger.error(report)
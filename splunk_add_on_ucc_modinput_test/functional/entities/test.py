@@ -13,8 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import threading
 from copy import deepcopy
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Mapping, Optional, Set
+from splunk_add_on_ucc_modinput_test.common.otlp import OtlpSpan, otlp_tracer
 from splunk_add_on_ucc_modinput_test.functional import logger
 from splunk_add_on_ucc_modinput_test.functional.constants import BuiltInArg
 from splunk_add_on_ucc_modinput_test.functional.entities.executable import (
@@ -40,9 +42,12 @@ class FrameworkTest(ExecutableBase):
         self.forges: Set[ExecutableKeyType] = set()
         self._is_executed: bool = False
         self._artifacts: Dict[str, Any] = {}
+        self._tasks_state_changed = threading.Condition()
         if altered_name:
             self._fn_name = altered_name
         self._test_id = self.generate_test_id()
+        self._otlp_span: Optional[OtlpSpan] = None
+        self._otlp_span_lock = threading.Lock()
 
     @staticmethod
     def generate_test_id() -> str:
@@ -54,10 +59,32 @@ class FrameworkTest(ExecutableBase):
     def test_id(self) -> str:
         return self._test_id
 
+    @property
+    def otlp_span(self) -> Optional[OtlpSpan]:
+        """
+        OTLP span of the test, started by the first forge execution or
+        setup of the test, whichever comes first.
+        """
+        with self._otlp_span_lock:
+            if self._otlp_span is None:
+                self._otlp_span = otlp_tracer.start_span(
+                    "::".join(self.key),
+                    attributes={"test_id": self.test_id},
+                )
+            return self._otlp_span
+
     @property
     def is_executed(self) -> bool:
         return self._is_executed
 
+    @property
+    def tasks_state_changed(self) -> threading.Condition:
+        return self._tasks_state_changed
+
+    def notify_task_state_changed(self) -> None:
+        with self._tasks_state_changed:
+            self._tasks_state_changed.notify_all()
+
     @property
     def artifacts(self) -> Dict[str, Any]:
         return self._artifacts
@@ -112,11 +139,17 @@ class FrameworkTest(ExecutableBase):
             return self._artifacts
 
     def collect_required_kwargs(
-        self, global_builtin_args: Dict[str, str]
+        self, global_builtin_args: Mapping[str, Any]
     ) -> Dict[str, Any]:
         all_args = self.artifacts_copy
         all_args.update(self.builtin_args)
-        all_args.update(global_builtin_args)
+        all_args.update(
+            {
+                k: global_builtin_args[k]
+                for k in global_builtin_args
+                if k in self._required_args
+            }
+        )
         required_args = {
             k: v for k, v in all_args.items() if k in self._required_args
         }
@@ -27,3 +27,7 @@ class SplTaFwkWaitForDependenciesTimeout(SplTaFwkBaseException):
 
 class SplTaFwkDependencyExecutionError(SplTaFwkBaseException):
     pass
+
+
+class SplTaFwkProcessPoolError(SplTaFwkBaseException):
+    pass
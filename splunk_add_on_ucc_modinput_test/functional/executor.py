@@ -15,22 +15,48 @@
 #
 from __future__ import annotations
 
-from splunk_add_on_ucc_modinput_test.typing import (
-    ArtifactsType,
-    ExecutableKeyType,
-)
+from splunk_add_on_ucc_modinput_test.typing import ExecutableKeyType
 
+import asyncio
+import contextlib
+import concurrent.futures
+import inspect
 import threading
-from queue import Queue
+import heapq
+import itertools
+import math
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, PriorityQueue, Queue
 import traceback
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Tuple,
+    TYPE_CHECKING,
+)
 from splunk_add_on_ucc_modinput_test.functional import logger
+from splunk_add_on_ucc_modinput_test.functional.common.event_loop import (
+    framework_loop,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.tracing import (
+    session_tracer,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.latency_stats import (
+    latency_stats,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_timings import (
+    ForgeTimings,
+)
 from splunk_add_on_ucc_modinput_test.functional.entities.task import (
     FrameworkTask,
     TaskSetListType,
 )
+from splunk_add_on_ucc_modinput_test.functional.constants import WorkerPool
 from splunk_add_on_ucc_modinput_test.functional.exceptions import (
     SplTaFwkWaitForDependenciesTimeout,
 )
@@ -42,6 +68,23 @@ if TYPE_CHECKING:
 
 
 def log_exceptions_traceback(fn: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(fn):
+
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any | None:
+            try:
+                logger.debug(f"{fn.__name__} executor is about to start")
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(
+                    f"{fn.__name__} executor has failed with error: {e}"
+                )
+                logger.debug(traceback.format_exc())
+            finally:
+                logger.debug(f"{fn.__name__} executor has stopped")
+            return None
+
+        return async_wrapper
+
     def wrapper(*args: Any, **kwargs: Any) -> Any | None:
         try:
             logger.debug(f"{fn.__name__} executor is about to start")
@@ -59,45 +102,58 @@ def log_exceptions_traceback(fn: Callable[..., Any]) -> Callable[..., Any]:
 class TaskGroupProcessor:
     @dataclass
     class Job:
-        test_index: int
+        row_index: int
         task_index: int
         task: FrameworkTask
+        priority: float = 0.0
+        dependents: int = 1
+        queued_at: float = 0.0
 
         @property
         def id(self) -> tuple[int, int]:
-            return self.test_index, self.task_index
+            return self.row_index, self.task_index
+
+        @property
+        def sort_key(self) -> tuple[float, int]:
+            return -self.priority, -self.dependents
 
     def __init__(
         self,
-        group: TaskSetListType,
         global_builtin_args_factory: Callable[
-            [ExecutableKeyType], ArtifactsType
+            [ExecutableKeyType], Mapping[str, Any]
         ],
+        on_task_done: Callable[[FrameworkTask], None] | None = None,
     ) -> None:
         self._global_builtin_args_factory = global_builtin_args_factory
-        self._task_group: TaskSetListType = group
+        self._on_task_done = on_task_done
+        self._task_group: list[list[FrameworkTask]] = []
         self._jobs: list[TaskGroupProcessor.Job] = []
         self._matched_tasks: dict[tuple[int, int], tuple[int, int]] = {}
-        self._result_collector: list[list[object | None] | None] = [
-            None
-        ] * len(self._task_group)
+        self._matching_tasks: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        self._source_tasks: dict[
+            tuple[ExecutableKeyType, Hashable], list[tuple[int, int]]
+        ] = {}
+        self._unhashable_source_tasks: list[tuple[int, int]] = []
+        self._result_collector: list[list[object | None]] = []
         self._done: dict[tuple[int, int], bool] = {}
+        self._pending_jobs = 0
+        self._row_pending: list[int] = []
+        self._artifact_owners: list[dict[str, int]] = []
 
-        self._build_task_list()
-
-    def _build_task_list(self) -> None:
-        logger.debug(f"\npush task group {self._task_group}")
+    def push(self, tasks: list[FrameworkTask]) -> tuple[int, list[Job]]:
+        row_index = len(self._task_group)
+        logger.debug(f"\npush task row {row_index}: {tasks}")
+        self._task_group.append(tasks)
+        self._result_collector.append([None] * len(tasks))
+        self._row_pending.append(len(tasks))
+        self._artifact_owners.append({})
 
-        for test_index, test_tasks in enumerate(self._task_group):
-            logger.debug(
-                f"test_index={test_index} push parallel_task {test_tasks}"
-            )
-            if test_tasks is not None:
-                self._result_collector[test_index] = [None] * len(test_tasks)
-                self._jobs += self._process_test_tasks(test_index, test_tasks)
-
-        for job in self._jobs:
+        jobs = self._process_test_tasks(row_index, tasks)
+        for job in jobs:
             self._done[job.id] = False
+        self._pending_jobs += len(jobs)
+        self._jobs += jobs
+        return row_index, jobs
 
     @property
     def jobs(self) -> list[Job]:
@@ -105,10 +161,13 @@ class TaskGroupProcessor:
 
     @property
     def all_tasks_done(self) -> bool:
-        return all(self._done.values())
+        return self._pending_jobs == 0
+
+    def is_row_done(self, row_index: int) -> bool:
+        return self._row_pending[row_index] == 0
 
     def _process_test_tasks(
-        self, test_index: int, test_tasks: list[FrameworkTask]
+        self, row_index: int, test_tasks: list[FrameworkTask]
     ) -> list[Job]:
         processed_tasks = []
         for task_index, task in enumerate(test_tasks):
@@ -118,109 +177,515 @@ class TaskGroupProcessor:
                 )
             except Exception as e:
                 task.mark_as_failed(e, "Failed to prepare forge call args")
-            else:
-                if not self._try_skip_task(test_index, task_index):
-                    job = self.Job(test_index, task_index, task)
-                    processed_tasks.append(job)
+                self._mark_as_done(task)
+                self._row_pending[row_index] -= 1
+                continue
+
+            same_task = self._try_skip_task(row_index, task_index)
+            if same_task is None:
+                job = self.Job(row_index, task_index, task)
+                processed_tasks.append(job)
+            elif self._done.get(same_task, False):
+                self._copy_result(same_task, (row_index, task_index))
 
         return processed_tasks
 
-    def _get_task(self, test_index: int, task_index: int) -> FrameworkTask:
-        test_tasks = self._task_group[test_index]
-        assert test_tasks is not None, "test_tasks must be valid"
-        return test_tasks[task_index]
+    def _mark_as_done(self, task: FrameworkTask) -> None:
+        # task state counters are updated before the test is notified
+        if self._on_task_done is not None:
+            self._on_task_done(task)
+        task.mark_as_done()
+
+    def _get_task(self, row_index: int, task_index: int) -> FrameworkTask:
+        return self._task_group[row_index][task_index]
 
     def _try_skip_task(
-        self, test_index: int, task_index: int
+        self, row_index: int, task_index: int
     ) -> tuple[int, int] | None:
-        task = self._get_task(test_index, task_index)
+        task = self._get_task(row_index, task_index)
         same_task = self._find_same_task(task)
         logger.debug(f"{task.forge_key} SAME TASK IS  {same_task}")
         if same_task:
             logger.debug(
                 f"task_index={task_index} skip task {task.forge_key} execution"
             )
-            self._matched_tasks[(test_index, task_index)] = same_task
+            self._matched_tasks[(row_index, task_index)] = same_task
+            self._matching_tasks.setdefault(same_task, []).append(
+                (row_index, task_index)
+            )
+        else:
+            self._add_source_task(row_index, task_index)
         return same_task
 
+    def _add_source_task(self, row_index: int, task_index: int) -> None:
+        task = self._get_task(row_index, task_index)
+        fingerprint = task.args_fingerprint
+        if fingerprint is None:
+            self._unhashable_source_tasks.append((row_index, task_index))
+        else:
+            self._source_tasks.setdefault(
+                (task.forge_key, fingerprint), []
+            ).append((row_index, task_index))
+
     def _find_same_task(self, task: FrameworkTask) -> tuple[int, int] | None:
-        for i, test_tasks in enumerate(self._task_group):
-            if test_tasks is None:
-                continue
-            for j, t in enumerate(test_tasks):
-                if task is t:
-                    return None
-                if task.same_tasks(t):
-                    return i, j
+        fingerprint = task.args_fingerprint
+        if fingerprint is None:
+            for source in self._unhashable_source_tasks:
+                t = self._get_task(*source)
+                if not t.setup_failed and task.same_tasks(t):
+                    return source
+            return None
+
+        for source in self._source_tasks.get(
+            (task.forge_key, fingerprint), []
+        ):
+            if not self._get_task(*source).setup_failed:
+                return source
         return None
 
-    def _update_test_artifacts(self, test_index: int) -> None:
-        test_results = self._result_collector[test_index]
-        if test_results:
-            for task_index, test_result in enumerate(test_results):
-                task = self._get_task(test_index, task_index)
-                logger.debug(
-                    f"TEST RESULT {test_result} is dict - {isinstance(test_result, dict)}, test {task.test_key}, dep: {task.forge_key}, result {task.result}"
-                )
-                test_result = task.make_kwarg(test_result)
-                task.update_test_artifacts(test_result)
-                logger.debug(
-                    f"ARTIFACTS UPDATED dep: {task.forge_key}, test {task.test_key}, artifacts: {task._test.artifacts}"
-                )
+    def _update_test_artifacts(self, row_index: int, task_index: int) -> None:
+        """
+        Applies result of a finished task to the test artifacts. Artifacts
+        of the tasks placed later in the row take precedence, the same way
+        as if all results of the row were applied in order.
+        """
+        task = self._get_task(row_index, task_index)
+        test_result = task.make_kwarg(
+            self._result_collector[row_index][task_index]
+        )
+        owners = self._artifact_owners[row_index]
+        artifacts = {
+            k: v
+            for k, v in test_result.items()
+            if owners.get(k, -1) <= task_index
+        }
+        for k in artifacts:
+            owners[k] = task_index
+        task.update_test_artifacts(artifacts)
+        logger.debug(
+            f"ARTIFACTS UPDATED dep: {task.forge_key}, test {task.test_key}, artifacts: {task._test.artifacts}"
+        )
+
+    def _copy_result(self, src: tuple[int, int], dst: tuple[int, int]) -> None:
+        src_task = self._get_task(*src)
+        dst_row_i, dst_task_j = dst
+        self._result_collector[dst_row_i][dst_task_j] = src_task._result
+
+        dst_task = self._get_task(dst_row_i, dst_task_j)
+        if src_task._exec_id is not None:
+            dst_task.reuse_forge_execution(
+                src_task._exec_id,
+                src_task._result,
+                src_task._setup_errors,
+            )
+            dst_task.mark_as_executed()
+        self._update_test_artifacts(dst_row_i, dst_task_j)
+        self._mark_as_done(dst_task)
+        self._row_pending[dst_row_i] -= 1
+
+    def matched_rows(self, row_index: int, task_index: int) -> list[int]:
+        return [
+            dst[0]
+            for dst in self._matching_tasks.get((row_index, task_index), [])
+        ]
 
     def _copy_result_to_matching_tasks(
-        self, src_test_i: int, src_task_j: int
-    ) -> None:
-        src_task = self._get_task(src_test_i, src_task_j)
-        for dst, src in self._matched_tasks.items():
-            if src == (src_test_i, src_task_j):
-                dst_test_i, dst_task_j = dst
-
-                row = self._result_collector[dst_test_i]
-                if row is not None:
-                    row[dst_task_j] = src_task._result
-
-                    dst_task = self._get_task(dst_test_i, dst_task_j)
-                    if src_task._exec_id is not None:
-                        dst_task.reuse_forge_execution(
-                            src_task._exec_id,
-                            src_task._result,
-                            src_task._setup_errors,
-                        )
-                        dst_task.mark_as_executed()
-                        self._update_test_artifacts(dst_test_i)
+        self, src_row_i: int, src_task_j: int
+    ) -> list[int]:
+        src = (src_row_i, src_task_j)
+        updated_rows = []
+        for dst in self._matching_tasks.get(src, []):
+            self._copy_result(src, dst)
+            updated_rows.append(dst[0])
+        return updated_rows
 
-    def process_response(self, job: Job) -> None:
-        finished_task = self._get_task(job.test_index, job.task_index)
+    def process_response(self, job: Job) -> list[int]:
+        """
+        Registers finished job and propagates its result to the tasks
+        matched to it. Returns indexes of rows that have been completed
+        by this job.
+        """
+        finished_task = self._get_task(job.row_index, job.task_index)
         assert finished_task is job.task, "Task is not the same!"
         logger.debug(
             f"manager got finished task {job.id}, TEST KEY: {finished_task.test_key}, DEP KEY: {finished_task.forge_key}, DEP RES: {finished_task.result}, RES {job.task.result}"
         )
 
-        row = self._result_collector[job.test_index]
-        if row is not None:
-            row[job.task_index] = job.task.result
-            self._update_test_artifacts(job.test_index)
-            self._copy_result_to_matching_tasks(job.test_index, job.task_index)
-            self._done[job.id] = True
+        self._result_collector[job.row_index][job.task_index] = job.task.result
+        self._update_test_artifacts(job.row_index, job.task_index)
+        self._mark_as_done(job.task)
+        self._row_pending[job.row_index] -= 1
+        self._done[job.id] = True
+        self._pending_jobs -= 1
+        updated_rows = [job.row_index]
+        updated_rows += self._copy_result_to_matching_tasks(
+            job.row_index, job.task_index
+        )
+        logger.debug(f"manager is waiting for {self._pending_jobs} tasks")
+        return [row for row in updated_rows if self.is_row_done(row)]
+
+
+class TaskChainScheduler:
+    """
+    Schedules forge tasks as a dependency graph: each test has its own chain
+    of steps and the next step of a test is released as soon as all tasks of
+    its previous step are done, independently of the other tests. Identical
+    tasks of different tests are still executed only once.
+
+    Ready jobs are prioritized by the length of the remaining critical path
+    of the chains waiting for them, estimated from forge timings recorded in
+    previous sessions, so forges gating the longest chains start first.
+    """
+
+    def __init__(
+        self,
+        chains: list[TaskSetListType],
+        global_builtin_args_factory: Callable[
+            [ExecutableKeyType], Mapping[str, Any]
+        ],
+        timings: ForgeTimings | None = None,
+        on_task_done: Callable[[FrameworkTask], None] | None = None,
+    ) -> None:
+        self._proc = TaskGroupProcessor(
+            global_builtin_args_factory, on_task_done
+        )
+        self._chains: list[TaskSetListType] = []
+        self._timings = timings
+        self._cursors: list[int] = []
+        self._pending_steps = 0
+        self._row_to_chain: dict[int, int] = {}
+        self._row_to_step: dict[int, int] = {}
+        self._ready_jobs: list[TaskGroupProcessor.Job] = []
+        self._chain_tails: list[list[float]] = []
+        self._push_chains(chains)
+
+    def _push_chains(self, chains: list[TaskSetListType]) -> None:
+        first_index = len(self._chains)
+        self._chains += chains
+        self._cursors += [0] * len(chains)
+        self._pending_steps += sum(len(chain) for chain in chains)
+        self._chain_tails += [self._estimate_tails(chain) for chain in chains]
+        for chain_index in range(first_index, len(self._chains)):
+            self._advance(chain_index)
+
+    def add_chains(
+        self, chains: list[TaskSetListType]
+    ) -> list[TaskGroupProcessor.Job]:
+        """
+        Adds chains to the scheduled ones and returns jobs that are ready
+        to be executed.
+        """
+        self._push_chains(chains)
+        return self.pop_ready_jobs()
+
+    def _estimate(self, task: FrameworkTask) -> float:
+        if self._timings is None:
+            return 0.0
+        return self._timings.estimate(task)
+
+    def _estimate_tails(self, chain: TaskSetListType) -> list[float]:
+        """
+        Returns estimated duration of the chain part following each step.
+        """
+        tails = [0.0] * len(chain)
+        for step_index in range(len(chain) - 2, -1, -1):
+            next_step = chain[step_index + 1]
+            step_duration = max(
+                (self._estimate(task) for task in next_step or []),
+                default=0.0,
+            )
+            tails[step_index] = tails[step_index + 1] + step_duration
+        return tails
+
+    def _row_tail(self, row_index: int) -> float:
+        chain_index = self._row_to_chain[row_index]
+        return self._chain_tails[chain_index][self._row_to_step[row_index]]
+
+    def _prioritize(self, job: TaskGroupProcessor.Job) -> None:
+        rows = [job.row_index]
+        rows += self._proc.matched_rows(job.row_index, job.task_index)
+        job.priority = self._estimate(job.task) + max(
+            self._row_tail(row) for row in rows
+        )
+        job.dependents = len(rows)
+
+    @property
+    def all_tasks_done(self) -> bool:
+        return self._pending_steps == 0 and self._proc.all_tasks_done
+
+    def _advance(self, chain_index: int) -> None:
+        chain = self._chains[chain_index]
+        while self._cursors[chain_index] < len(chain):
+            step_index = self._cursors[chain_index]
+            step_tasks = chain[step_index]
+            self._cursors[chain_index] += 1
+            self._pending_steps -= 1
+            if not step_tasks:
+                continue
+
+            row_index, jobs = self._proc.push(step_tasks)
+            self._row_to_chain[row_index] = chain_index
+            self._row_to_step[row_index] = step_index
+            self._ready_jobs += jobs
+            if not self._proc.is_row_done(row_index):
+                break
+
+    def pop_ready_jobs(self) -> list[TaskGroupProcessor.Job]:
+        """
+        Returns ready jobs ordered by priority, the most critical first.
+        """
+        jobs, self._ready_jobs = self._ready_jobs, []
+        for job in jobs:
+            self._prioritize(job)
+        jobs.sort(key=lambda job: job.sort_key)
+        if jobs:
             logger.debug(
-                f"manager is waiting for tasks {self._done}, results: {self._result_collector}"
+                "Ready jobs priorities: "
+                + ", ".join(
+                    f"{job.task.forge_full_path}={job.priority:.2f}"
+                    for job in jobs
+                )
+            )
+        return jobs
+
+    def process_response(
+        self, job: TaskGroupProcessor.Job
+    ) -> list[TaskGroupProcessor.Job]:
+        if self._timings is not None:
+            self._timings.record(job.task)
+        for row_index in self._proc.process_response(job):
+            self._advance(self._row_to_chain[row_index])
+        return self.pop_ready_jobs()
+
+
+class JobQueue:
+    """
+    Thread safe queue returning jobs with the highest priority first and
+    jobs of the same priority in order they were added. None, used as a
+    stop signal, is returned after all queued jobs.
+    """
+
+    def __init__(self) -> None:
+        self._queue: PriorityQueue[
+            tuple[tuple[float, int], int, TaskGroupProcessor.Job | None]
+        ] = PriorityQueue()
+        self._counter = itertools.count()
+
+    def put(self, job: TaskGroupProcessor.Job | None) -> None:
+        if job is not None:
+            job.queued_at = session_tracer.now()
+        sort_key = (math.inf, 0) if job is None else job.sort_key
+        self._queue.put((sort_key, next(self._counter), job))
+
+    def get(
+        self, timeout: float | None = None
+    ) -> TaskGroupProcessor.Job | None:
+        return self._queue.get(timeout=timeout)[2]
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def task_done(self) -> None:
+        self._queue.task_done()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+
+class ProbeScheduler:
+    """
+    Keeps jobs waiting for their probes in a single heap ordered by the
+    time of the next probe invocation. One timer thread hands each job
+    over to on_due callback as soon as its probe interval elapses, so
+    waiting probes do not occupy worker threads.
+    """
+
+    def __init__(
+        self, on_due: Callable[[TaskGroupProcessor.Job], None]
+    ) -> None:
+        self._on_due = on_due
+        self._heap: list[tuple[float, int, TaskGroupProcessor.Job]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self.timer_thread, name="ucc-modinput-test-probe-timer"
+        )
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def schedule(self, job: TaskGroupProcessor.Job, interval: float) -> None:
+        due_time = time.monotonic() + interval
+        with self._condition:
+            heapq.heappush(self._heap, (due_time, next(self._counter), job))
+            self._condition.notify()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+
+    @log_exceptions_traceback
+    def timer_thread(self) -> None:
+        with self._condition:
+            while not self._stopped:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                time_left = self._heap[0][0] - time.monotonic()
+                if time_left > 0:
+                    self._condition.wait(time_left)
+                    continue
+                _, _, job = heapq.heappop(self._heap)
+                self._on_due(job)
+
+
+# forge key and forge execution id
+TeardownKeyType = Tuple[ExecutableKeyType, str]
+
+
+class TeardownPlanner:
+    """
+    Executes deferred teardowns of forge executions in parallel. Forges
+    assigned to a test are torn down in reverse order of the assignment,
+    so teardown of an execution starts when teardowns of executions of
+    all next forge assignments of all tests using it are finished.
+    """
+
+    def __init__(self, chains: list[TaskSetListType]) -> None:
+        self._tasks: dict[TeardownKeyType, FrameworkTask] = {}
+        self._waits_for: dict[TeardownKeyType, set[TeardownKeyType]] = {}
+        for chain in chains:
+            self._add_chain(chain)
+
+    def _add_chain(self, chain: TaskSetListType) -> None:
+        # earlier forge assignments wait for the closest next assignments
+        # with pending teardowns, the rest of chain is waited transitively
+        next_keys: list[TeardownKeyType] = []
+        for step_tasks in reversed(chain):
+            step_keys = []
+            for task in step_tasks or []:
+                if task.exec_id is None or not task.is_teardown_pending:
+                    continue
+                key = (task.forge_key, task.exec_id)
+                # errors are reported by the first task of the execution
+                self._tasks.setdefault(key, task)
+                self._waits_for.setdefault(key, set()).update(
+                    k for k in next_keys if k != key
+                )
+                step_keys.append(key)
+            if step_keys:
+                next_keys = step_keys
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def tasks(self) -> list[FrameworkTask]:
+        return list(self._tasks.values())
+
+    def execute(self, max_workers: int) -> None:
+        waits_for = {key: set(keys) for key, keys in self._waits_for.items()}
+        waited_by: dict[TeardownKeyType, list[TeardownKeyType]] = {}
+        for key, keys in waits_for.items():
+            for k in keys:
+                waited_by.setdefault(k, []).append(key)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="session-teardown"
+        ) as pool:
+            running: dict[
+                concurrent.futures.Future[None], TeardownKeyType
+            ] = {}
+
+            def submit_ready(keys: list[TeardownKeyType]) -> None:
+                for key in keys:
+                    if not waits_for[key]:
+                        del waits_for[key]
+                        task = self._tasks[key]
+                        running[pool.submit(task.deferred_teardown)] = key
+
+            submit_ready(list(waits_for))
+            while running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    key = running.pop(future)
+                    for k in waited_by.get(key, []):
+                        waits_for[k].discard(key)
+                    submit_ready(waited_by.get(key, []))
+
+        if waits_for:
+            # tests assigned the same forges in different order
+            logger.warning(
+                f"Teardowns of {len(waits_for)} forge executions have cyclic dependencies and are executed one by one"
             )
+            for key in waits_for:
+                self._tasks[key].deferred_teardown()
 
 
 class FrmwkExecutorBase:
+    # executor can receive more tasks while executing previous ones
+    supports_streaming = False
+
     def __init__(self, manager: TestDependencyManager) -> None:
         self._manager = manager
+        self._resources = manager.resource_limiter
+        self._is_free: threading.Event = threading.Event()
+        self._is_free.set()
+
+    def start(self, tasks: list[TaskSetListType]) -> None:
+        raise NotImplementedError
+
+    def extend(self, tasks: list[TaskSetListType]) -> None:
+        raise NotImplementedError
 
     def shutdown(self) -> None:
         pass
 
-    def wait(self, is_bootstrap: bool) -> None:
-        pass
+    def wait(self, is_bootstrap: bool = True) -> None:
+        if is_bootstrap:
+            wait_timeout = self._manager.bootstrap_wait_timeout
+            task_type = "bootstrap"
+        else:
+            wait_timeout = self._manager.attached_tasks_wait_timeout
+            task_type = "attached"
+
+        # the event is set as soon as executor finishes processing tasks,
+        # completion_check_frequency only defines how often waiting is logged
+        expiration = time.time() + wait_timeout
+        while True:
+            time_left = expiration - time.time()
+            check_interval = self._manager.completion_check_frequency
+            if self._is_free.wait(max(min(time_left, check_interval), 0)):
+                break
+            if time.time() >= expiration:
+                msg = f"Waiting for executor to process all {task_type} tasks exceeded timeout {wait_timeout} seconds."
+                logger.error(msg)
+                raise SplTaFwkWaitForDependenciesTimeout(msg)
+            logger.debug(
+                f"Still waiting for executor to process all {task_type} tasks"
+            )
+
+    def _make_scheduler(
+        self, tasks: list[TaskSetListType]
+    ) -> TaskChainScheduler:
+        return TaskChainScheduler(
+            tasks,
+            self.global_builtin_args_factory,
+            self._manager.forge_timings,
+            self._manager.tasks.task_done,
+        )
 
     def global_builtin_args_factory(
         self, test_key: ExecutableKeyType
-    ) -> ArtifactsType:
+    ) -> Mapping[str, Any]:
         return self._manager.get_global_builtin_args(test_key)
 
     def _execute_request(
@@ -243,38 +708,86 @@ class FrmwkExecutorBase:
 class FrmwkSequentialExecutor(FrmwkExecutorBase):
     def start(self, tasks: list[TaskSetListType]) -> None:
         logger.debug(f"sequential executor has started with tasks {tasks}")
-        for task_group in tasks:
-            proc = TaskGroupProcessor(
-                task_group, self.global_builtin_args_factory
-            )
-            for job in proc.jobs:
-                self._execute_request(job)
-                proc.process_response(job)
+        scheduler = self._make_scheduler(tasks)
+        jobs = JobQueue()
+        for ready_job in scheduler.pop_ready_jobs():
+            jobs.put(ready_job)
+        while not jobs.empty():
+            job = jobs.get()
+            assert job is not None
+            # only rate limits can delay tasks executed one by one
+            delay = self._resources.try_acquire(job.task.resources)
+            while delay:
+                time.sleep(min(delay, WorkerPool.CHECK_INTERVAL.value))
+                delay = self._resources.try_acquire(job.task.resources)
+            busy_start = time.monotonic()
+            self._execute_request(job)
+            latency_stats.add_worker_time(time.monotonic() - busy_start)
+            self._resources.release(job.task.resources)
+            for ready_job in scheduler.process_response(job):
+                jobs.put(ready_job)
 
         logger.debug("sequential executor has finished")
 
 
 class FrmwkParallelExecutor(FrmwkExecutorBase):
+    """
+    Executes tasks in a pool of worker threads. A worker executes forge
+    and invokes its probe, after that the job is handed over to the probe
+    scheduler until the next probe invocation, so the worker is released
+    for other jobs. Async probes are awaited in the framework event loop.
+
+    Jobs of forges declared with resources are held by the manager thread
+    until resources limits allow their execution, and resources are
+    released when the job, including its probe, is finished.
+
+    The pool starts with worker_count threads and grows up to
+    max_worker_count threads when jobs are waiting in the queue while all
+    workers are blocked by long running jobs. Workers added this way are
+    stopped after being idle for WorkerPool.IDLE_TIMEOUT seconds.
+    """
+
+    supports_streaming = True
+
     def __init__(
-        self, manager: TestDependencyManager, worker_count: int = 10
+        self,
+        manager: TestDependencyManager,
+        worker_count: int = 10,
+        max_worker_count: int | None = None,
     ) -> None:
         super().__init__(manager)
         self.worker_count = worker_count
-        self.task_queue: Queue[TaskGroupProcessor.Job | None] = Queue()
+        self.max_worker_count = max(worker_count, max_worker_count or 0)
+        self.task_queue = JobQueue()
         self._manager_queue: Queue[
             list[TaskSetListType] | TaskGroupProcessor.Job | None
         ] = Queue()
-        self._is_free: threading.Event = threading.Event()
+        self._pool_lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+        self._running: dict[int, float] = {}
+        self._live_workers = 0
+        self._next_worker_id = 0
+        self.threads: list[threading.Thread] = []
+        self._probe_scheduler = ProbeScheduler(self.task_queue.put)
+        self._held_jobs: list[TaskGroupProcessor.Job] = []
+        self._held_jobs_delay: float = math.inf
+        self._is_free.clear()
         self.deploy()
 
-    def deploy(self) -> None:
-        self.threads = [
-            threading.Thread(target=self.worker_thread, args=(index,))
-            for index in range(self.worker_count)
-        ]
+    def _add_worker(self) -> None:
+        # must be called with self._pool_lock acquired
+        thread = threading.Thread(
+            target=self.worker_thread, args=(self._next_worker_id,)
+        )
+        self._next_worker_id += 1
+        self._live_workers += 1
+        self.threads.append(thread)
+        thread.start()
 
-        for thread in self.threads:
-            thread.start()
+    def deploy(self) -> None:
+        with self._pool_lock:
+            for _ in range(self.worker_count):
+                self._add_worker()
 
         self._manager_thread = threading.Thread(target=self.manager_thread)
         self._manager_thread.start()
@@ -283,23 +796,65 @@ class FrmwkParallelExecutor(FrmwkExecutorBase):
         self._is_free.set()
         logger.debug("FrmwkParallelExecutor is set free")
 
-    def wait(self, is_bootstrap: bool = True) -> None:
-        if is_bootstrap:
-            wait_timeout = self._manager.bootstrap_wait_timeout
-            task_type = "bootstrap"
-        else:
-            wait_timeout = self._manager.attached_tasks_wait_timeout
-            task_type = "attached"
+    @staticmethod
+    def pool_growth(
+        size: int,
+        queued: int,
+        running_since: Iterable[float],
+        now: float,
+        limit: int,
+    ) -> int:
+        """
+        Returns number of workers to add to the pool of given size. The
+        pool grows by the number of queued jobs, up to the limit, only
+        when every worker has been running its job for at least
+        WorkerPool.CHECK_INTERVAL seconds, so the growth does not depend
+        on the check at which individual workers become blocked.
+        """
+        blocked_since = now - WorkerPool.CHECK_INTERVAL.value
+        started = list(running_since)
+        if queued <= 0 or len(started) < size:
+            return 0
+        if any(start > blocked_since for start in started):
+            return 0
+        return max(min(queued, limit - size), 0)
 
-        expiration = time.time() + wait_timeout
-        while not self._is_free.wait(self._manager.completion_check_frequency):
-            if time.time() > expiration:
-                msg = f"Waiting for executor to process all {task_type} tasks exceeded timeout {wait_timeout} seconds."
-                logger.error(msg)
-                raise SplTaFwkWaitForDependenciesTimeout(msg)
-            logger.debug(
-                f"Still waiting for executor to process all {task_type} tasks"
+    def _adjust_pool(self) -> None:
+        with self._pool_lock:
+            size = self._live_workers
+            queued = self.task_queue.qsize()
+            growth = self.pool_growth(
+                size,
+                queued,
+                self._running.values(),
+                time.monotonic(),
+                self.max_worker_count,
             )
+            if growth <= 0:
+                return
+            for _ in range(growth):
+                self._add_worker()
+
+        logger.info(
+            f"Worker pool grows from {size} to {size + growth} threads: "
+            f"queued jobs: {queued}, all workers are blocked, "
+            f"limit: {self.max_worker_count}"
+        )
+
+    def _retire_worker(self, wid: int) -> bool:
+        with self._pool_lock:
+            size = self._live_workers
+            # jobs queued after the idle timeout expired are picked first
+            if size <= self.worker_count or self.task_queue.qsize():
+                return False
+            self._live_workers -= 1
+
+        logger.info(
+            f"Worker pool shrinks from {size} to {size - 1} threads: "
+            f"worker {wid} was idle for {WorkerPool.IDLE_TIMEOUT.value} "
+            "seconds"
+        )
+        return True
 
     def start(self, tasks: list[TaskSetListType]) -> None:
         logger.debug("FrmwkParallelExecutor::start - wait for previoues tasks")
@@ -307,17 +862,29 @@ class FrmwkParallelExecutor(FrmwkExecutorBase):
         logger.debug(
             "FrmwkParallelExecutor::start - executer is about to set busy"
         )
-        self._is_free.clear()
-        logger.debug("FrmwkParallelExecutor is set busy")
-        logger.debug("FrmwkParallelExecutor::start - sending tasks to manager")
-        self._manager_queue.put(tasks)
+        self._submit(tasks)
         logger.debug("started")
 
+    def extend(self, tasks: list[TaskSetListType]) -> None:
+        """
+        Adds tasks to the ones being executed without waiting for them,
+        or starts their execution if executor is free.
+        """
+        self._submit(tasks)
+        logger.debug("extended")
+
+    def _submit(self, tasks: list[TaskSetListType]) -> None:
+        with self._submit_lock:
+            self._is_free.clear()
+            logger.debug("FrmwkParallelExecutor is set busy")
+            self._manager_queue.put(tasks)
+
     def shutdown(self) -> None:
         logger.debug("Sending shutdown command to executor...")
         self._manager_queue.put(None)
         logger.debug("Waiting for executor to shutdown...")
         self._manager_thread.join()
+        self._probe_scheduler.stop()
         logger.info("Executor has shutdown.")
 
     def _receive_tasks(
@@ -336,17 +903,45 @@ class FrmwkParallelExecutor(FrmwkExecutorBase):
             return True, []
         return False, tasks
 
-    def _collect_results(self, proc: TaskGroupProcessor) -> bool:
-        while not proc.all_tasks_done:
-            job = self._manager_queue.get()
+    def _dispatch(self, jobs: list[TaskGroupProcessor.Job]) -> None:
+        candidates = self._held_jobs + jobs
+        if self._held_jobs:
+            candidates.sort(key=lambda job: job.sort_key)
+        self._held_jobs = []
+        self._held_jobs_delay = math.inf
+        for job in candidates:
+            delay = self._resources.try_acquire(job.task.resources)
+            if delay:
+                self._held_jobs.append(job)
+                self._held_jobs_delay = min(self._held_jobs_delay, delay)
+            else:
+                self.task_queue.put(job)
+        self._adjust_pool()
+
+    def _collect_results(self, scheduler: TaskChainScheduler) -> bool:
+        while not scheduler.all_tasks_done:
+            try:
+                job = self._manager_queue.get(
+                    timeout=min(
+                        WorkerPool.CHECK_INTERVAL.value,
+                        self._held_jobs_delay,
+                    )
+                )
+            except Empty:
+                self._dispatch([])
+                continue
+
             logger.debug(f"manager got finished task {job}")
             if job is None:
                 logger.debug("manager is interrupted")
                 return True
 
             if isinstance(job, TaskGroupProcessor.Job):
-                proc.process_response(job)
-                self._manager_queue.task_done()
+                self._resources.release(job.task.resources)
+                self._dispatch(scheduler.process_response(job))
+            else:
+                self._dispatch(scheduler.add_chains(job))
+            self._manager_queue.task_done()
 
         return False
 
@@ -357,37 +952,234 @@ class FrmwkParallelExecutor(FrmwkExecutorBase):
         while not interrupted:
             interrupted, tasks = self._receive_tasks()
             logger.debug(f"manager got tasks {tasks}")
-            if isinstance(tasks, list):
-                for task_group in tasks:
-                    proc = TaskGroupProcessor(
-                        task_group, self.global_builtin_args_factory
-                    )
-                    for job in proc.jobs:
-                        self.task_queue.put(job)
+            if not interrupted and isinstance(tasks, list):
+                self._held_jobs = []
+                scheduler = self._make_scheduler(tasks)
+                self._dispatch(scheduler.pop_ready_jobs())
+                interrupted = self._collect_results(scheduler)
 
-                    interrupted = self._collect_results(proc)
-                    if interrupted:
-                        break
+            with self._submit_lock:
+                # tasks submitted meanwhile are executed by next scheduler
+                if interrupted or self._manager_queue.empty():
+                    self._is_free.set()
+                    logger.debug("FrmwkParallelExecutor is set free")
 
-            self._is_free.set()
-            logger.debug("FrmwkParallelExecutor is set free")
+        with self._pool_lock:
+            live_workers = self._live_workers
+            threads = list(self.threads)
 
-        for _ in self.threads:
+        for _ in range(live_workers):
             self.task_queue.put(None)
 
-        for thread in self.threads:
+        for thread in threads:
             thread.join()
 
         logger.debug("manager has finished")
 
+    def _complete_job(self, job: TaskGroupProcessor.Job) -> None:
+        try:
+            job.task.finish_execution()
+        except Exception as e:
+            logger.error(
+                f"task {job.id} - {job.task} failed to finish execution with error {e}\n{traceback.format_exc()}"
+            )
+        self._manager_queue.put(job)
+
+    def _process_job(self, job: TaskGroupProcessor.Job, wid: int) -> None:
+        """
+        Executes the next step of the job: forge execution followed by the
+        first probe invocation or the next probe invocation.
+        """
+        task = job.task
+        interval = None
+        try:
+            if task.is_probing:
+                interval = task.probe_step()
+            else:
+                logger.debug(
+                    f"worker {wid}, task started {job.id}, task: {id(task)} - {task}, dep: {id(task._forge)} - {task._forge} - {task.forge_key}, call_args: {task._forge_kwargs}"
+                )
+                if task.execute_forge_step():
+                    if task.has_async_probe:
+                        future = framework_loop.submit(task.probe_async())
+                        future.add_done_callback(
+                            lambda _: self._complete_job(job)
+                        )
+                        return
+                    interval = task.probe_step()
+        except Exception as e:
+            logger.error(
+                f"worker {wid}, task {job.id} - {task} failed with error {e}\n{traceback.format_exc()}"
+            )
+
+        if interval is None:
+            self._complete_job(job)
+        else:
+            logger.debug(
+                f"worker {wid}, task {job.id} probe is scheduled in {interval} seconds"
+            )
+            self._probe_scheduler.schedule(job, interval)
+
     @log_exceptions_traceback
     def worker_thread(self, wid: int) -> None:
+        idle_start = time.monotonic()
         while True:
-            job = self.task_queue.get()
+            try:
+                job = self.task_queue.get(
+                    timeout=WorkerPool.IDLE_TIMEOUT.value
+                )
+            except Empty:
+                if self._retire_worker(wid):
+                    break
+                continue
+
             logger.debug(f"worker {wid} task recieved {job}")
             if job is None:
                 break
+            session_tracer.add_span(
+                "queue wait",
+                "executor",
+                job.queued_at,
+                session_tracer.now(),
+                job.task.trace_args,
+            )
 
-            self._execute_request(job, wid)
+            busy_start = time.monotonic()
+            with self._pool_lock:
+                self._running[wid] = busy_start
+            self._process_job(job, wid)
+            with self._pool_lock:
+                del self._running[wid]
+            busy_end = time.monotonic()
+            latency_stats.add_worker_time(
+                busy_end - busy_start, busy_start - idle_start
+            )
+            idle_start = busy_end
             self.task_queue.task_done()
-            self._manager_queue.put(job)
+        latency_stats.add_worker_time(0.0, time.monotonic() - idle_start)
+
+
+class FrmwkAsyncioExecutor(FrmwkExecutorBase):
+    """
+    Executes tasks as coroutines in the framework event loop. Async forges
+    and probes are awaited directly, while regular ones are offloaded to a
+    thread pool, so the number of concurrently executed tasks is limited
+    by max_concurrency rather than by the number of threads. Coroutines of
+    forges declared with resources wait for resources limits before that.
+    """
+
+    def __init__(
+        self,
+        manager: TestDependencyManager,
+        max_concurrency: int = 1000,
+        worker_count: int = 10,
+    ) -> None:
+        super().__init__(manager)
+        self.max_concurrency = max_concurrency
+        self.worker_count = worker_count
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=worker_count,
+            thread_name_prefix="ucc-modinput-test-worker",
+        )
+        self._future: concurrent.futures.Future[None] | None = None
+        framework_loop.submit(self._deploy()).result()
+
+    async def _deploy(self) -> None:
+        loop = asyncio.get_event_loop()
+        loop.set_default_executor(self._thread_pool)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._resources_released = asyncio.Condition()
+        logger.debug("FrmwkAsyncioExecutor is deployed")
+
+    def start(self, tasks: list[TaskSetListType]) -> None:
+        logger.debug("FrmwkAsyncioExecutor::start - wait for previoues tasks")
+        self.wait()
+        self._is_free.clear()
+        logger.debug("FrmwkAsyncioExecutor is set busy")
+        self._future = framework_loop.submit(self.manager_coroutine(tasks))
+        self._future.add_done_callback(lambda _: self._is_free.set())
+        logger.debug("started")
+
+    def shutdown(self) -> None:
+        logger.debug("Waiting for executor to shutdown...")
+        if self._future is not None:
+            self._future.cancel()
+        self._thread_pool.shutdown(wait=True)
+        logger.info("Executor has shutdown.")
+
+    async def _acquire_resources(self, job: TaskGroupProcessor.Job) -> None:
+        if not job.task.resources:
+            return
+        async with self._resources_released:
+            delay = self._resources.try_acquire(job.task.resources)
+            while delay:
+                timeout = None if math.isinf(delay) else delay
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._resources_released.wait(), timeout
+                    )
+                delay = self._resources.try_acquire(job.task.resources)
+
+    async def _release_resources(self, job: TaskGroupProcessor.Job) -> None:
+        if not job.task.resources:
+            return
+        async with self._resources_released:
+            self._resources.release(job.task.resources)
+            self._resources_released.notify_all()
+
+    async def _execute_request_async(
+        self, job: TaskGroupProcessor.Job
+    ) -> TaskGroupProcessor.Job:
+        job.queued_at = session_tracer.now()
+        await self._acquire_resources(job)
+        try:
+            await self._execute_with_semaphore(job)
+        finally:
+            await self._release_resources(job)
+        return job
+
+    async def _execute_with_semaphore(
+        self, job: TaskGroupProcessor.Job
+    ) -> None:
+        async with self._semaphore:
+            session_tracer.add_span(
+                "queue wait",
+                "executor",
+                job.queued_at,
+                session_tracer.now(),
+                job.task.trace_args,
+                is_async=True,
+            )
+            task_info = f"{job.id}, task: {id(job.task)} - {job.task}, dep: {id(job.task._forge)} - {job.task._forge} - {job.task.forge_key}, call_args: {job.task._forge_kwargs}"
+            busy_start = time.monotonic()
+            try:
+                logger.debug(f"coroutine task started {task_info}")
+                await job.task.execute_async()
+            except Exception as e:
+                logger.debug(
+                    f"coroutine task failed {task_info} with error {e}\n{traceback.format_exc()}"
+                )
+            else:
+                logger.debug(
+                    f"coroutine task finished {task_info} with result: {job.task.result}"
+                )
+            latency_stats.add_worker_time(time.monotonic() - busy_start)
+
+    @log_exceptions_traceback
+    async def manager_coroutine(self, tasks: list[TaskSetListType]) -> None:
+        logger.debug("manager coroutine has started")
+        scheduler = self._make_scheduler(tasks)
+        pending = {
+            asyncio.ensure_future(self._execute_request_async(job))
+            for job in scheduler.pop_ready_jobs()
+        }
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for finished in done:
+                for job in scheduler.process_response(finished.result()):
+                    pending.add(
+                        asyncio.ensure_future(self._execute_request_async(job))
+                    )
+        logger.debug("manager coroutine has finished")
@@ -20,7 +20,10 @@ from splunk_add_on_ucc_modinput_test.typing import (
     ProbeFnType,
     TestFnType,
 )
+import threading
 import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from typing import (
     Any,
@@ -30,10 +33,12 @@ from typing import (
     List,
     Tuple,
     Optional,
+    Sequence,
     Type,
     Union,
     Set,
 )
+from splunk_add_on_ucc_modinput_test.common.otlp import otlp_tracer
 from splunk_add_on_ucc_modinput_test.functional import logger
 from splunk_add_on_ucc_modinput_test.functional.exceptions import (
     SplTaFwkDependencyExecutionError,
@@ -53,8 +58,36 @@ from splunk_add_on_ucc_modinput_test.functional.entities import (
     TaskSetListType,
 )
 from splunk_add_on_ucc_modinput_test.functional.executor import (
+    FrmwkAsyncioExecutor,
+    FrmwkExecutorBase,
     FrmwkParallelExecutor,
     FrmwkSequentialExecutor,
+    TeardownPlanner,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.client_pool import (
+    ClientPool,
+    GlobalBuiltinArgs,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.event_loop import (
+    framework_loop,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_cache import (
+    forge_result_cache,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_timings import (
+    ForgeTimings,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.process_pool import (
+    forge_process_pool,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.resource_limits import (
+    ResourceLimiter,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.tracing import (
+    session_tracer,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_profiler import (
+    forge_profiler,
 )
 from splunk_add_on_ucc_modinput_test.functional.splunk import (
     SplunkClientBase,
@@ -74,6 +107,28 @@ from splunk_add_on_ucc_modinput_test.functional.common.identifier_factory import
 )
 
 
+class resource:
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrency: Optional[int] = 1,
+        rate_limit: Optional[float] = None,
+        burst: int = 1,
+    ) -> None:
+        assert (
+            max_concurrency is None or max_concurrency > 0
+        ), f"Resource {name} max_concurrency must be positive"
+        assert (
+            rate_limit is None or rate_limit > 0
+        ), f"Resource {name} rate_limit must be positive"
+        assert burst > 0, f"Resource {name} burst must be positive"
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.burst = burst
+
+
 class forge:
     def __init__(
         self,
@@ -81,10 +136,18 @@ class forge:
         *,
         probe: Optional[ProbeFnType] = None,
         scope: Optional[Union[ForgeScope, str]] = None,
+        use_process_pool: bool = False,
+        cache_version: Optional[str] = None,
+        cache_cleanup: Optional[Callable[..., Any]] = None,
+        resources: Sequence[resource] = (),
         **kwargs: Any,
     ) -> None:
         self.forge_fn = forge_fn
         self.probe = probe
+        self.use_process_pool = use_process_pool
+        self.cache_version = cache_version
+        self.cache_cleanup = cache_cleanup
+        self.resources = tuple(resources)
         self.scope = scope.value if isinstance(scope, ForgeScope) else scope
         self.kwargs: ArtifactsType = kwargs
 
@@ -105,26 +168,26 @@ class TestDependencyManager(PytestConfigAdapter):
         self.tests = TestCollection()
         self.forges = ForgeCollection()
         self.tasks = TaskCollection()
-        self.executor: Optional[
-            Union[FrmwkSequentialExecutor, FrmwkParallelExecutor]
-        ] = None
-        self._vendor_clients = {
-            BuiltInArg.VENDOR_CLIENT.value: (
-                VendorClientBase,
-                VendorConfigurationBase,
-            )
-        }
-        self._splunk_clients = {
-            BuiltInArg.SPLUNK_CLIENT.value: (
-                SplunkClientBase,
-                SplunkConfigurationBase,
-            )
-        }
+        self.executor: Optional[FrmwkExecutorBase] = None
+        self.forge_timings = ForgeTimings()
+        self._client_pool = ClientPool()
+        self.resource_limiter = ResourceLimiter()
+        self.set_vendor_client_class()
+        self.set_splunk_client_class()
         self._pytest_config = None
         self._session_id = self.generate_session_id()
         self._global_builtin_args_pool: Dict[
-            ExecutableKeyType, ArtifactsType
+            ExecutableKeyType, GlobalBuiltinArgs
         ] = {}
+        self._tests_to_stream: List[ExecutableKeyType] = []
+        self._streamed_tests: Set[ExecutableKeyType] = set()
+        self._speculative_tasks: List[FrameworkTask] = []
+        self._teardown_pool: Optional[ThreadPoolExecutor] = None
+        self._teardowns_lock = threading.Lock()
+        self._background_teardowns: Dict[
+            ExecutableKeyType, Tuple[FrameworkTest, Future[None]]
+        ] = {}
+        self._finished_teardowns: List[FrameworkTest] = []
 
     @staticmethod
     def generate_session_id() -> str:
@@ -148,9 +211,12 @@ class TestDependencyManager(PytestConfigAdapter):
         ), "Custom Splunk client argument name must comply with Python variable name requirements"
         assert issubclass(vendor_client_class, VendorClientBase)
         assert issubclass(vendor_configuration_class, VendorConfigurationBase)
-        self._vendor_clients[vendor_class_argument_name] = (
-            vendor_client_class,
-            vendor_configuration_class,
+        self._client_pool.register(
+            vendor_class_argument_name,
+            self._make_client_factory(
+                vendor_client_class, vendor_configuration_class
+            ),
+            vendor_client_class.shared_between_tests,
         )
 
     def set_splunk_client_class(
@@ -169,41 +235,41 @@ class TestDependencyManager(PytestConfigAdapter):
         ), "Custom Splunk client argument name must comply with Python variable name requirements"
         assert issubclass(splunk_client_class, SplunkClientBase)
         assert issubclass(splunk_configuration_class, SplunkConfigurationBase)
-        self._splunk_clients[splunk_class_argument_name] = (
-            splunk_client_class,
-            splunk_configuration_class,
+        self._client_pool.register(
+            splunk_class_argument_name,
+            self._make_client_factory(
+                splunk_client_class, splunk_configuration_class
+            ),
+            splunk_client_class.shared_between_tests,
         )
 
-    def create_global_builtin_args(
+    def _make_client_factory(
         self,
-    ) -> Dict[str, Union[str, VendorClientBase, SplunkClientBase]]:
-        global_builtin_args: Dict[
-            str, Union[str, VendorClientBase, SplunkClientBase]
-        ] = {
-            BuiltInArg.SESSION_ID.value: self.session_id,
-        }
-
-        for v_prop, (v_client, v_config) in self._vendor_clients.items():
-            if self._pytest_config is not None:
-                v_conf_instance = v_config(self._pytest_config)
-                global_builtin_args[v_prop] = v_client(v_conf_instance)
+        client_class: Type[Union[VendorClientBase, SplunkClientBase]],
+        configuration_class: Type[
+            Union[VendorConfigurationBase, SplunkConfigurationBase]
+        ],
+    ) -> Callable[[], Union[VendorClientBase, SplunkClientBase]]:
+        def create_client() -> Union[VendorClientBase, SplunkClientBase]:
+            assert self._pytest_config is not None
+            conf_instance = configuration_class(self._pytest_config)
+            client = client_class(conf_instance)  # type: ignore[arg-type]
             logger.debug(
-                f"create_global_builtin_args, vendor: {v_prop}, v_config={v_conf_instance} config_id={id(v_conf_instance)}, v_client: {global_builtin_args[v_prop]}"
+                f"create client: {client_class.__name__}, config={conf_instance} config_id={id(conf_instance)}, client: {client}"
             )
+            return client
 
-        for s_prop, (s_client, s_config) in self._splunk_clients.items():
-            if self._pytest_config is not None:
-                conf_instance = s_config(self._pytest_config)
-                global_builtin_args[s_prop] = s_client(conf_instance)
-            logger.debug(
-                f"create_global_builtin_args, splunk: {s_prop}, s_config={conf_instance} config_id={id(conf_instance)}, s_client: {global_builtin_args[s_prop]}"
-            )
+        return create_client
 
-        return global_builtin_args
+    def create_global_builtin_args(self) -> GlobalBuiltinArgs:
+        return GlobalBuiltinArgs(
+            self._client_pool,
+            {BuiltInArg.SESSION_ID.value: self.session_id},
+        )
 
     def get_global_builtin_args(
         self, test_key: ExecutableKeyType
-    ) -> Dict[str, Any]:
+    ) -> GlobalBuiltinArgs:
         if test_key not in self._global_builtin_args_pool:
             logger.debug(f"create_global_builtin_args for test {test_key}:")
             self._global_builtin_args_pool[
@@ -259,6 +325,8 @@ class TestDependencyManager(PytestConfigAdapter):
         if not test:
             test = FrameworkTest(test_fn)
             self.tests.add(test)
+            if self.stream_bootstrap:
+                self._tests_to_stream.append(test.key)
 
         frg_group_scope = self._interpret_scope(scope, test)
 
@@ -279,9 +347,24 @@ class TestDependencyManager(PytestConfigAdapter):
                 frg_scope = ForgeScope.SESSION.value
 
             frg = self.forge_find_or_make(f.forge_fn, frg_scope, is_bootstrap)
+            for res in f.resources:
+                self.resource_limiter.register(
+                    res.name, res.max_concurrency, res.rate_limit, res.burst
+                )
 
             frg_list.append(
-                FrameworkTask(test, frg, is_bootstrap, f.kwargs, f.probe, self)
+                FrameworkTask(
+                    test,
+                    frg,
+                    is_bootstrap,
+                    f.kwargs,
+                    f.probe,
+                    self,
+                    f.use_process_pool,
+                    f.cache_version,
+                    f.cache_cleanup,
+                    resources=tuple(res.name for res in f.resources),
+                )
             )
 
             frg.link_test(test.key)
@@ -309,8 +392,7 @@ class TestDependencyManager(PytestConfigAdapter):
     def find_test(
         self, test_fn: TestFnType, parametrized_name: str
     ) -> Optional[FrameworkTest]:
-        test_obj = FrameworkTest(test_fn, parametrized_name)
-        return self.tests.get(test_obj.key)
+        return self.tests.lookup_by_function(test_fn, parametrized_name)
 
     def dump_tests(self) -> None:
         logger.debug(f"DUMP TESTS: {len(self.tests.items())}")
@@ -339,7 +421,18 @@ class TestDependencyManager(PytestConfigAdapter):
         is_bootstrap = src_task.is_bootstrap
         kwargs = src_task.get_forge_kwargs_copy()
         kwargs.update(extra_kwargs)
-        return FrameworkTask(test, frg, is_bootstrap, kwargs, probe, self)
+        return FrameworkTask(
+            test,
+            frg,
+            is_bootstrap,
+            kwargs,
+            probe,
+            self,
+            src_task.use_process_pool,
+            src_task.cache_version,
+            src_task.cache_cleanup,
+            resources=src_task.resources,
+        )
 
     def expand_parametrized_tests(
         self,
@@ -387,20 +480,18 @@ class TestDependencyManager(PytestConfigAdapter):
                         f"parametrized_test.link_forge: {parametrized_test.key}: {frg_list} => {parametrized_test}"
                     )
 
-    def _log_dep_exec_matrix(
-        self, tests: List[FrameworkTest], dep_mtx: List[TaskSetListType]
+    def _log_dep_exec_chains(
+        self, tests: List[FrameworkTest], dep_chains: List[TaskSetListType]
     ) -> None:
-        matrix = "\nBootstrap Dependency execution matrix:\n"
-        for step_index, group in enumerate(dep_mtx):
-            matrix += f"Step {step_index+1}:\n"
-            for test_index, test_tasks in enumerate(group):
-                matrix += f"\ttest {test_index+1}: {'::'.join(tests[test_index].key)}\n"
-                if test_tasks is not None:
-                    for task in test_tasks:
-                        matrix += f"\t\tDependency {task.forge_full_path}, scope {task.forge_scope}\n"
-                else:
-                    matrix += "\t\tNo dependencies at this step\n"
-        logger.info(matrix)
+        chains = "\nBootstrap Dependency execution chains:\n"
+        for test, test_chain in zip(tests, dep_chains):
+            chains += f"test: {'::'.join(test.key)}\n"
+            for step_index, step_tasks in enumerate(test_chain):
+                chains += f"\tStep {step_index+1}:\n"
+                if step_tasks is not None:
+                    for task in step_tasks:
+                        chains += f"\t\tDependency {task.forge_full_path}, scope {task.forge_scope}\n"
+        logger.info(chains)
 
     def remove_skipped_tests(
         self, skipped_tests_keys: List[Tuple[str, ...]]
@@ -418,65 +509,224 @@ class TestDependencyManager(PytestConfigAdapter):
         ]
         self.remove_skipped_tests(tests_to_remove)
 
-    def build_bootstrap_matrix(self) -> List[TaskSetListType]:
+    def build_bootstrap_chains(self) -> List[TaskSetListType]:
+        tests, exec_chains = [], []
+        for test in self.tests.values():
+            tasks = self.tasks.get_bootstrap_tasks(test.key)
+            if tasks:
+                tests.append(test)
+                exec_chains.append(tasks)
+
+        self._log_dep_exec_chains(tests, exec_chains)
+        return exec_chains
+
+    def predict_tests_readiness(self) -> Dict[ExecutableKeyType, float]:
+        """
+        Returns time in seconds after bootstrap execution start each test
+        is expected to have its bootstrap forges done.
+        """
+        if self.executor is None:
+            # timings are loaded again by executor, streamed bootstrap
+            # forges may have already recorded their durations
+            self.forge_timings.load(self.pytest_config)
+        if self.sequential_execution:
+            worker_count = 1
+        elif self.asyncio_execution:
+            worker_count = self.asyncio_max_concurrency
+        else:
+            worker_count = self.number_of_threads
         tests = list(self.tests.values())
-
-        exec_steps = []
-        step_index = 0
-        while True:
-            step_tasks: List[Optional[List[FrameworkTask]]] = [None] * len(
-                tests
+        readiness = self.forge_timings.predict_readiness(
+            [self.tasks.get_bootstrap_tasks(test.key) for test in tests],
+            worker_count,
+        )
+        return {test.key: time for test, time in zip(tests, readiness)}
+
+    def _create_executor(self) -> FrmwkExecutorBase:
+        self.forge_timings.load(self.pytest_config)
+        forge_result_cache.load(
+            self.pytest_config,
+            self.forge_cache_ttl,
+            self.purge_forge_cache,
+            self.create_global_builtin_args(),
+        )
+        if not self.stream_bootstrap:
+            self.deploy_process_pool()
+
+        if self.sequential_execution:
+            return FrmwkSequentialExecutor(self)
+        if self.asyncio_execution:
+            return FrmwkAsyncioExecutor(
+                self, self.asyncio_max_concurrency, self.number_of_threads
             )
-            for pos, test in enumerate(tests):
-                tasks = self.tasks.get_bootstrap_tasks(test.key)
-                if step_index < len(tasks):
-                    step_tasks[pos] = tasks[step_index]
-            if not any(step_tasks):
+        return FrmwkParallelExecutor(
+            self, self.number_of_threads, self.max_number_of_threads
+        )
+
+    def _speculative_chain(self, test: FrameworkTest) -> TaskSetListType:
+        """
+        Returns copies of leading bootstrap steps of the test made of
+        session and module scoped forges only, as function scoped forges
+        and their dependents can change with test parametrization.
+        """
+        chain: TaskSetListType = []
+        for step_tasks in self.tasks.get_bootstrap_tasks(test.key):
+            if not step_tasks or any(
+                task.forge_scope == test.full_path or task.use_process_pool
+                for task in step_tasks
+            ):
                 break
-            exec_steps.append(step_tasks)
-            step_index += 1
+            chain.append(
+                [
+                    FrameworkTask(
+                        test,
+                        task._forge,
+                        task.is_bootstrap,
+                        task.get_forge_kwargs_copy(),
+                        task.get_probe_fn(),
+                        self,
+                        task.use_process_pool,
+                        task.cache_version,
+                        task.cache_cleanup,
+                        resources=task.resources,
+                        is_speculative=True,
+                    )
+                    for task in step_tasks
+                ]
+            )
+        return chain
+
+    def stream_bootstrap_execution(self) -> None:
+        """
+        Dispatches bootstrap forges of the tests registered since previous
+        call while the rest of tests are still being collected. Forges are
+        executed speculatively: tests reuse their executions as any other
+        previous forge execution, while executions not needed by collected
+        tests are torn down when collection is finished.
+        """
+        if not self.stream_bootstrap or self.collectonly:
+            return
+        if self.executor is None:
+            self.executor = self._create_executor()
+        if not self.executor.supports_streaming:
+            return
 
-        self._log_dep_exec_matrix(tests, exec_steps)
-        return exec_steps
+        chains = []
+        tests_to_stream, self._tests_to_stream = self._tests_to_stream, []
+        for test_key in tests_to_stream:
+            test = self.tests.get(test_key)
+            if test is None or test_key in self._streamed_tests:
+                continue
+            self._streamed_tests.add(test_key)
+            chain = self._speculative_chain(test)
+            if chain:
+                chains.append(chain)
+                for step_tasks in chain:
+                    self._speculative_tasks += step_tasks or []
+
+        if chains:
+            logger.info(
+                f"Streaming bootstrap forges of {len(chains)} collected tests."
+            )
+            self._execution_timeout = time.time() + self.bootstrap_wait_timeout
+            self.executor.extend(chains)
+
+    def _release_speculative_executions(self) -> None:
+        if not self._speculative_tasks:
+            return
+        assert self.executor is not None
+        self.executor.wait()
+
+        required = set()
+        for test in self.tests.values():
+            for step_tasks in self._speculative_chain(test):
+                for task in step_tasks or []:
+                    try:
+                        task.prepare_forge_call_args(
+                            self.get_global_builtin_args(test.key)
+                        )
+                    except Exception:
+                        continue
+                    required.add((task.forge_key, task.args_fingerprint))
+
+        for task in self._speculative_tasks:
+            fingerprint = task.args_fingerprint
+            if fingerprint is not None and (
+                (task.forge_key, fingerprint) not in required
+            ):
+                task.release_speculative_execution()
+        self._speculative_tasks = []
 
     def start_bootstrap_execution(self) -> None:
+        self._release_speculative_executions()
+        if self.parallel_session_teardown:
+            for frg in self.forges.values():
+                if frg.scope == ForgeScope.SESSION.value:
+                    frg.defer_teardown()
         if self.tests.is_empty or self.tasks.is_empty:
             return
 
         logger.info("Starting bootstrap forges execution.")
         if self.executor is None:
-            if self.sequential_execution:
-                self.executor = FrmwkSequentialExecutor(self)
-            else:
-                self.executor = FrmwkParallelExecutor(
-                    self, self.number_of_threads
-                )
-
-        deps_exec_mtx = dependency_manager.build_bootstrap_matrix()
-        if deps_exec_mtx:
+            self.executor = self._create_executor()
+        # streamed bootstrap starts executor before all test modules are
+        # imported, worker processes are forked when collection is finished
+        # so that forges of every test module are available to them;
+        # speculative executions never use the process pool
+        self.deploy_process_pool()
+
+        deps_exec_chains = self.build_bootstrap_chains()
+        if deps_exec_chains:
             self._execution_timeout = time.time() + self.bootstrap_wait_timeout
-            self.executor.start(deps_exec_mtx)
+            self.executor.start(deps_exec_chains)
+
+    def deploy_process_pool(self) -> None:
+        # worker processes are forked before executor threads are started,
+        # unless bootstrap execution is streamed during collection
+        if forge_process_pool.is_deployed:
+            return
+        if any(
+            task.use_process_pool for task in self.tasks.enumerate_all_tasks()
+        ):
+            forge_process_pool.deploy(self.number_of_processes)
 
     def inplace_tasks_execution(
-        self, deps_exec_mtx: List[TaskSetListType]
+        self, deps_exec_chains: List[TaskSetListType]
     ) -> None:
-        logger.debug(f"start inplace_tasks_execution:{deps_exec_mtx}")
-        if not deps_exec_mtx:
+        logger.debug(f"start inplace_tasks_execution:{deps_exec_chains}")
+        if not deps_exec_chains:
             return
         assert self.executor is not None
         logger.debug("inplace_tasks_execution is about to start")
         self._execution_timeout = (
             time.time() + self.attached_tasks_wait_timeout
         )
-        self.executor.start(deps_exec_mtx)
+        self.executor.start(deps_exec_chains)
         self.executor.wait(is_bootstrap=False)
 
     def shutdown(self) -> None:
         logger.info("Shutting down dependency manager...")
+        self.wait_for_teardowns()
+        self.execute_deferred_teardowns()
 
         if self.executor is not None:
             self.executor.shutdown()
             self.executor = None
+        if self._streamed_tests:
+            # speculative executions that tests have not torn down
+            for frg in self.forges.values():
+                try:
+                    frg.teardown_unreferenced_executions()
+                except Exception as e:
+                    logger.error(
+                        f"Forge {frg.full_path} teardown has failed: {e}\n{traceback.format_exc()}"
+                    )
+        framework_loop.stop()
+        forge_process_pool.shutdown()
+        self.forge_timings.save(self.pytest_config)
+        session_tracer.save(self.trace_file)
+        otlp_tracer.save(self.otlp_file)
+        forge_profiler.save()
 
     def check_all_tests_executed(self) -> bool:
         executed = [test.is_executed for test in self.tests.values()]
@@ -507,7 +757,80 @@ class TestDependencyManager(PytestConfigAdapter):
     def teardown_test(self, test: FrameworkTest) -> None:
         logger.debug(f"teardown test:{test}")
         test.mark_executed()
-        self.teardown_test_dependencies(test)
+        if not self.number_of_teardown_threads:
+            self.teardown_test_dependencies(test)
+            return
+
+        # teardowns of the test are executed one by one in reverse order,
+        # forges shared with other tests are dereferenced after their
+        # dependents are torn down
+        if self._teardown_pool is None:
+            self._teardown_pool = ThreadPoolExecutor(
+                max_workers=self.number_of_teardown_threads,
+                thread_name_prefix="teardown",
+            )
+        future = self._teardown_pool.submit(
+            self.teardown_test_dependencies, test
+        )
+        with self._teardowns_lock:
+            self._background_teardowns[test.key] = (test, future)
+
+    def pop_finished_teardowns(self) -> List[FrameworkTest]:
+        """
+        Returns tests whose teardowns executed in background or deferred
+        to the end of session have finished since previous call.
+        """
+        with self._teardowns_lock:
+            finished = {test.key: test for test in self._finished_teardowns}
+            self._finished_teardowns = []
+            for test_key, (test, future) in list(
+                self._background_teardowns.items()
+            ):
+                if not future.done():
+                    continue
+                del self._background_teardowns[test_key]
+                error = future.exception()
+                if error is not None:
+                    logger.error(
+                        f"Background teardown of test {test.full_path} has failed: {error}"
+                    )
+                finished[test_key] = test
+        return list(finished.values())
+
+    def execute_deferred_teardowns(self) -> None:
+        deferred_forges = [
+            frg for frg in self.forges.values() if frg.teardown_is_deferred
+        ]
+        if not deferred_forges:
+            return
+        for frg in deferred_forges:
+            frg.resume_teardown()
+
+        planner = TeardownPlanner(
+            [self.tasks.get_tasks(test.key) for test in self.tests.values()]
+        )
+        logger.info(
+            f"Executing {len(planner)} deferred forge teardowns in parallel."
+        )
+        planner.execute(self.number_of_threads)
+        failed_tests = [
+            self.tests.get(task.test_key)
+            for task in planner.tasks
+            if task.teardown_failed
+        ]
+        with self._teardowns_lock:
+            self._finished_teardowns += [
+                test for test in failed_tests if test is not None
+            ]
+
+    def wait_for_teardowns(self) -> None:
+        if self._teardown_pool is None:
+            return
+        logger.info(
+            f"Waiting for {len(self._background_teardowns)} tests teardowns to finish."
+        )
+        self._teardown_pool.shutdown(wait=True)
+        self._teardown_pool = None
 
     def _check_failed_tasks(
         self, test: FrameworkTest, done_tasks: List[FrameworkTask]
@@ -536,32 +859,37 @@ class TestDependencyManager(PytestConfigAdapter):
         raise SplTaFwkWaitForDependenciesTimeout(msg)
 
     def wait_for_test_bootstrap(self, test: FrameworkTest) -> None:
-        while True:
-            done, pending = self.tasks.bootstrap_tasks_by_state(test.key)
-            self._check_failed_tasks(test, done)
-
-            if not pending:
-                break
-            elif time.time() > self._execution_timeout:
-                self._report_timeout(test, pending)
+        # bootstrap tasks notify the test when they are executed or failed,
+        # completion_check_frequency only defines how often waiting is logged
+        with test.tasks_state_changed:
+            while True:
+                pending, failed = self.tasks.bootstrap_state(test.key)
+                self._check_failed_tasks(test, failed)
+
+                if not pending:
+                    break
+
+                time_left = self._execution_timeout - time.time()
+                if time_left <= 0:
+                    _, pending_tasks = self.tasks.bootstrap_tasks_by_state(
+                        test.key
+                    )
+                    self._report_timeout(test, pending_tasks)
 
-            logger.debug(f"{test} is waiting for bootstrap dependencies")
-            time.sleep(self.completion_check_frequency)
+                logger.debug(f"{test} is waiting for bootstrap dependencies")
+                test.tasks_state_changed.wait(
+                    min(time_left, self.completion_check_frequency)
+                )
 
         logger.debug(f"{test} bootstrap dependencies are ready")
 
     def execute_test_inplace_forges(self, test: FrameworkTest) -> None:
         logger.debug(f"Executing attached forges for test {test}")
-        exec_steps = []
         inplace_tasks = self.tasks.get_inplace_tasks(test.key)
-        dump = (
-            f"Execution matrix for attached forges for {test}: {inplace_tasks}"
+        logger.debug(
+            f"Execution chain for attached forges for {test}: {inplace_tasks}"
         )
-        for tasks in inplace_tasks:
-            dump += f"\t{[tasks]}"
-            exec_steps.append([tasks])
-        logger.debug(dump)
-        self.inplace_tasks_execution(exec_steps)
+        self.inplace_tasks_execution([inplace_tasks] if inplace_tasks else [])
         inplace_tasks_list = self.tasks.get_inplace_tasks_list(test.key)
         self._check_failed_tasks(test, inplace_tasks_list)
 
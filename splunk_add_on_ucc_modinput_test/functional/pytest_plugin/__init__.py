@@ -14,12 +14,16 @@
 # limitations under the License.
 #
 from splunk_add_on_ucc_modinput_test.functional.pytest_plugin.hooks import (
+    pytest_sessionstart,
+    pytest_collection,
+    pytest_collectreport,
     pytest_deselected,
     pytest_collection_modifyitems,
     pytest_runtest_setup,
     pytest_runtest_call,
     pytest_runtest_teardown,
     pytest_collection_finish,
+    pytest_terminal_summary,
 )
 from splunk_add_on_ucc_modinput_test.functional.pytest_plugin.options import (
     pytest_addoption,
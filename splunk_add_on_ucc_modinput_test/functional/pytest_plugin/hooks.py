@@ -13,13 +13,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import List
+from typing import Generator, List
 import pytest
 import traceback
+from splunk_add_on_ucc_modinput_test.common.otlp import otlp_tracer
 from splunk_add_on_ucc_modinput_test.functional import logger
 from splunk_add_on_ucc_modinput_test.functional.exceptions import (
     SplTaFwkBaseException,
 )
+from splunk_add_on_ucc_modinput_test.functional.entities import FrameworkTest
+from splunk_add_on_ucc_modinput_test.functional.common.tracing import (
+    session_tracer,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.latency_stats import (
+    latency_stats,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.forge_profiler import (
+    forge_profiler,
+)
 from splunk_add_on_ucc_modinput_test.functional.manager import (
     dependency_manager,
 )
@@ -33,8 +44,53 @@ from splunk_add_on_ucc_modinput_test.functional.pytest_plugin.utils import (
     _map_forged_tests_to_pytest_items,
     _check_session_terminal_output,
 )
-from pytest import Session, Config, Item
-from typing import Sequence
+from pytest import (
+    CallInfo,
+    CollectReport,
+    Session,
+    Config,
+    Item,
+    TerminalReporter,
+    TestReport,
+)
+from typing import Dict, Sequence, Set
+from splunk_add_on_ucc_modinput_test.typing import ExecutableKeyType
+
+# pytest items of tests with teardowns executed in background or deferred
+# to the end of session
+_late_teardown_items: Dict[ExecutableKeyType, Item] = {}
+
+# configs of sessions that have executed forged tests, forge latency summary
+# is printed only for them, e.g. not for sessions running nested sessions
+_forged_sessions: Set[Config] = set()
+
+
+@pytest.hookimpl
+def pytest_sessionstart(session: Session) -> None:
+    latency_stats.reset()
+
+
+@pytest.hookimpl
+def pytest_collection(session: Session) -> None:
+    dependency_manager.link_pytest_config(session.config)
+    if dependency_manager.collectonly:
+        return
+    if dependency_manager.trace_file:
+        session_tracer.start()
+    if dependency_manager.otlp_file:
+        otlp_tracer.start({"session_id": dependency_manager.session_id})
+    if dependency_manager.profile_forges:
+        forge_profiler.start(
+            dependency_manager.profile_forges_filter,
+            dependency_manager.profile_forges_dir,
+        )
+
+
+@pytest.hookimpl
+def pytest_collectreport(report: CollectReport) -> None:
+    # forges of the module tests are registered when the module is imported
+    if report.passed:
+        dependency_manager.stream_bootstrap_execution()
 
 
 @pytest.hookimpl
@@ -115,10 +171,14 @@ def pytest_runtest_setup(item: Item) -> None:
     logger.info(
         f"Executing pytest runtest setup step for forged test : {test}"
     )
+    _forged_sessions.add(item.config)
 
+    trace_args = dict(test="::".join(test.key))
     try:
-        dependency_manager.wait_for_test_bootstrap(test)
-        dependency_manager.execute_test_inplace_forges(test)
+        with session_tracer.span("bootstrap wait", "pytest", trace_args):
+            dependency_manager.wait_for_test_bootstrap(test)
+        with session_tracer.span("attached forges", "pytest", trace_args):
+            dependency_manager.execute_test_inplace_forges(test)
     except SplTaFwkBaseException as e:
         logger.error(f"Error during test setup: {e}\n{traceback.format_exc()}")
         pytest.fail(str(e))
@@ -131,14 +191,18 @@ def pytest_runtest_setup(item: Item) -> None:
     )
 
 
-@pytest.hookimpl
-def pytest_runtest_call(item: Item) -> None:
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: Item) -> Generator[None, None, None]:
     pytest_funcname, _ = _extract_parametrized_data(item)
     test = dependency_manager.find_test(item._obj, pytest_funcname)
     if not test:
+        yield
         return
 
     logger.info(f"Executing pytest runtest call step for forged test : {test}")
+    # REST calls made by the test body are recorded as children of its span
+    with otlp_tracer.activate(test.otlp_span):
+        yield
 
 
 @pytest.hookimpl
@@ -152,6 +216,10 @@ def pytest_runtest_teardown(item: Item) -> None:
         f"Executing pytest runtest teardown step for forged test : {test}"
     )
     dependency_manager.teardown_test(test)
+    otlp_tracer.end_span(test.otlp_span)
+    in_background = bool(dependency_manager.number_of_teardown_threads)
+    if in_background or dependency_manager.parallel_session_teardown:
+        _late_teardown_items[test.key] = item
 
     if dependency_manager.check_all_tests_executed():
         dependency_manager.shutdown()
@@ -159,12 +227,56 @@ def pytest_runtest_teardown(item: Item) -> None:
     for task, error in dependency_manager.test_error_report(test):
         item.add_report_section("call", "error", str(error))
 
-    if not dependency_manager.do_not_fail_with_teardown:
-        msg = ""
-        for task, error in dependency_manager.test_teardown_error_report(test):
-            msg += (
-                f"\n\tforge: {task.forge_full_path}, scope: {task.forge_scope}"
-            )
+    is_torn_down = not in_background
+    for finished_test in dependency_manager.pop_finished_teardowns():
+        finished_item = _late_teardown_items.pop(finished_test.key, None)
+        if finished_test is test:
+            is_torn_down = True
+        elif finished_item is not None:
+            _log_late_teardown_failure(finished_item, finished_test)
 
+    if is_torn_down and not dependency_manager.do_not_fail_with_teardown:
+        msg = _teardown_failure_message(test)
         if msg:
-            pytest.fail(f"teardown failed:\n\ttest: {test.key}{msg}")
+            pytest.fail(msg)
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter: TerminalReporter) -> None:
+    config = terminalreporter.config
+    size = dependency_manager.latency_summary_size
+    lines = []
+    if config in _forged_sessions and size:
+        lines = latency_stats.summary_lines(size)
+    _forged_sessions.discard(config)
+    # statistics are not carried over to the next session of the process
+    latency_stats.reset()
+    if not lines:
+        return
+    terminalreporter.section("forge latency summary")
+    for line in lines:
+        terminalreporter.write_line(line)
+
+
+def _teardown_failure_message(test: FrameworkTest) -> str:
+    msg = ""
+    for task, error in dependency_manager.test_teardown_error_report(test):
+        msg += f"\n\tforge: {task.forge_full_path}, scope: {task.forge_scope}"
+    return f"teardown failed:\n\ttest: {test.key}{msg}" if msg else ""
+
+
+def _log_late_teardown_failure(item: Item, test: FrameworkTest) -> None:
+    # report of the test has already been logged, so failed teardown is
+    # logged as one more teardown report of the test
+    if dependency_manager.do_not_fail_with_teardown:
+        return
+    msg = _teardown_failure_message(test)
+    if not msg:
+        return
+    for task, error in dependency_manager.test_teardown_error_report(test):
+        msg += f"\n{error}"
+    call: CallInfo[None] = CallInfo.from_call(
+        lambda: pytest.fail(msg, pytrace=False), when="teardown"
+    )
+    report = TestReport.from_item_and_call(item, call)
+    item.ihook.pytest_runtest_logreport(report=report)
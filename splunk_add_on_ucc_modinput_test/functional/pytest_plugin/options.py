@@ -15,9 +15,13 @@
 #
 from argparse import ArgumentTypeError
 from splunk_add_on_ucc_modinput_test.functional.constants import (
+    ForgeCache,
     ForgeProbe,
+    ForgeProfiling,
+    LatencySummary,
     TasksWait,
     Executor,
+    WorkerPool,
 )
 from pytest import Parser
 
@@ -74,6 +78,63 @@ def pytest_addoption(parser: Parser) -> None:
                         tests execution.",
     )
 
+    splunk_group.addoption(
+        "--history-test-order",
+        dest="history_test_order",
+        action="store_true",
+        default=False,
+        help="Order tests by the time their bootstrap forges are expected \
+            to be done, predicted from forge durations recorded in \
+                previous test sessions.",
+    )
+
+    splunk_group.addoption(
+        "--parallel-session-teardown",
+        dest="parallel_session_teardown",
+        action="store_true",
+        default=False,
+        help="Defer teardowns of session scoped forges to the end of \
+            session and execute them in parallel, each forge after the \
+                forges assigned after it to the same tests.",
+    )
+
+    splunk_group.addoption(
+        "--stream-bootstrap",
+        dest="stream_bootstrap",
+        action="store_true",
+        default=False,
+        help="Start executing session and module scoped bootstrap forges \
+            while tests are still being collected. Forge executions not \
+                needed by collected tests are torn down when collection is \
+                    finished. Ignored with --sequential-execution and \
+                        --asyncio-execution.",
+    )
+
+    splunk_group.addoption(
+        "--asyncio-execution",
+        dest="asyncio_execution",
+        action="store_true",
+        default=False,
+        help="Execute forges and probes as coroutines in a single event \
+            loop. Async forges and probes are awaited directly, regular ones \
+                are executed in a pool of --number-of-threads threads.",
+    )
+
+    allowed_range = [
+        Executor.MIN_ASYNCIO_CONCURRENCY.value,
+        Executor.MAX_ASYNCIO_CONCURRENCY.value,
+    ]
+    default = Executor.DEFAULT_ASYNCIO_CONCURRENCY.value
+    splunk_group.addoption(
+        "--asyncio-max-concurrency",
+        dest="asyncio_max_concurrency",
+        type=int_range(*allowed_range),
+        default=default,
+        help=f"Maximum number of forges executed concurrently in asyncio \
+            execution mode. Allowed range: {allowed_range}. Default value: \
+                {default}.",
+    )
+
     allowed_range = [
         Executor.MIN_THREAD_NUMBER.value,
         Executor.MAX_THREAD_NUMBER.value,
@@ -88,6 +149,54 @@ def pytest_addoption(parser: Parser) -> None:
             {allowed_range}. Default value: {default}.",
     )
 
+    allowed_range = [
+        WorkerPool.MIN_MAX_SIZE.value,
+        WorkerPool.MAX_MAX_SIZE.value,
+    ]
+    default = WorkerPool.DEFAULT_MAX_SIZE.value
+    splunk_group.addoption(
+        "--max-number-of-threads",
+        dest="max_number_of_threads",
+        type=int_range(*allowed_range),
+        default=default,
+        help=f"Maximum number of threads the pool of --number-of-threads \
+            threads can grow to when forges are waiting for execution while \
+                all threads are blocked by long running forges. Allowed \
+                    range: {allowed_range}. Default value: {default}.",
+    )
+
+    allowed_range = [
+        Executor.MIN_PROCESS_NUMBER.value,
+        Executor.MAX_PROCESS_NUMBER.value,
+    ]
+    default = Executor.DEFAULT_PROCESS_NUMBER.value
+    splunk_group.addoption(
+        "--number-of-processes",
+        dest="number_of_processes",
+        type=int_range(*allowed_range),
+        default=default,
+        help=f"Number of worker processes used to execute forges declared \
+            with use_process_pool=True. Allowed range: {allowed_range}. \
+                Default value: {default}.",
+    )
+
+    allowed_range = [
+        Executor.MIN_TEARDOWN_THREAD_NUMBER.value,
+        Executor.MAX_TEARDOWN_THREAD_NUMBER.value,
+    ]
+    default = Executor.DEFAULT_TEARDOWN_THREAD_NUMBER.value
+    splunk_group.addoption(
+        "--number-of-teardown-threads",
+        dest="number_of_teardown_threads",
+        type=int_range(*allowed_range),
+        default=default,
+        help=f"Number of threads executing forge teardowns in background, \
+            so pytest can start next test without waiting for teardowns of \
+                the previous one. 0 executes teardowns in pytest main \
+                    thread. Allowed range: {allowed_range}. \
+                        Default value: {default}.",
+    )
+
     allowed_range = [
         ForgeProbe.MIN_INTERVAL.value,
         ForgeProbe.MAX_INTERVAL.value,
@@ -154,7 +263,97 @@ def pytest_addoption(parser: Parser) -> None:
         dest="completion_check_frequency",
         type=int_range(*allowed_range),
         default=default,
-        help=f"Frequency to check that bootstrap or attached tasks bundle has \
-            finished to execute. Allowed range: {allowed_range}. \
-                Default value: {default}.",
+        help=f"Interval in seconds to report waiting for bootstrap or \
+            attached tasks bundle to finish. Tests are unblocked as soon as \
+                their forges are executed, independently of this interval. \
+                    Allowed range: {allowed_range}. Default value: {default}.",
+    )
+
+    allowed_range = [
+        ForgeCache.MIN_TTL.value,
+        ForgeCache.MAX_TTL.value,
+    ]
+    default = ForgeCache.DEFAULT_TTL.value
+    splunk_group.addoption(
+        "--forge-cache-ttl",
+        dest="forge_cache_ttl",
+        type=int_range(*allowed_range),
+        default=default,
+        help=f"Time in seconds results of forges declared with cache_version \
+            are reused by next test sessions. Allowed range: \
+                {allowed_range}. Default value: {default}.",
+    )
+
+    splunk_group.addoption(
+        "--purge-forge-cache",
+        dest="purge_forge_cache",
+        action="store_true",
+        default=False,
+        help="Remove cached forge results after calling their cache \
+            cleanup functions. Forges declared with cache_version are \
+                executed again and torn down by their cache cleanup \
+                    functions.",
+    )
+
+    allowed_range = [
+        LatencySummary.MIN_SIZE.value,
+        LatencySummary.MAX_SIZE.value,
+    ]
+    default = LatencySummary.DEFAULT_SIZE.value
+    splunk_group.addoption(
+        "--latency-summary-size",
+        dest="latency_summary_size",
+        type=int_range(*allowed_range),
+        default=default,
+        help=f"Number of the slowest forges, probes and teardowns listed \
+            with their latency percentiles in the terminal summary. 0 \
+                disables the summary. Allowed range: {allowed_range}. \
+                    Default value: {default}.",
+    )
+
+    splunk_group.addoption(
+        "--trace-file",
+        dest="trace_file",
+        default=None,
+        help="Path of the file to save timeline of forge executions, \
+            probes, teardowns and waits of the test session to, in Chrome \
+                trace event format.",
+    )
+
+    splunk_group.addoption(
+        "--otlp-file",
+        dest="otlp_file",
+        default=None,
+        help="Path of the file to save spans of the test session, tests, \
+            forge executions, probes, teardowns, search jobs and Splunk \
+                REST calls to, in OpenTelemetry OTLP JSON format.",
+    )
+
+    splunk_group.addoption(
+        "--profile-forges",
+        dest="profile_forges",
+        action="store_true",
+        default=False,
+        help="Profile forges, their probes and teardowns with sampling \
+            profiler.",
+    )
+
+    default_filter = ForgeProfiling.DEFAULT_FILTER.value
+    splunk_group.addoption(
+        "--profile-forges-filter",
+        dest="profile_forges_filter",
+        default=default_filter,
+        help=f"Glob filter selecting forges profiled with --profile-forges \
+            by name or full path, e.g. 'create_*'. Default value: \
+                '{default_filter}'.",
+    )
+
+    default_directory = ForgeProfiling.DEFAULT_DIRECTORY.value
+    splunk_group.addoption(
+        "--profile-forges-dir",
+        dest="profile_forges_dir",
+        default=default_directory,
+        help=f"Directory to save collapsed stacks of profiled forge \
+            executions and merged collapsed stacks of the session to. \
+                Default value: {default_directory}.",
     )
@@ -96,19 +96,28 @@ def _collect_skipped_tests(
 
 
 def _adjust_test_order(items: List[Item]) -> List[Item]:
+    readiness: Dict[ExecutableKeyType, float] = {}
+    if dependency_manager.history_test_order:
+        readiness = dependency_manager.predict_tests_readiness()
+
     tests = []
     logger.debug("Initial test order:")
     for item in items:
         pytest_funcname, _ = _extract_parametrized_data(item)
         test = dependency_manager.find_test(item._obj, pytest_funcname)
         if test:
-            logger.debug(f"Item: {item} -> {test.key}")
+            ready_at = readiness.get(test.key, 0.0)
+            logger.debug(
+                f"Item: {item} -> {test.key}, expected to be ready in {ready_at:.2f} seconds"
+            )
             ip_tasks, bs_tasks = dependency_manager.tasks.get_tasks_by_type(
                 test.key
             )
-            tests.append((item, (int(len(ip_tasks) > 0), len(bs_tasks))))
+            tests.append(
+                (item, (int(len(ip_tasks) > 0), ready_at, len(bs_tasks)))
+            )
         else:
-            tests.append((item, (-1, 0)))
+            tests.append((item, (-1, 0.0, 0)))
 
     sorted_items = sorted(tests, key=lambda v: v[1])
     return [item for item, _ in sorted_items]
@@ -40,6 +40,10 @@ logger = logging.getLogger("ucc-modinput-test")
 
 
 class SplunkClientBase:
+    # single client instance is shared by all tests, set to False in
+    # inherited class to create a client for every test
+    shared_between_tests = True
+
     def __init__(
         self, splunk_configuration: Configuration | None = None
     ) -> None:
@@ -13,17 +13,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import Any, Callable, Dict, Generator, Tuple, Union, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Tuple,
+    Union,
+    Optional,
+)
 
 ProbeGenType = Generator[float, None, Optional[bool]]
 ProbeGenFnType = Callable[..., ProbeGenType]
+ProbeAsyncGenType = AsyncGenerator[Union[float, bool], None]
+ProbeAsyncGenFnType = Callable[..., ProbeAsyncGenType]
 ProbeRegularFnType = Callable[..., Any]
 ProbeFnType = Union[ProbeGenFnType, ProbeRegularFnType]
 
 ForgeGenType = Generator[Any, None, None]
 ForgeGenFnType = Callable[..., ForgeGenType]
+ForgeAsyncGenType = AsyncGenerator[Any, None]
 ForgeRegularFnType = Callable[..., Any]
 ForgeFnType = Union[ForgeGenFnType, ForgeRegularFnType]
+ForgeTeardownType = Union[ForgeGenType, ForgeAsyncGenType, Callable[..., Any]]
 
 TestFnType = Callable[..., Any]
 
@@ -0,0 +1,138 @@
+from __future__ import annotations
+import json
+import shutil
+
+import pytest
+
+from splunk_add_on_ucc_modinput_test.common import utils
+from tests.benchmarks.fake_splunkd import FakeSplunkd
+from tests.benchmarks.runner import BenchmarkResult, BenchmarkRunner
+from tests.benchmarks.suite_generator import SuiteShape
+
+_results: list[BenchmarkResult] = []
+
+DEFAULT_SUITE_SHAPES = [
+    "10x2x1",
+    "100x2x1",
+    "100x5x1x4",
+    "100x2x5",
+    "300x3x1x10:session,module",
+    "300x3x1x10:function",
+]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--benchmark-iterations",
+        type=int,
+        default=20,
+        help="Number of calls of each benchmarked operation.",
+    )
+    group.addoption(
+        "--benchmark-concurrency",
+        type=int,
+        default=4,
+        help="Number of threads calling benchmarked operation "
+        "concurrently; also used as executors concurrency.",
+    )
+    group.addoption(
+        "--benchmark-latency",
+        type=float,
+        default=0.0,
+        help="Seconds fake splunkd waits before every response.",
+    )
+    group.addoption(
+        "--benchmark-done-after-polls",
+        type=int,
+        default=1,
+        help="Number of status requests after which fake splunkd "
+        "reports search job as done.",
+    )
+    group.addoption(
+        "--benchmark-suite-shape",
+        action="append",
+        default=[],
+        help="Shape of synthetic suite for scale benchmark in format "
+        "NxMxP[xK][:scope,...] - N tests with M forges each, P "
+        f"parametrizations, K modules. Can be repeated. Default: "
+        f"{' '.join(DEFAULT_SUITE_SHAPES)}.",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Path to JSON file to save benchmark results to.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "suite_shape" in metafunc.fixturenames:
+        specs = (
+            metafunc.config.getoption("benchmark_suite_shape")
+            or DEFAULT_SUITE_SHAPES
+        )
+        shapes = [SuiteShape.parse(spec) for spec in specs]
+        metafunc.parametrize(
+            "suite_shape", shapes, ids=[shape.name for shape in shapes]
+        )
+
+
+@pytest.fixture(scope="session")
+def fake_splunkd(pytestconfig):
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is required to run fake splunkd")
+    with FakeSplunkd(
+        latency=pytestconfig.getoption("benchmark_latency"),
+        done_after_polls=pytestconfig.getoption("benchmark_done_after_polls"),
+    ) as splunkd:
+        yield splunkd
+
+
+@pytest.fixture(scope="session")
+def splunk_environment(fake_splunkd):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MODINPUT_TEST_SPLUNK_HOST", fake_splunkd.host)
+        mp.setenv("MODINPUT_TEST_SPLUNK_PORT", str(fake_splunkd.port))
+        mp.setenv("MODINPUT_TEST_SPLUNK_USERNAME", "admin")
+        mp.setenv(
+            "MODINPUT_TEST_SPLUNK_PASSWORD_BASE64",
+            utils.Base64.encode("changeme"),
+        )
+        mp.setenv("MODINPUT_TEST_SPLUNK_DEDICATED_INDEX", "main")
+        yield fake_splunkd
+
+
+@pytest.fixture
+def benchmark(request):
+    config = request.config
+    return BenchmarkRunner(
+        request.node.name,
+        iterations=config.getoption("benchmark_iterations"),
+        concurrency=config.getoption("benchmark_concurrency"),
+        results=_results,
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _results:
+        return
+    terminalreporter.section("benchmark results")
+    terminalreporter.write_line(
+        f"{'name':<50} {'conc':>4} {'count':>6} {'ops/s':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}"
+    )
+    for result in _results:
+        stats = result.as_dict()
+        latencies = "".join(
+            f" {stats[key] * 1000:>8.2f}" if key in stats else f" {'-':>8}"
+            for key in ("p50", "p95", "max")
+        )
+        terminalreporter.write_line(
+            f"{result.name:<50} {result.concurrency:>4} {result.count:>6} "
+            f"{result.throughput:>9.2f}{latencies}"
+        )
+    json_path = config.getoption("benchmark_json")
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump([r.as_dict() for r in _results], f, indent=2)
+        terminalreporter.write_line(f"benchmark results saved to {json_path}")
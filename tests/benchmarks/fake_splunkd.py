@@ -0,0 +1,460 @@
+from __future__ import annotations
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+ATOM_FEED = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<feed xmlns="http://www.w3.org/2005/Atom" '
+    'xmlns:s="http://dev.splunk.com/ns/rest" '
+    'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">\n'
+    "<title>{title}</title>\n"
+    "<opensearch:totalResults>{total}</opensearch:totalResults>\n"
+    "{entries}</feed>\n"
+)
+ATOM_ENTRY = (
+    "<entry{namespaces}>\n"
+    "<title>{title}</title>\n"
+    '<link href="{path}" rel="alternate"/>\n'
+    '<content type="text/xml">{content}</content>\n'
+    "</entry>\n"
+)
+ATOM_NAMESPACES = (
+    ' xmlns="http://www.w3.org/2005/Atom"'
+    ' xmlns:s="http://dev.splunk.com/ns/rest"'
+)
+
+
+ATOM_ACL = {"owner": "nobody", "app": "search", "sharing": "global"}
+
+
+def _atom_value(value: Any) -> str:
+    if isinstance(value, dict):
+        return _atom_dict(value)
+    return escape(str(value))
+
+
+def _atom_dict(content: dict[str, Any]) -> str:
+    keys = "".join(
+        f'<s:key name="{escape(str(k))}">{_atom_value(v)}</s:key>'
+        for k, v in content.items()
+    )
+    return f"<s:dict>{keys}</s:dict>"
+
+
+def _atom_entry(
+    title: str, path: str, content: dict[str, Any], *, root: bool = False
+) -> str:
+    return ATOM_ENTRY.format(
+        namespaces=ATOM_NAMESPACES if root else "",
+        title=escape(title),
+        path=escape(path),
+        content=_atom_dict(dict(content, **{"eai:acl": ATOM_ACL})),
+    )
+
+
+def _atom_feed(title: str, entries: list[str]) -> str:
+    return ATOM_FEED.format(
+        title=escape(title), total=len(entries), entries="".join(entries)
+    )
+
+
+class FakeSearchJob:
+    def __init__(self, query: str, done_after_polls: int) -> None:
+        self.sid = uuid.uuid4().hex
+        self.query = query
+        self.done_after_polls = done_after_polls
+        self.polls = 0
+
+    @property
+    def is_done(self) -> bool:
+        return self.polls >= self.done_after_polls
+
+    def poll(self) -> dict[str, Any]:
+        self.polls += 1
+        progress = min(self.polls / max(self.done_after_polls, 1), 1.0)
+        return {
+            "sid": self.sid,
+            "dispatchState": "DONE" if self.is_done else "RUNNING",
+            "isDone": "1" if self.is_done else "0",
+            "doneProgress": f"{progress:.2f}",
+            "scanCount": "1",
+            "eventCount": "1",
+            "resultCount": "1" if self.is_done else "0",
+        }
+
+
+class FakeSplunkd:
+    """
+    In-process stand-in for splunkd REST API listening on localhost over
+    https with a throwaway self signed certificate. It implements only as
+    much of the REST API as used by the framework helpers: login, search
+    jobs, indexes, KV store collections and UCC style TA CRUD endpoints.
+
+    @param latency: seconds added to every response.
+    @param done_after_polls: number of job status requests after which
+        a search job reports isDone.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        done_after_polls: int = 1,
+        version: str = "9.3.0",
+    ) -> None:
+        self.latency = latency
+        self.done_after_polls = done_after_polls
+        self.version = version
+        self.session_key = uuid.uuid4().hex
+        self.requests: Counter[str] = Counter()
+        self.jobs: dict[str, FakeSearchJob] = {}
+        self.indexes: dict[str, dict[str, Any]] = {
+            "main": {"datatype": "event"}
+        }
+        self.kvstore: dict[str, dict[str, dict[str, Any]]] = {}
+        self.ta_entities: dict[str, dict[str, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self._cert_dir: str | None = None
+
+    @property
+    def host(self) -> str:
+        return "127.0.0.1"
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None, "Fake splunkd is not started"
+        return self._server.server_address[1]
+
+    def _make_ssl_context(self) -> ssl.SSLContext:
+        openssl = shutil.which("openssl")
+        assert openssl is not None, "openssl is required by fake splunkd"
+        self._cert_dir = tempfile.mkdtemp(prefix="fake-splunkd-")
+        cert = os.path.join(self._cert_dir, "cert.pem")
+        key = os.path.join(self._cert_dir, "key.pem")
+        subprocess.run(
+            [
+                openssl,
+                "req",
+                "-x509",
+                "-newkey",
+                "rsa:2048",
+                "-nodes",
+                "-days",
+                "1",
+                "-subj",
+                "/CN=localhost",
+                "-keyout",
+                key,
+                "-out",
+                cert,
+            ],
+            check=True,
+            capture_output=True,
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        return context
+
+    def start(self) -> FakeSplunkd:
+        context = self._make_ssl_context()
+        splunkd = self
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 128
+
+            def get_request(self):
+                sock, address = super().get_request()
+                # handshake is postponed to handler thread so slow
+                # clients do not serialize accepting connections
+                return (
+                    context.wrap_socket(
+                        sock,
+                        server_side=True,
+                        do_handshake_on_connect=False,
+                    ),
+                    address,
+                )
+
+        class Handler(_FakeSplunkdHandler):
+            fake = splunkd
+
+        self._server = Server((self.host, 0), Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="fake-splunkd",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._cert_dir is not None:
+            shutil.rmtree(self._cert_dir, ignore_errors=True)
+            self._cert_dir = None
+
+    def __enter__(self) -> FakeSplunkd:
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests.clear()
+
+
+class _FakeSplunkdHandler(BaseHTTPRequestHandler):
+    fake: FakeSplunkd
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _params(self) -> dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        query = urlsplit(self.path).query
+        params = {k: v[-1] for k, v in parse_qs(query).items()}
+        if body.startswith("{"):
+            params.update(json.loads(body))
+        else:
+            params.update({k: v[-1] for k, v in parse_qs(body).items()})
+        return params
+
+    def _reply(
+        self,
+        status: int,
+        body: str | dict[str, Any] | list[Any] = "",
+    ) -> None:
+        if isinstance(body, (dict, list)):
+            payload = json.dumps(body).encode("utf-8")
+            content_type = "application/json"
+        else:
+            payload = body.encode("utf-8")
+            content_type = "text/xml; charset=utf-8"
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+        self.close_connection = True
+
+    def _dispatch(self, method: str) -> None:
+        path = urlsplit(self.path).path.rstrip("/")
+        params = self._params()
+        segments = path.split("/")[1:]
+        if segments[:1] == ["services"]:
+            route = segments[1:]
+        elif segments[:1] == ["servicesNS"] and len(segments) > 3:
+            route = segments[3:]
+        else:
+            self._reply(404)
+            return
+
+        if route[:2] == ["search", "v2"]:
+            route = ["search"] + route[2:]
+        key = "/".join(route[:2])
+        if key == "search/jobs" and len(route) > 3:
+            # job results and control are counted apart from job polls
+            key = f"{key}/{route[3]}"
+        with self.fake._lock:
+            self.fake.requests[f"{method} {key}"] += 1
+
+        if route == ["auth", "login"]:
+            self._login(params)
+            return
+        auth = self.headers.get("Authorization", "")
+        if auth != f"Splunk {self.fake.session_key}":
+            self._reply(401, "<response><messages/></response>")
+            return
+
+        if route == ["server", "info"]:
+            self._server_info()
+        elif route[:2] == ["search", "jobs"]:
+            self._search_jobs(method, route[2:], params)
+        elif route[:2] == ["data", "indexes"]:
+            self._indexes(method, route[2:], params)
+        elif route[:3] == ["storage", "collections", "data"]:
+            self._kvstore(method, route[3:], params)
+        elif route:
+            self._ta_crud(method, route, params)
+        else:
+            self._reply(404)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _login(self, params: dict[str, str]) -> None:
+        if not params.get("username"):
+            self._reply(401, "<response><messages/></response>")
+            return
+        self._reply(
+            200,
+            "<response><sessionKey>"
+            f"{self.fake.session_key}"
+            "</sessionKey></response>",
+        )
+
+    def _server_info(self) -> None:
+        entry = _atom_entry(
+            "server-info",
+            "/services/server/info/server-info",
+            {"version": self.fake.version, "serverName": "fake-splunkd"},
+        )
+        self._reply(200, _atom_feed("server-info", [entry]))
+
+    def _search_jobs(
+        self, method: str, route: list[str], params: dict[str, str]
+    ) -> None:
+        if not route and method == "POST":
+            new_job = FakeSearchJob(
+                params.get("search", ""), self.fake.done_after_polls
+            )
+            with self.fake._lock:
+                self.fake.jobs[new_job.sid] = new_job
+            self._reply(201, f"<response><sid>{new_job.sid}</sid></response>")
+            return
+        job: Optional[FakeSearchJob] = (
+            self.fake.jobs.get(route[0]) if route else None
+        )
+        if job is None:
+            self._reply(404, "<response><messages/></response>")
+        elif len(route) == 1:
+            with self.fake._lock:
+                content = job.poll()
+            path = f"/services/search/v2/jobs/{job.sid}"
+            self._reply(200, _atom_entry(job.sid, path, content, root=True))
+        elif route[1] == "results":
+            results = [{"_raw": job.query, "count": "1"}]
+            self._reply(
+                200,
+                {
+                    "preview": False,
+                    "init_offset": 0,
+                    "messages": [],
+                    "results": results if job.is_done else [],
+                },
+            )
+        elif route[1] == "control":
+            with self.fake._lock:
+                self.fake.jobs.pop(job.sid, None)
+            self._reply(200, "<response><messages/></response>")
+        else:
+            self._reply(404)
+
+    def _indexes(
+        self, method: str, route: list[str], params: dict[str, str]
+    ) -> None:
+        if method == "POST" and not route:
+            name = params["name"]
+            datatype = params.get("datatype", "event")
+            with self.fake._lock:
+                self.fake.indexes[name] = {"datatype": datatype}
+            route = [name]
+            status = 201
+        else:
+            status = 200
+        names = route[:1] or list(self.fake.indexes)
+        entries = [
+            _atom_entry(
+                name,
+                f"/services/data/indexes/{name}",
+                self.fake.indexes[name],
+            )
+            for name in names
+            if name in self.fake.indexes
+        ]
+        if route and not entries:
+            self._reply(404, "<response><messages/></response>")
+            return
+        self._reply(status, _atom_feed("indexes", entries))
+
+    def _kvstore(
+        self, method: str, route: list[str], params: dict[str, Any]
+    ) -> None:
+        if not route:
+            self._reply(404)
+            return
+        params.pop("output_mode", None)
+        with self.fake._lock:
+            collection = self.fake.kvstore.setdefault(route[0], {})
+            if len(route) == 1:
+                if method == "POST":
+                    key = params.get("_key") or uuid.uuid4().hex
+                    collection[key] = dict(params, _key=key)
+                    self._reply(201, {"_key": key})
+                else:
+                    self._reply(200, list(collection.values()))
+                return
+            record_key = route[1]
+            if method == "POST":
+                collection[record_key] = dict(params, _key=record_key)
+            elif method == "DELETE":
+                collection.pop(record_key, None)
+                self._reply(200)
+                return
+            record = collection.get(record_key)
+        if record is None:
+            self._reply(404, {"messages": [{"type": "ERROR"}]})
+        else:
+            self._reply(200, record)
+
+    def _ta_crud(
+        self, method: str, route: list[str], params: dict[str, str]
+    ) -> None:
+        params.pop("output_mode", None)
+        with self.fake._lock:
+            endpoint = self.fake.ta_entities.setdefault(route[0], {})
+            if len(route) == 1 and method == "POST":
+                name = params.pop("name")
+                if name in endpoint:
+                    self._reply(409, {"messages": [{"type": "ERROR"}]})
+                    return
+                endpoint[name] = params
+                names = [name]
+            elif len(route) == 1:
+                names = list(endpoint)
+            elif route[1] not in endpoint:
+                self._reply(404, {"messages": [{"type": "ERROR"}]})
+                return
+            elif method == "POST":
+                endpoint[route[1]].update(params)
+                names = [route[1]]
+            elif method == "DELETE":
+                endpoint.pop(route[1])
+                names = []
+            else:
+                names = [route[1]]
+            entries = [
+                {"name": name, "content": dict(endpoint[name])}
+                for name in names
+            ]
+        self._reply(200, {"entry": entries})
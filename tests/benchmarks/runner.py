@@ -0,0 +1,114 @@
+from __future__ import annotations
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    concurrency: int
+    count: int
+    duration: float
+    latencies: list[float] = field(default_factory=list, repr=False)
+    metrics: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        return self.count / self.duration if self.duration else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "name": self.name,
+            "concurrency": self.concurrency,
+            "count": self.count,
+            "duration": round(self.duration, 6),
+            "throughput": round(self.throughput, 3),
+        }
+        if self.latencies:
+            result.update(
+                mean=round(statistics.mean(self.latencies), 6),
+                p50=round(self.percentile(0.5), 6),
+                p95=round(self.percentile(0.95), 6),
+                max=round(max(self.latencies), 6),
+            )
+        result.update(self.metrics)
+        return result
+
+
+class BenchmarkRunner:
+    """
+    Calls benchmarked function given number of times from a pool of
+    threads and collects per call latency together with overall
+    throughput. Results are reported in pytest terminal summary.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        iterations: int,
+        concurrency: int,
+        results: list[BenchmarkResult],
+    ) -> None:
+        self.name = name
+        self.iterations = iterations
+        self.concurrency = concurrency
+        self._results = results
+
+    def _timed_call(self, fn: Callable[[int], Any], i: int) -> float:
+        start = time.perf_counter()
+        fn(i)
+        return time.perf_counter() - start
+
+    def run(
+        self,
+        fn: Callable[[int], Any],
+        *,
+        label: str | None = None,
+        iterations: int | None = None,
+        concurrency: int | None = None,
+    ) -> BenchmarkResult:
+        iterations = iterations or self.iterations
+        concurrency = concurrency or self.concurrency
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(
+                pool.map(lambda i: self._timed_call(fn, i), range(iterations))
+            )
+        result = BenchmarkResult(
+            name=label or self.name,
+            concurrency=concurrency,
+            count=iterations,
+            duration=time.perf_counter() - start,
+            latencies=latencies,
+        )
+        self._results.append(result)
+        return result
+
+    def record(
+        self,
+        count: int,
+        duration: float,
+        *,
+        label: str | None = None,
+        concurrency: int | None = None,
+        metrics: dict[str, Any] | None = None,
+    ) -> BenchmarkResult:
+        result = BenchmarkResult(
+            name=label or self.name,
+            concurrency=concurrency or self.concurrency,
+            count=count,
+            duration=duration,
+            metrics=metrics or {},
+        )
+        self._results.append(result)
+        return result
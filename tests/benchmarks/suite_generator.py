@@ -0,0 +1,117 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+FORGE_SCOPES = ("session", "module", "function")
+
+MODULE_HEADER = """import pytest
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+"""
+
+FORGE_TEMPLATE = """
+
+def noop_forge_{index}({args}):
+    return None
+"""
+
+TEARDOWN_FORGE_TEMPLATE = """
+
+def noop_forge_{index}({args}):
+    yield
+"""
+
+TEST_TEMPLATE = """
+
+{parametrize}@bootstrap(
+{forges}
+)
+def test_synthetic_{index}({args}):
+    pass
+"""
+
+
+@dataclass(frozen=True)
+class SuiteShape:
+    """
+    Shape of synthetic test suite: number of tests, forges bound to each
+    test, parametrizations of each test and scopes assigned to forges in
+    round robin order. Tests are evenly split between modules.
+    """
+
+    tests: int
+    forges: int
+    params: int = 1
+    scopes: tuple[str, ...] = FORGE_SCOPES
+    modules: int = 1
+
+    @classmethod
+    def parse(cls, spec: str) -> SuiteShape:
+        """
+        Parses shape in format NxMxP[xK][:scope,...], where N is number of
+        tests, M number of forges per test, P number of parametrizations
+        and K number of modules, for example "100x5x2:session,function".
+        """
+        dimensions, _, scopes = spec.partition(":")
+        values = [int(v) for v in dimensions.split("x")]
+        assert 2 <= len(values) <= 4, f"Invalid suite shape: {spec}"
+        return cls(
+            tests=values[0],
+            forges=values[1],
+            params=values[2] if len(values) > 2 else 1,
+            scopes=tuple(scopes.split(",")) if scopes else FORGE_SCOPES,
+            modules=values[3] if len(values) > 3 else 1,
+        )
+
+    @property
+    def name(self) -> str:
+        return (
+            f"{self.tests}x{self.forges}x{self.params}x{self.modules}"
+            f":{','.join(self.scopes)}"
+        )
+
+    @property
+    def collected_tests(self) -> int:
+        return self.tests * self.params
+
+
+def generate_suite(shape: SuiteShape) -> dict[str, str]:
+    """
+    Generates sources of test modules with no-op forges for given suite
+    shape. Every second forge is a generator so teardowns are exercised
+    as well. Returns mapping of module name to its source.
+    """
+    args = "test_id, param" if shape.params > 1 else "test_id"
+    forges = "".join(
+        (TEARDOWN_FORGE_TEMPLATE if i % 2 else FORGE_TEMPLATE).format(
+            index=i, args=args
+        )
+        for i in range(shape.forges)
+    )
+    parametrize = (
+        f'@pytest.mark.parametrize("param", range({shape.params}))\n'
+        if shape.params > 1
+        else ""
+    )
+    bound_forges = "\n".join(
+        f'    forge(noop_forge_{i}, scope="'
+        f'{shape.scopes[i % len(shape.scopes)]}"),'
+        for i in range(shape.forges)
+    )
+    modules: dict[str, str] = {}
+    for module_index in range(shape.modules):
+        tests = "".join(
+            TEST_TEMPLATE.format(
+                index=i,
+                parametrize=parametrize,
+                forges=bound_forges,
+                args="param" if shape.params > 1 else "",
+            )
+            for i in range(shape.tests)
+            if i % shape.modules == module_index
+        )
+        modules[f"test_synthetic_{module_index}"] = (
+            MODULE_HEADER + forges + tests
+        )
+    return modules
@@ -0,0 +1,84 @@
+import pytest
+
+from splunk_add_on_ucc_modinput_test.functional.constants import Executor
+
+SUITE_CONFTEST = """
+import time
+
+_start = None
+
+
+def pytest_sessionstart(session):
+    global _start
+    _start = time.perf_counter()
+
+
+def pytest_unconfigure(config):
+    with open("session_duration.txt", "w") as f:
+        f.write(str(time.perf_counter() - _start))
+"""
+
+SUITE_HEADER = """
+from splunk_add_on_ucc_modinput_test.common.splunk_instance import (
+    Configuration,
+    search,
+)
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+
+
+def search_forge(test_id):
+    state = search(
+        service=Configuration().service, searchquery=f"search {test_id}"
+    )
+    assert state.result_count == 1
+"""
+
+SUITE_TEST = """
+
+@bootstrap(forge(search_forge, scope="function"))
+def test_search_{index}():
+    pass
+"""
+
+
+@pytest.mark.parametrize(
+    "executor",
+    ["sequential", "parallel", "asyncio"],
+)
+def test_executor(benchmark, pytester, splunk_environment, executor):
+    threads = min(
+        max(benchmark.concurrency, Executor.MIN_THREAD_NUMBER.value),
+        Executor.MAX_THREAD_NUMBER.value,
+    )
+    args, concurrency = {
+        "sequential": (["--sequential-execution"], 1),
+        "parallel": ([f"--number-of-threads={threads}"], threads),
+        "asyncio": (
+            [
+                "--asyncio-execution",
+                f"--asyncio-max-concurrency={benchmark.concurrency}",
+                f"--number-of-threads={threads}",
+            ],
+            benchmark.concurrency,
+        ),
+    }[executor]
+    pytester.makeconftest(SUITE_CONFTEST)
+    pytester.makepyfile(
+        SUITE_HEADER
+        + "".join(
+            SUITE_TEST.format(index=i) for i in range(benchmark.iterations)
+        )
+    )
+    splunk_environment.reset_counters()
+    result = pytester.runpytest_subprocess(*args)
+    result.assert_outcomes(passed=benchmark.iterations)
+    assert (
+        splunk_environment.requests["POST search/jobs"] == benchmark.iterations
+    )
+    duration = float(
+        pytester.path.joinpath("session_duration.txt").read_text()
+    )
+    benchmark.record(benchmark.iterations, duration, concurrency=concurrency)
@@ -0,0 +1,130 @@
+import functools
+import gc
+import resource
+import sys
+import time
+from collections import defaultdict
+from typing import DefaultDict
+
+import pytest
+
+from splunk_add_on_ucc_modinput_test.functional import (
+    decorators,
+    executor,
+    manager,
+)
+from splunk_add_on_ucc_modinput_test.functional.pytest_plugin import (
+    hooks,
+    utils,
+)
+from tests.benchmarks.suite_generator import generate_suite
+
+# framework calls whose cumulative time is reported per suite shape
+TIMED_CALLS = {
+    "bind": (manager.TestDependencyManager, "bind"),
+    "expand_parametrized_tests": (
+        manager.TestDependencyManager,
+        "expand_parametrized_tests",
+    ),
+    "build_bootstrap_chains": (
+        manager.TestDependencyManager,
+        "build_bootstrap_chains",
+    ),
+    "task_chain_scheduler": (executor.TaskChainScheduler, "__init__"),
+    "task_group_processor_push": (executor.TaskGroupProcessor, "push"),
+}
+
+
+class HookTimer:
+    """
+    Pytest plugin measuring cumulative time spent in the hooks implemented
+    by the framework plugin.
+    """
+
+    def __init__(self, timings):
+        self.timings = timings
+
+    def _timed(self, name):
+        start = time.perf_counter()
+        yield
+        self.timings[f"hook:{name}"] += time.perf_counter() - start
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection_modifyitems(self):
+        yield from self._timed("pytest_collection_modifyitems")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection_finish(self):
+        yield from self._timed("pytest_collection_finish")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self):
+        yield from self._timed("pytest_runtest_setup")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self):
+        yield from self._timed("pytest_runtest_teardown")
+
+
+def _timed_call(fn, name, timings):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings[name] += time.perf_counter() - start
+
+    return wrapper
+
+
+def _gc_collections():
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def test_suite_scale(benchmark, pytester, monkeypatch, suite_shape):
+    timings: DefaultDict[str, float] = defaultdict(float)
+    for name, (owner, attr) in TIMED_CALLS.items():
+        monkeypatch.setattr(
+            owner, attr, _timed_call(getattr(owner, attr), name, timings)
+        )
+    pytester.makepyfile(**generate_suite(suite_shape))
+    # start from a clean framework state, the manager is a process wide
+    # singleton shared with previous in-process runs
+    dependency_manager = manager.TestDependencyManager()
+    for module in (manager, decorators, hooks, utils):
+        monkeypatch.setattr(module, "dependency_manager", dependency_manager)
+
+    gc.collect()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    blocks_before = sys.getallocatedblocks()
+    collections_before = _gc_collections()
+    start = time.perf_counter()
+    result = pytester.runpytest_inprocess(
+        "-p", "no:cacheprovider", plugins=[HookTimer(timings)]
+    )
+    duration = time.perf_counter() - start
+    collections = _gc_collections() - collections_before
+    blocks = sys.getallocatedblocks() - blocks_before
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    result.assert_outcomes(passed=suite_shape.collected_tests)
+    benchmark.record(
+        suite_shape.collected_tests,
+        duration,
+        concurrency=dependency_manager.number_of_threads,
+        metrics={
+            "shape": {
+                "tests": suite_shape.tests,
+                "forges": suite_shape.forges,
+                "params": suite_shape.params,
+                "modules": suite_shape.modules,
+                "scopes": list(suite_shape.scopes),
+            },
+            "phases": {k: round(v, 6) for k, v in sorted(timings.items())},
+            "peak_rss_kb": rss_after,
+            "peak_rss_growth_kb": rss_after - rss_before,
+            "allocated_blocks_growth": blocks,
+            "gc_collections": collections,
+        },
+    )
@@ -0,0 +1,120 @@
+import pytest
+
+from splunk_add_on_ucc_modinput_test.common.splunk_instance import (
+    Configuration,
+    search,
+)
+from splunk_add_on_ucc_modinput_test.common.splunk_service_pool import (
+    SplunkServicePool,
+)
+from splunk_add_on_ucc_modinput_test.functional.common.splunk_instance_kvstore import (  # noqa: E501
+    SplunkInstanceKVStoreAPI,
+)
+from splunk_add_on_ucc_modinput_test.functional.splunk import (
+    SplunkClientBase,
+)
+
+TA_NAME = "Splunk_TA_benchmark"
+
+
+class BenchmarkSplunkClient(SplunkClientBase):
+    def _bind_swagger_client(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def service_pool(splunk_environment):
+    return SplunkServicePool(
+        splunk_environment.host,
+        splunk_environment.port,
+        "admin",
+        "changeme",
+    )
+
+
+@pytest.fixture(scope="module")
+def splunk_client(splunk_environment):
+    return BenchmarkSplunkClient(Configuration())
+
+
+def test_service_pool_connect(benchmark, splunk_environment):
+    splunk_environment.reset_counters()
+    result = benchmark.run(
+        lambda i: SplunkServicePool(
+            splunk_environment.host,
+            splunk_environment.port,
+            "admin",
+            "changeme",
+            pool_initial_size=1,
+        )
+    )
+    assert splunk_environment.requests["POST auth/login"] == result.count
+
+
+def test_service_pool_request(benchmark, service_pool):
+    result = benchmark.run(lambda i: service_pool.indexes["main"])
+    assert result.count == benchmark.iterations
+
+
+def test_search(benchmark, service_pool, splunk_environment):
+    splunk_environment.reset_counters()
+    result = benchmark.run(
+        lambda i: search(service=service_pool, searchquery=f"search {i}")
+    )
+    assert splunk_environment.requests["POST search/jobs"] == result.count
+    assert splunk_environment.requests["GET search/jobs"] >= (
+        result.count * splunk_environment.done_after_polls
+    )
+    assert not splunk_environment.jobs
+
+
+def test_search_probe(benchmark, splunk_client):
+    probe_iterations = 3
+
+    def run_probe(i):
+        calls = []
+
+        def verify(state):
+            calls.append(state)
+            return len(calls) == probe_iterations
+
+        probe = splunk_client.search_probe(
+            f"search probe {i}", verify_fn=verify, interval=0
+        )
+        for _ in probe:
+            pass
+        assert len(calls) == probe_iterations
+
+    benchmark.run(run_probe)
+
+
+def test_kvstore_helper(benchmark, service_pool):
+    service_pool.post(
+        f"/servicesNS/nobody/{TA_NAME}/storage/collections/data/checkpoints",
+        headers=[("Content-Type", "application/json")],
+        body='{"_key": "input1", "offset": "100"}',
+    )
+    helper = SplunkInstanceKVStoreAPI(
+        splunk=service_pool,
+        collection_name="checkpoints",
+        record_id="input1",
+        app_name=TA_NAME,
+    )
+
+    def get_record(i):
+        assert helper.get_record_from_collection()["offset"] == "100"
+
+    benchmark.run(get_record)
+
+
+def test_ta_crud(benchmark, service_pool):
+    endpoint = f"/servicesNS/nobody/{TA_NAME}/{TA_NAME.lower()}_account"
+
+    def crud_cycle(i):
+        name = f"account_{i}"
+        service_pool.post(endpoint, name=name, username="user")
+        service_pool.get(f"{endpoint}/{name}", output_mode="json")
+        service_pool.post(f"{endpoint}/{name}", username="another")
+        service_pool.delete(f"{endpoint}/{name}")
+
+    benchmark.run(crud_cycle)
@@ -24,9 +24,10 @@ class ScenarioTester:
     SCENARIO_LOCATION = "tests/functional/flow/scenarios"
     PROJECT_FOLDER = os.getcwd()
 
-    def __init__(self, pytester: Pytester, scenario: str) -> None:
+    def __init__(self, pytester: Pytester, scenario: str, *args: str) -> None:
         self.pytester = pytester
         self.scenario = scenario
+        self.args = args
 
         self._framework_log_path = os.path.join(
             self.PROJECT_FOLDER, self.FRAMEWORK_LOG_FILE
@@ -79,11 +80,34 @@ class ScenarioTester:
         with open(full_path) as f:
             return f.read()
 
+    def _load_scenario_modules(self):
+        # scenario directory modules are placed in separate folders, in
+        # order of their names, so they are collected one after another
+        folder = os.path.join(
+            self.PROJECT_FOLDER, self.SCENARIO_LOCATION, self.scenario
+        )
+        modules = {}
+        for file_name in sorted(os.listdir(folder)):
+            name, ext = os.path.splitext(file_name)
+            if ext != ".py":
+                continue
+            with open(os.path.join(folder, file_name)) as f:
+                modules[f"{name}/test_{name}"] = f.read()
+        return modules
+
     def __enter__(self):
-        content = self._load_scenario()
-        self.test_folder = self.pytester.makepyfile(content)
+        if os.path.isdir(
+            os.path.join(
+                self.PROJECT_FOLDER, self.SCENARIO_LOCATION, self.scenario
+            )
+        ):
+            modules = self._load_scenario_modules()
+            self.test_folder = self.pytester.makepyfile(**modules)
+        else:
+            content = self._load_scenario()
+            self.test_folder = self.pytester.makepyfile(content)
         start_time = time.time()
-        self.result = self.pytester.runpytest_inprocess()
+        self.result = self.pytester.runpytest_inprocess(*self.args)
         stop_time = time.time()
         self._load_framework_log(start_time, stop_time)
         self._load_test_log(start_time, stop_time)
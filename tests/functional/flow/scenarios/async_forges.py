@@ -0,0 +1,55 @@
+import asyncio
+from typing import AsyncGenerator, Dict
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+from splunk_add_on_ucc_modinput_test.typing import ProbeAsyncGenType
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+async def async_probe(test_id: str) -> ProbeAsyncGenType:
+    for _ in range(2):
+        logger.info(f"async_probe for test_id={test_id} is negative")
+        yield 1
+    logger.info(f"async_probe for test_id={test_id} has succeeded")
+    yield True
+
+
+async def async_forge(test_id: str) -> Dict[str, object]:
+    logger.info(f"async_forge for test_id={test_id} started")
+    await asyncio.sleep(0.1)
+    return dict(async_forge_test_id=test_id)
+
+
+async def async_gen_forge(
+    test_id: str, async_probe: bool
+) -> AsyncGenerator[Dict[str, object], None]:
+    logger.info(f"async_gen_forge for test_id={test_id} setup")
+    await asyncio.sleep(0.1)
+    yield dict(async_gen_forge_probe=async_probe)
+    await asyncio.sleep(0.1)
+    logger.info(f"async_gen_forge for test_id={test_id} teardown")
+
+
+def sync_forge(test_id: str) -> Dict[str, object]:
+    logger.info(f"sync_forge for test_id={test_id} executed")
+    return dict(sync_forge_test_id=test_id)
+
+
+@bootstrap(
+    forge(async_forge, probe=async_probe),
+    forge(async_gen_forge),
+    forge(sync_forge),
+)
+def test_async_forges(
+    test_id: str,
+    async_forge_test_id: str,
+    async_gen_forge_probe: bool,
+    sync_forge_test_id: str,
+) -> None:
+    logger.info("test_async_forges execution")
+    assert test_id == async_forge_test_id == sync_forge_test_id
+    assert async_gen_forge_probe is True
@@ -0,0 +1,42 @@
+import time
+from typing import Dict, Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def shared_forge() -> Generator[None, None, None]:
+    logger.info("shared_forge setup")
+    yield
+    logger.info("shared_forge teardown")
+
+
+def slow_forge(test_id: str) -> Generator[Dict[str, str], None, None]:
+    yield dict(resource=f"resource-{test_id}")
+    time.sleep(1)
+    logger.info(f"slow_forge teardown for test_id={test_id}")
+
+
+def failing_forge(test_id: str) -> Generator[None, None, None]:
+    yield
+    time.sleep(1)
+    raise RuntimeError(f"failing_forge teardown for test_id={test_id}")
+
+
+@bootstrap(forge(shared_forge), forge(failing_forge, scope="function"))
+def test_failing_teardown() -> None:
+    logger.info("test_failing_teardown execution")
+
+
+@bootstrap(forge(shared_forge), forge(slow_forge, scope="function"))
+def test_first(resource: str) -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(forge(shared_forge), forge(slow_forge, scope="function"))
+def test_second(resource: str) -> None:
+    logger.info("test_second execution")
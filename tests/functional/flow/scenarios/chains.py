@@ -0,0 +1,38 @@
+import time
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def slow_forge(test_id: str) -> None:
+    logger.info(f"slow_forge for test_id={test_id} started")
+    time.sleep(3)
+    logger.info(f"slow_forge for test_id={test_id} complete")
+
+
+def fast_forge(test_id: str) -> None:
+    logger.info(f"fast_forge for test_id={test_id} complete")
+
+
+def dependent_forge(test_id: str) -> None:
+    logger.info(f"dependent_forge for test_id={test_id} complete")
+
+
+@bootstrap(
+    forge(slow_forge),
+    forge(dependent_forge),
+)
+def test_slow_chain() -> None:
+    logger.info("test_slow_chain execution")
+
+
+@bootstrap(
+    forge(fast_forge),
+    forge(dependent_forge),
+)
+def test_fast_chain() -> None:
+    logger.info("test_fast_chain execution")
@@ -0,0 +1,39 @@
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def short_chain_forge(test_id: str) -> None:
+    logger.info(f"short_chain_forge for test_id={test_id} complete")
+
+
+def long_chain_first_forge(test_id: str) -> None:
+    logger.info(f"long_chain_first_forge for test_id={test_id} complete")
+
+
+def long_chain_second_forge(test_id: str) -> None:
+    logger.info(f"long_chain_second_forge for test_id={test_id} complete")
+
+
+def long_chain_third_forge(test_id: str) -> None:
+    logger.info(f"long_chain_third_forge for test_id={test_id} complete")
+
+
+@bootstrap(
+    forge(short_chain_forge),
+)
+def test_short_chain() -> None:
+    logger.info("test_short_chain execution")
+
+
+@bootstrap(
+    forge(long_chain_first_forge),
+    forge(long_chain_second_forge),
+    forge(long_chain_third_forge),
+)
+def test_long_chain() -> None:
+    logger.info("test_long_chain execution")
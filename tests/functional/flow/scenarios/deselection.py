@@ -0,0 +1,32 @@
+import pytest
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def selected_forge(test_id: str) -> None:
+    logger.info(f"selected_forge for test_id={test_id} executed")
+
+
+def deselected_forge(test_id: str) -> None:
+    logger.info(f"deselected_forge for test_id={test_id} executed")
+
+
+@bootstrap(forge(selected_forge))
+def test_selected() -> None:
+    logger.info("test_selected execution")
+
+
+@bootstrap(forge(deselected_forge))
+def test_deselected() -> None:
+    logger.info("test_deselected execution")
+
+
+@pytest.mark.parametrize("param", ["param1", "param2"])
+@bootstrap(forge(deselected_forge))
+def test_deselected_parametrized(param: str) -> None:
+    logger.info(f"test_deselected_parametrized execution, param={param}")
@@ -0,0 +1,23 @@
+import time
+import pytest
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def blocking_forge(test_id: str, index: int) -> None:
+    # blocks workers for several pool checks
+    time.sleep(4)
+    logger.info(f"blocking_forge {index} for test_id={test_id} complete")
+
+
+@pytest.mark.parametrize("index", list(range(12)))
+@bootstrap(
+    forge(blocking_forge),
+)
+def test_elastic_pool(index: int) -> None:
+    logger.info(f"test_elastic_pool {index} execution")
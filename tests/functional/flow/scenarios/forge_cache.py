@@ -0,0 +1,30 @@
+from typing import Dict
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def cached_forge(name: str) -> Dict[str, str]:
+    logger.info(f"cached_forge for name={name} setup")
+    return dict(resource=f"resource-{name}")
+
+
+def cleanup_cached_forge(name: str, resource: str) -> None:
+    logger.info(f"cached_forge for name={name} cleanup, resource={resource}")
+
+
+@bootstrap(
+    forge(
+        cached_forge,
+        name="index1",
+        cache_version="1",
+        cache_cleanup=cleanup_cached_forge,
+    )
+)
+def test_cached_forge(resource: str) -> None:
+    logger.info(f"test_cached_forge execution, resource={resource}")
+    assert resource == "resource-index1"
@@ -0,0 +1,20 @@
+from typing import Dict, Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def cached_forge_with_teardown(
+    name: str,
+) -> Generator[Dict[str, str], None, None]:
+    yield dict(resource=f"resource-{name}")
+    logger.info(f"cached_forge_with_teardown for name={name} teardown")
+
+
+@bootstrap(forge(cached_forge_with_teardown, name="index1", cache_version="1"))
+def test_cached_forge_with_teardown(resource: str) -> None:
+    logger.info("test_cached_forge_with_teardown execution")
@@ -0,0 +1,48 @@
+import time
+from typing import Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+from splunk_add_on_ucc_modinput_test.typing import ProbeGenType
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def busy_wait(seconds: float) -> None:
+    end = time.time() + seconds
+    while time.time() < end:
+        pass
+
+
+def busy_probe() -> ProbeGenType:
+    busy_wait(0.1)
+    yield 1
+    return True
+
+
+def busy_forge() -> Generator[None, None, None]:
+    busy_wait(0.1)
+    yield
+    busy_wait(0.1)
+
+
+def quick_forge(test_id: str) -> None:
+    logger.info(f"quick_forge for test_id={test_id}")
+
+
+@bootstrap(
+    forge(busy_forge, probe=busy_probe),
+    forge(quick_forge, scope="function"),
+)
+def test_first() -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(
+    forge(busy_forge, probe=busy_probe),
+    forge(quick_forge, scope="function"),
+)
+def test_second() -> None:
+    logger.info("test_second execution")
@@ -0,0 +1,26 @@
+import time
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def slow_forge() -> None:
+    time.sleep(1)
+
+
+def fast_forge() -> None:
+    pass
+
+
+@bootstrap(forge(slow_forge))
+def test_slow() -> None:
+    logger.info("test_slow execution")
+
+
+@bootstrap(forge(fast_forge))
+def test_fast() -> None:
+    logger.info("test_fast execution")
@@ -0,0 +1,42 @@
+import time
+from typing import Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+from splunk_add_on_ucc_modinput_test.typing import ProbeGenType
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def slow_probe() -> ProbeGenType:
+    time.sleep(0.2)
+    yield 1
+    return True
+
+
+def slow_shared_forge() -> Generator[None, None, None]:
+    time.sleep(0.5)
+    yield
+    logger.info("slow_shared_forge teardown")
+
+
+def quick_forge(test_id: str) -> None:
+    logger.info(f"quick_forge for test_id={test_id}")
+
+
+@bootstrap(
+    forge(slow_shared_forge, probe=slow_probe),
+    forge(quick_forge, scope="function"),
+)
+def test_first() -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(
+    forge(slow_shared_forge, probe=slow_probe),
+    forge(quick_forge, scope="function"),
+)
+def test_second() -> None:
+    logger.info("test_second execution")
@@ -0,0 +1,54 @@
+from typing import Generator
+from splunk_add_on_ucc_modinput_test.common.otlp import traced_http_handler
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+from splunk_add_on_ucc_modinput_test.typing import ProbeGenType
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def _splunkd_handler(url, message, **kwargs):
+    return {"status": 200, "reason": "OK", "headers": [], "body": ""}
+
+
+# stands for splunklib connection of Splunk client
+splunkd_request = traced_http_handler(_splunkd_handler)
+
+
+def ready_probe() -> ProbeGenType:
+    splunkd_request("https://localhost:8089/services/search/jobs", {})
+    yield 1
+    return True
+
+
+def shared_forge() -> Generator[None, None, None]:
+    splunkd_request(
+        "https://localhost:8089/services/data/inputs", {"method": "POST"}
+    )
+    yield
+    splunkd_request(
+        "https://localhost:8089/services/data/inputs", {"method": "DELETE"}
+    )
+
+
+def function_forge(test_id: str) -> None:
+    logger.info(f"function_forge for test_id={test_id}")
+
+
+@bootstrap(
+    forge(shared_forge, probe=ready_probe),
+    forge(function_forge, scope="function"),
+)
+def test_first() -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(
+    forge(shared_forge, probe=ready_probe),
+    forge(function_forge, scope="function"),
+)
+def test_second() -> None:
+    splunkd_request("https://localhost:8089/services/server/info", {})
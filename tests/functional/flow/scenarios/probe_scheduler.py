@@ -0,0 +1,28 @@
+import pytest
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+from splunk_add_on_ucc_modinput_test.typing import ProbeGenType
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def sleeping_probe(test_id: str) -> ProbeGenType:
+    for _ in range(3):
+        yield 1
+    logger.info(f"sleeping_probe for test_id={test_id} has succeeded")
+    return True
+
+
+def probed_forge(test_id: str, index: int) -> None:
+    logger.info(f"probed_forge {index} for test_id={test_id} complete")
+
+
+@pytest.mark.parametrize("index", list(range(12)))
+@bootstrap(
+    forge(probed_forge, probe=sleeping_probe),
+)
+def test_probe_scheduler(index: int) -> None:
+    logger.info(f"test_probe_scheduler {index} execution")
@@ -0,0 +1,36 @@
+import os
+from typing import Dict, Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def process_forge(
+    test_id: str, numbers: int
+) -> Generator[Dict[str, object], None, None]:
+    pid = os.getpid()
+    logger.info(f"process_forge for test_id={test_id} setup in pid={pid}")
+    total = sum(i * i for i in range(numbers))
+    yield dict(forge_pid=pid, total=total)
+    logger.info(f"process_forge for test_id={test_id} teardown in pid={pid}")
+    assert os.getpid() == pid
+
+
+def failing_process_forge(test_id: str) -> None:
+    raise ValueError(f"failing_process_forge for test_id={test_id} failed")
+
+
+@bootstrap(forge(process_forge, numbers=1000, use_process_pool=True))
+def test_process_forge(forge_pid: int, total: int) -> None:
+    logger.info("test_process_forge execution")
+    assert forge_pid != os.getpid()
+    assert total == sum(i * i for i in range(1000))
+
+
+@bootstrap(forge(failing_process_forge, use_process_pool=True))
+def test_failing_process_forge() -> None:
+    logger.info("test_failing_process_forge execution")
@@ -0,0 +1,48 @@
+import time
+from typing import Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+    resource,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+splunkd_restart = resource("splunkd_restart")
+vendor_api = resource("vendor_api", max_concurrency=None, rate_limit=10.0)
+
+
+def restart_forge(test_id: str) -> Generator[None, None, None]:
+    logger.info(f"restart_forge for test_id={test_id} start")
+    time.sleep(0.3)
+    logger.info(f"restart_forge for test_id={test_id} end")
+    yield
+
+
+def api_forge(test_id: str) -> None:
+    logger.info(f"api_forge for test_id={test_id}")
+
+
+@bootstrap(
+    forge(restart_forge, scope="function", resources=[splunkd_restart]),
+    forge(api_forge, scope="function", resources=[vendor_api]),
+)
+def test_first() -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(
+    forge(restart_forge, scope="function", resources=[splunkd_restart]),
+    forge(api_forge, scope="function", resources=[vendor_api]),
+)
+def test_second() -> None:
+    logger.info("test_second execution")
+
+
+@bootstrap(
+    forge(restart_forge, scope="function", resources=[splunkd_restart]),
+    forge(api_forge, scope="function", resources=[vendor_api]),
+)
+def test_third() -> None:
+    logger.info("test_third execution")
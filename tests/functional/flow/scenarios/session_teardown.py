@@ -0,0 +1,37 @@
+import time
+from typing import Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def base_forge() -> Generator[None, None, None]:
+    logger.info("base_forge setup")
+    yield
+    logger.info("base_forge teardown")
+
+
+def first_forge() -> Generator[None, None, None]:
+    yield
+    time.sleep(1)
+    logger.info("first_forge teardown")
+
+
+def second_forge() -> Generator[None, None, None]:
+    yield
+    time.sleep(1)
+    logger.info("second_forge teardown")
+
+
+@bootstrap(forge(base_forge), forge(first_forge))
+def test_first() -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(forge(base_forge), forge(second_forge))
+def test_second() -> None:
+    logger.info("test_second execution")
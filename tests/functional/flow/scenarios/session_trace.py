@@ -0,0 +1,40 @@
+from typing import Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+from splunk_add_on_ucc_modinput_test.typing import ProbeGenType
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def ready_probe() -> ProbeGenType:
+    yield 1
+    return True
+
+
+def shared_forge() -> Generator[None, None, None]:
+    logger.info("shared_forge setup")
+    yield
+    logger.info("shared_forge teardown")
+
+
+def function_forge(test_id: str) -> None:
+    logger.info(f"function_forge for test_id={test_id}")
+
+
+@bootstrap(
+    forge(shared_forge, probe=ready_probe),
+    forge(function_forge, scope="function"),
+)
+def test_first() -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(
+    forge(shared_forge, probe=ready_probe),
+    forge(function_forge, scope="function"),
+)
+def test_second() -> None:
+    logger.info("test_second execution")
@@ -0,0 +1,39 @@
+from typing import Dict, Generator
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def shared_forge(session_id: str) -> Generator[Dict[str, str], None, None]:
+    logger.info("shared_forge setup")
+    yield dict(shared=f"shared-{session_id}")
+    logger.info("shared_forge teardown")
+
+
+def deselected_forge() -> Generator[None, None, None]:
+    logger.info("deselected_forge setup")
+    yield
+    logger.info("deselected_forge teardown")
+
+
+def function_forge(test_id: str) -> None:
+    logger.info(f"function_forge for test_id={test_id} executed")
+
+
+@bootstrap(forge(shared_forge), forge(function_forge, scope="function"))
+def test_first(shared: str) -> None:
+    logger.info("test_first execution")
+
+
+@bootstrap(forge(shared_forge))
+def test_second(shared: str) -> None:
+    logger.info("test_second execution")
+
+
+@bootstrap(forge(deselected_forge))
+def test_deselected() -> None:
+    logger.info("test_deselected execution")
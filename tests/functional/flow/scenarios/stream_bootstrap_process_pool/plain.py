@@ -0,0 +1,18 @@
+from typing import Dict
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def plain_forge(test_id: str) -> Dict[str, str]:
+    logger.info(f"plain_forge for test_id={test_id} executed")
+    return dict(plain=f"plain-{test_id}")
+
+
+@bootstrap(forge(plain_forge))
+def test_plain(plain: str) -> None:
+    logger.info("test_plain execution")
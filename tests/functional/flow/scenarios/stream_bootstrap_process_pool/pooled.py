@@ -0,0 +1,19 @@
+import os
+from typing import Dict
+from splunk_add_on_ucc_modinput_test.functional.decorators import (
+    bootstrap,
+    forge,
+)
+import logging
+
+logger = logging.getLogger("ucc-modinput-test")
+
+
+def pooled_forge(test_id: str) -> Dict[str, int]:
+    return dict(forge_pid=os.getpid())
+
+
+@bootstrap(forge(pooled_forge, use_process_pool=True))
+def test_pooled(forge_pid: int) -> None:
+    logger.info("test_pooled execution")
+    assert forge_pid != os.getpid()
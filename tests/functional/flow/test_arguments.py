@@ -1,3 +1,8 @@
+import json
+from fnmatch import fnmatch
+from splunk_add_on_ucc_modinput_test.functional.common.latency_stats import (
+    latency_stats,
+)
 from tests.functional.common import ScenarioTester
 
 
@@ -47,12 +52,21 @@ def test_parametrized(pytester):
         tester.framework_log_matcher.no_fnmatch_line(
             "*Traceback (most recent call last):*"
         )
-        tester.test_log_matcher.fnmatch_lines(
+        # forges of each parametrized test are executed as a separate chain
+        tester.test_log_matcher.fnfilter_lines("*param?-1").fnmatch_lines(
             [
                 "*forge1 test_id=*, parametrized_param1=param1-1",
-                "*forge1 test_id=*, parametrized_param1=param-2",
                 "*forge2 test_id=*, parametrized_param2=param2-1",
+            ]
+        )
+        tester.test_log_matcher.fnfilter_lines("*param*-2").fnmatch_lines(
+            [
+                "*forge1 test_id=*, parametrized_param1=param-2",
                 "*forge2 test_id=*, parametrized_param2=param2-2",
+            ]
+        )
+        tester.test_log_matcher.fnmatch_lines(
+            [
                 "*test_parametrized - test_parametrized test_id=* execution",
                 "*test_parametrized - test_parametrized test_id=* execution",
             ]
@@ -89,3 +103,497 @@ def test_probes(pytester):
                 "*test_probes execution started",
             ]
         )
+
+
+def test_chains(pytester):
+    with ScenarioTester(pytester, "chains") as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.framework_log_matcher.no_fnmatch_line(
+            "*Traceback (most recent call last):*"
+        )
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*fast_forge for test_id=* complete",
+                "*dependent_forge for test_id=* complete",
+                "*slow_forge for test_id=* complete",
+                "*dependent_forge for test_id=* complete",
+            ]
+        )
+
+
+def test_critical_path(pytester):
+    with ScenarioTester(
+        pytester, "critical_path", "--sequential-execution"
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*long_chain_first_forge for test_id=* complete",
+                "*long_chain_second_forge for test_id=* complete",
+                "*short_chain_forge for test_id=* complete",
+                "*long_chain_third_forge for test_id=* complete",
+            ]
+        )
+
+
+def test_elastic_pool(pytester):
+    with ScenarioTester(
+        pytester,
+        "elastic_pool",
+        "--number-of-threads=10",
+        "--max-number-of-threads=12",
+    ) as tester:
+        tester.result.assert_outcomes(passed=12)
+        # the pool grows once, when all 10 workers are blocked
+        tester.framework_log_matcher.fnmatch_lines(
+            ["*Worker pool grows from 10 to 12 threads: queued jobs: 2*"]
+        )
+        tester.framework_log_matcher.no_fnmatch_line(
+            "*Worker pool grows from 1[12] to*"
+        )
+
+
+def test_probe_scheduler(pytester):
+    with ScenarioTester(
+        pytester,
+        "probe_scheduler",
+        "--number-of-threads=10",
+        "--max-number-of-threads=10",
+    ) as tester:
+        tester.result.assert_outcomes(passed=12)
+        tester.framework_log_matcher.fnmatch_lines(
+            ["*task * probe is scheduled in 1 seconds*"]
+        )
+        tester.test_log_matcher.fnmatch_lines(
+            ["*sleeping_probe for test_id=* has succeeded"] * 12
+        )
+
+
+ASYNC_FORGES_LOG = [
+    "*async_forge for test_id=* started",
+    "*async_probe for test_id=* is negative",
+    "*async_probe for test_id=* is negative",
+    "*async_probe for test_id=* has succeeded",
+    "*async_gen_forge for test_id=* setup",
+    "*sync_forge for test_id=* executed",
+    "*test_async_forges execution",
+    "*async_gen_forge for test_id=* teardown",
+]
+
+
+def test_async_forges(pytester):
+    with ScenarioTester(pytester, "async_forges") as tester:
+        tester.result.assert_outcomes(passed=1)
+        tester.framework_log_matcher.no_fnmatch_line(
+            "*Traceback (most recent call last):*"
+        )
+        tester.test_log_matcher.fnmatch_lines(ASYNC_FORGES_LOG)
+
+
+def test_async_forges_asyncio_execution(pytester):
+    with ScenarioTester(
+        pytester, "async_forges", "--asyncio-execution"
+    ) as tester:
+        tester.result.assert_outcomes(passed=1)
+        tester.framework_log_matcher.no_fnmatch_line(
+            "*Traceback (most recent call last):*"
+        )
+        tester.test_log_matcher.fnmatch_lines(ASYNC_FORGES_LOG)
+
+
+def test_process_pool(pytester):
+    with ScenarioTester(
+        pytester, "process_pool", "--number-of-processes=2"
+    ) as tester:
+        tester.result.assert_outcomes(passed=1, errors=1)
+        tester.result.stdout.fnmatch_lines(
+            ["*ValueError: failing_process_forge for test_id=* failed*"]
+        )
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*process_forge for test_id=* setup in pid=*",
+                "*test_process_forge execution",
+                "*process_forge for test_id=* teardown in pid=*",
+            ]
+        )
+        tester.test_log_matcher.no_fnmatch_line(
+            "*test_failing_process_forge execution"
+        )
+
+
+def test_forge_cache(pytester):
+    with ScenarioTester(pytester, "forge_cache") as tester:
+        tester.result.assert_outcomes(passed=1)
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*cached_forge for name=index1 setup",
+                "*test_cached_forge execution, resource=resource-index1",
+            ]
+        )
+        # cleanup of cached result is deferred to cache purge
+        tester.test_log_matcher.no_fnmatch_line("*cached_forge * cleanup*")
+
+
+def test_forge_cache_purge(pytester):
+    with ScenarioTester(
+        pytester, "forge_cache", "--purge-forge-cache"
+    ) as tester:
+        tester.result.assert_outcomes(passed=1)
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*cached_forge for name=index1 setup",
+                "*test_cached_forge execution, resource=resource-index1",
+                # result is not cached, so cleanup is executed as teardown
+                "*cached_forge for name=index1 cleanup, "
+                "resource=resource-index1",
+            ]
+        )
+
+
+def test_forge_cache_teardown(pytester):
+    with ScenarioTester(pytester, "forge_cache_teardown") as tester:
+        tester.result.assert_outcomes(errors=1)
+        tester.result.stdout.fnmatch_lines(
+            [
+                "*Forge * with teardown can not be declared with "
+                "cache_version*"
+            ]
+        )
+
+
+def test_deselection(pytester):
+    with ScenarioTester(
+        pytester, "deselection", "-k", "not test_deselected"
+    ) as tester:
+        tester.result.assert_outcomes(passed=1, deselected=3)
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*selected_forge for test_id=* executed",
+                "*test_selected execution",
+            ]
+        )
+        tester.test_log_matcher.no_fnmatch_line("*deselected_forge*")
+
+
+def test_stream_bootstrap(pytester):
+    with ScenarioTester(
+        pytester,
+        "stream_bootstrap",
+        "--stream-bootstrap",
+        "-k",
+        "not test_deselected",
+    ) as tester:
+        tester.result.assert_outcomes(passed=2, deselected=1)
+        tester.framework_log_matcher.fnmatch_lines(
+            [
+                "*Streaming bootstrap forges of 3 collected tests*",
+                "*Speculative forge execution has been torn down*",
+            ]
+        )
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*deselected_forge setup",
+                "*deselected_forge teardown",
+                "*function_forge for test_id=* executed",
+            ]
+        )
+        tester.test_log_matcher.fnfilter_lines("*shared_forge*").fnmatch_lines(
+            ["*shared_forge setup", "*shared_forge teardown"], consecutive=True
+        )
+        assert (
+            len(tester.test_log_matcher.fnfilter_lines("*shared_forge*").lines)
+            == 2
+        )
+        tester.test_log_matcher.no_fnmatch_line("*test_deselected execution")
+
+
+def test_stream_bootstrap_process_pool(pytester):
+    # process pool forge is declared in module collected after the first
+    # collection report has already started streamed bootstrap execution
+    with ScenarioTester(
+        pytester,
+        "stream_bootstrap_process_pool",
+        "--stream-bootstrap",
+        "--number-of-processes=1",
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.test_log_matcher.fnmatch_lines(
+            [
+                "*plain_forge for test_id=* executed",
+                "*test_plain execution",
+                "*test_pooled execution",
+            ]
+        )
+        tester.framework_log_matcher.no_fnmatch_line("*ModuleNotFoundError*")
+
+
+def test_background_teardown(pytester):
+    with ScenarioTester(
+        pytester,
+        "background_teardown",
+        "--number-of-teardown-threads=2",
+    ) as tester:
+        tester.result.assert_outcomes(passed=3, errors=1)
+        tester.result.stdout.fnmatch_lines(
+            ["*ERROR at teardown of test_failing_teardown*"]
+        )
+        # tests do not wait for slow teardowns of previous tests
+        lines = tester.test_log_matcher.lines
+        executions = [
+            i for i, line in enumerate(lines) if fnmatch(line, "*execution")
+        ]
+        teardowns = [
+            i
+            for i, line in enumerate(lines)
+            if fnmatch(line, "*slow_forge teardown*")
+        ]
+        assert len(executions) == 3 and len(teardowns) == 2
+        assert max(executions) < min(teardowns)
+        # shared forge is torn down after its dependents
+        tester.test_log_matcher.fnfilter_lines("*teardown*").fnmatch_lines(
+            [
+                "*slow_forge teardown for test_id=*",
+                "*slow_forge teardown for test_id=*",
+                "*shared_forge teardown",
+            ]
+        )
+        tester.framework_log_matcher.fnmatch_lines(
+            ["*Waiting for * tests teardowns to finish*"]
+        )
+
+
+def test_parallel_session_teardown(pytester):
+    with ScenarioTester(
+        pytester,
+        "session_teardown",
+        "--parallel-session-teardown",
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.framework_log_matcher.fnmatch_lines(
+            ["*Executing 3 deferred forge teardowns in parallel*"]
+        )
+        # all session forges are torn down at the end of session
+        lines = tester.test_log_matcher.lines
+        executions = [
+            i for i, line in enumerate(lines) if fnmatch(line, "*execution")
+        ]
+        teardowns = [
+            i for i, line in enumerate(lines) if fnmatch(line, "*teardown")
+        ]
+        assert len(executions) == 2 and len(teardowns) == 3
+        assert max(executions) < min(teardowns)
+        # base forge is torn down after independent teardowns of its
+        # dependents
+        tester.test_log_matcher.fnfilter_lines("*teardown").fnmatch_lines(
+            [
+                "*_forge teardown",
+                "*_forge teardown",
+                "*base_forge teardown",
+            ]
+        )
+
+
+# forges sharing resource with concurrency limit 1 never overlap
+RESOURCE_LIMITS_LOG = [
+    "*restart_forge for test_id=* start",
+    "*restart_forge for test_id=* end",
+    "*restart_forge for test_id=* start",
+    "*restart_forge for test_id=* end",
+    "*restart_forge for test_id=* start",
+    "*restart_forge for test_id=* end",
+]
+
+
+def test_resource_limits(pytester):
+    with ScenarioTester(pytester, "resource_limits") as tester:
+        tester.result.assert_outcomes(passed=3)
+        tester.framework_log_matcher.no_fnmatch_line(
+            "*Traceback (most recent call last):*"
+        )
+        tester.test_log_matcher.fnfilter_lines(
+            "*restart_forge*"
+        ).fnmatch_lines(RESOURCE_LIMITS_LOG, consecutive=True)
+        tester.test_log_matcher.fnmatch_lines(["*api_forge for test_id=*"])
+
+
+def test_resource_limits_asyncio_execution(pytester):
+    with ScenarioTester(
+        pytester, "resource_limits", "--asyncio-execution"
+    ) as tester:
+        tester.result.assert_outcomes(passed=3)
+        tester.framework_log_matcher.no_fnmatch_line(
+            "*Traceback (most recent call last):*"
+        )
+        tester.test_log_matcher.fnfilter_lines(
+            "*restart_forge*"
+        ).fnmatch_lines(RESOURCE_LIMITS_LOG, consecutive=True)
+
+
+def test_history_test_order(pytester):
+    # forge timings recorded by a previous test session
+    source = pytester.path / "test_history_test_order.py"
+    timings = pytester.path / ".pytest_cache/v/ucc_modinput_test/forge_timings"
+    timings.parent.mkdir(parents=True)
+    timings.write_text(
+        json.dumps(
+            {f"{source}::slow_forge": 1.0, f"{source}::fast_forge": 0.0}
+        )
+    )
+    with ScenarioTester(
+        pytester, "history_order", "--history-test-order"
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.framework_log_matcher.fnmatch_lines(
+            ["*test_fast*expected to be ready in 0.00 seconds"]
+        )
+        tester.test_log_matcher.fnmatch_lines(
+            ["*test_fast execution", "*test_slow execution"]
+        )
+
+
+def test_trace_file(pytester):
+    with ScenarioTester(
+        pytester, "session_trace", "--trace-file=trace.json"
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.framework_log_matcher.fnmatch_lines(
+            ["*Session trace with * events saved to trace.json"]
+        )
+
+    with open(pytester.path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    spans = {(e["cat"], e["name"]) for e in events if e["ph"] == "X"}
+    assert {
+        ("forge", "shared_forge"),
+        ("forge", "function_forge"),
+        ("probe", "ready_probe"),
+        ("teardown", "shared_forge teardown"),
+        ("executor", "queue wait"),
+        ("pytest", "bootstrap wait"),
+    } <= spans
+    instants = {e["name"] for e in events if e["ph"] == "i"}
+    assert "shared_forge reused" in instants
+    # spans are tagged with worker threads and test keys
+    thread_names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert "MainThread" in thread_names and len(thread_names) > 1
+    function_forges = [e for e in events if e.get("name") == "function_forge"]
+    assert {
+        e["args"]["test"].rsplit("::", 1)[-1] for e in function_forges
+    } == {
+        "test_first",
+        "test_second",
+    }
+
+
+def test_latency_summary(pytester):
+    with ScenarioTester(
+        pytester, "latency_summary", "--latency-summary-size=5"
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.result.stdout.fnmatch_lines(
+            [
+                "*forge latency summary*",
+                "Slowest forges:",
+                "*count*p50 s*p95 s*max s*reused*name",
+                "*1*1*test_latency_summary.py::slow_shared_forge",
+                "*2*0*test_latency_summary.py::quick_forge",
+                "Slowest probes:",
+                "*1*test_latency_summary.py::slow_probe",
+                "Slowest teardowns:",
+                "*test_latency_summary.py::slow_shared_forge",
+                "Worker busy time: * seconds, idle time: * seconds (*% busy)",
+            ]
+        )
+
+    # statistics of the session are not left to the outer test session
+    assert latency_stats.summary_lines(5) == []
+
+
+def test_otlp_file(pytester):
+    with ScenarioTester(
+        pytester, "otlp_trace", "--otlp-file=spans.json"
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+
+    with open(pytester.path / "spans.json") as f:
+        request = json.load(f)
+    spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_id = {span["spanId"]: span for span in spans}
+
+    def attributes(span):
+        return {a["key"]: a["value"] for a in span["attributes"]}
+
+    def parent(span):
+        return by_id[span["parentSpanId"]]
+
+    (session,) = [span for span in spans if "parentSpanId" not in span]
+    assert session["name"] == "test session"
+    session_id = attributes(session)["session_id"]
+    tests = {
+        span["name"].rsplit("::", 1)[-1]: span
+        for span in spans
+        if span.get("parentSpanId") == session["spanId"]
+    }
+    assert set(tests) == {"test_first", "test_second"}
+    for span in spans:
+        assert attributes(span)["session_id"] == session_id
+
+    names = [span["name"] for span in spans]
+    assert names.count("function_forge") == 2
+    for span in spans:
+        if span["name"] == "function_forge":
+            assert parent(span) in tests.values()
+            assert (
+                attributes(span)["test_id"]
+                == attributes(parent(span))["test_id"]
+            )
+    # REST calls are children of the forge, probe iteration, teardown or
+    # test they are made from
+    rest_parents = {
+        (span["name"], parent(span)["name"].rsplit("::", 1)[-1])
+        for span in spans
+        if span["kind"] == 3
+    }
+    assert rest_parents == {
+        ("POST /services/data/inputs", "shared_forge"),
+        ("GET /services/search/jobs", "ready_probe"),
+        ("DELETE /services/data/inputs", "shared_forge teardown"),
+        ("GET /services/server/info", "test_second"),
+    }
+    # one span per probe iteration
+    probes = [span for span in spans if span["name"] == "ready_probe"]
+    assert len(probes) == 2
+    assert {parent(probe)["name"] for probe in probes} == {"shared_forge"}
+
+
+def test_profile_forges(pytester):
+    with ScenarioTester(
+        pytester,
+        "forge_profiles",
+        "--profile-forges",
+        "--profile-forges-filter=busy_*",
+        "--profile-forges-dir=profiles",
+    ) as tester:
+        tester.result.assert_outcomes(passed=2)
+        tester.framework_log_matcher.fnmatch_lines(
+            ["*Forge profiles of 1 executions saved to profiles"]
+        )
+
+    profiles = pytester.path / "profiles"
+    (execution,) = [
+        p.name for p in profiles.iterdir() if p.name != "session.collapsed"
+    ]
+    assert fnmatch(execution, "test_profile_forges.busy_forge-*.collapsed")
+    with open(profiles / "session.collapsed") as f:
+        stacks = [line.rsplit(" ", 1)[0].split(";") for line in f]
+    # forge setup, probe and teardown are sampled down to busy_wait calls
+    busy_stacks = {
+        stack[1]: [frame.split(" ")[0] for frame in stack[2:]]
+        for stack in stacks
+        if stack[-1].startswith("busy_wait")
+    }
+    assert set(busy_stacks) == {"setup", "probe", "teardown"}
+    assert "busy_forge" in busy_stacks["setup"]
+    assert "busy_probe" in busy_stacks["probe"]
+    assert "busy_forge" in busy_stacks["teardown"]
+    assert all(stack[0].endswith("::busy_forge") for stack in stacks)
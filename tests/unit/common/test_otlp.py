@@ -0,0 +1,85 @@
+import json
+
+import pytest
+from splunk_add_on_ucc_modinput_test.common.otlp import (
+    SPAN_KIND_CLIENT,
+    OtlpTracer,
+    otlp_tracer,
+    traced_http_handler,
+)
+
+
+def _fake_handler(url, message, **kwargs):
+    return {"status": 200, "reason": "OK", "headers": [], "body": ""}
+
+
+def test_spans_are_not_recorded_before_start():
+    tracer = OtlpTracer()
+    assert tracer.start_span("forge") is None
+    with tracer.span("forge") as span:
+        assert span is None
+
+
+def test_spans_follow_activated_parent(tmp_path):
+    tracer = OtlpTracer()
+    tracer.start({"session_id": "SESSION"})
+    test_span = tracer.start_span("test", attributes={"test_id": "TEST"})
+    with tracer.span("forge", parent=test_span) as forge_span:
+        rest_span = tracer.start_span("GET /services", kind=SPAN_KIND_CLIENT)
+        tracer.end_span(rest_span)
+        assert tracer.current_span() is forge_span
+    assert tracer.current_span() is None
+    with pytest.raises(ValueError):
+        with tracer.span("failing", parent=test_span):
+            raise ValueError("boom")
+    # spans that are not ended are discarded
+    tracer.start_span("never ended")
+    tracer.end_span(test_span)
+    path = tmp_path / "spans.json"
+    tracer.save(str(path))
+
+    request = json.loads(path.read_text())
+    resource_spans = request["resourceSpans"][0]
+    resource = {
+        a["key"]: a["value"]["stringValue"]
+        for a in resource_spans["resource"]["attributes"]
+    }
+    assert resource["session_id"] == "SESSION"
+    spans = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+    assert set(spans) == {
+        "test session",
+        "test",
+        "forge",
+        "GET /services",
+        "failing",
+    }
+    assert len({s["traceId"] for s in spans.values()}) == 1
+    assert "parentSpanId" not in spans["test session"]
+    assert spans["test"]["parentSpanId"] == spans["test session"]["spanId"]
+    assert spans["forge"]["parentSpanId"] == spans["test"]["spanId"]
+    assert spans["GET /services"]["parentSpanId"] == spans["forge"]["spanId"]
+    assert spans["GET /services"]["kind"] == SPAN_KIND_CLIENT
+    assert spans["failing"]["status"]["message"] == "boom"
+    # session and test ids are propagated to child spans
+    rest_attributes = {
+        a["key"]: a["value"]["stringValue"]
+        for a in spans["GET /services"]["attributes"]
+    }
+    assert rest_attributes == {"session_id": "SESSION", "test_id": "TEST"}
+
+
+def test_traced_http_handler_records_status(tmp_path):
+    handler = traced_http_handler(_fake_handler)
+    assert handler("https://localhost:8089/services", {})["status"] == 200
+    otlp_tracer.start()
+    try:
+        handler("https://localhost:8089/services/server/info", {})
+    finally:
+        path = tmp_path / "spans.json"
+        otlp_tracer.save(str(path))
+    spans = json.loads(path.read_text())["resourceSpans"][0]["scopeSpans"]
+    rest_span = spans[0]["spans"][0]
+    assert rest_span["name"] == "GET /services/server/info"
+    assert {"key": "http.status_code", "value": {"intValue": "200"}} in (
+        rest_span["attributes"]
+    )
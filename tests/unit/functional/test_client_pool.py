@@ -0,0 +1,44 @@
+from splunk_add_on_ucc_modinput_test.functional.common.client_pool import (
+    ClientPool,
+    GlobalBuiltinArgs,
+)
+
+
+def make_pool(shared=True):
+    created = []
+
+    def factory():
+        created.append(object())
+        return created[-1]
+
+    pool = ClientPool()
+    pool.register("client", factory, shared)
+    return pool, created
+
+
+def test_client_is_created_when_requested():
+    pool, created = make_pool()
+    args = GlobalBuiltinArgs(pool, {"session_id": "ABC"})
+    assert set(args) == {"session_id", "client"}
+    assert args["session_id"] == "ABC"
+    assert not created
+
+    assert args["client"] is created[0]
+    assert len(created) == 1
+
+
+def test_shared_client_is_created_once():
+    pool, created = make_pool()
+    test1_args = GlobalBuiltinArgs(pool, {})
+    test2_args = GlobalBuiltinArgs(pool, {})
+    assert test1_args["client"] is test2_args["client"]
+    assert len(created) == 1
+
+
+def test_not_shared_client_is_created_for_every_test():
+    pool, created = make_pool(shared=False)
+    test1_args = GlobalBuiltinArgs(pool, {})
+    test2_args = GlobalBuiltinArgs(pool, {})
+    assert test1_args["client"] is test1_args["client"]
+    assert test1_args["client"] is not test2_args["client"]
+    assert len(created) == 2
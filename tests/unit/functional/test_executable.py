@@ -0,0 +1,62 @@
+from unittest.mock import patch
+from splunk_add_on_ucc_modinput_test.functional.entities import executable
+from splunk_add_on_ucc_modinput_test.functional.entities.executable import (
+    ExecutableBase,
+)
+
+
+def generator_forge(test_id, name):
+    yield dict(name=name)
+
+
+class CallableForge:
+    async def __call__(self, test_id):
+        return {}
+
+
+class MethodForge:
+    def create(self, test_id, name):
+        return dict(name=name)
+
+
+class DerivedMethodForge(MethodForge):
+    pass
+
+
+def test_function_is_inspected_once():
+    first = ExecutableBase(generator_forge)
+    with patch.object(
+        ExecutableBase, "_introspect", side_effect=AssertionError
+    ):
+        second = ExecutableBase(generator_forge)
+    assert first.key == second.key
+    assert second.required_args_names == ("test_id", "name")
+    assert second._is_generatorfunction
+    assert generator_forge in executable._introspection_cache
+
+
+def test_bound_method_is_inspected_once():
+    forge_obj = MethodForge()
+    first = ExecutableBase(forge_obj.create)
+    with patch.object(
+        ExecutableBase, "_introspect", side_effect=AssertionError
+    ):
+        second = ExecutableBase(MethodForge().create)
+    assert first.key == second.key
+    assert second.key[1] == "MethodForge::create"
+    assert second.required_args_names == ("test_id", "name")
+    assert MethodForge.create in executable._introspection_cache
+
+
+def test_bound_method_introspection_per_class():
+    ExecutableBase(MethodForge().create)
+    derived = ExecutableBase(DerivedMethodForge().create)
+    assert derived.key[1] == "DerivedMethodForge::create"
+
+
+def test_callable_object_introspection():
+    forge_obj = CallableForge()
+    frg = ExecutableBase(forge_obj)
+    assert frg.key[1] == "CallableForge::__call__"
+    assert frg.is_async
+    assert frg.required_args_names == ("test_id",)
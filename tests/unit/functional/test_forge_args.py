@@ -0,0 +1,27 @@
+import pytest
+from splunk_add_on_ucc_modinput_test.functional.common.forge_args import (
+    make_fingerprint,
+    same_args,
+)
+
+
+@pytest.mark.parametrize(
+    "args1,args2,expected",
+    [
+        ({"a": 1, "b": [1, 2]}, {"b": [1, 2], "a": 1}, True),
+        ({"a": 1}, {"a": 1.0}, False),
+        ({"a": [1, 2]}, {"a": (1, 2)}, False),
+        ({"a": {"x": "y"}}, {"a": {"x": "z"}}, False),
+        ({"a": 1}, {"a": 1, "b": 2}, False),
+        ({"a": 1, "c": 2}, {"a": 1, "b": 2}, False),
+        ({}, {}, True),
+    ],
+)
+def test_fingerprint_matches_same_args(args1, args2, expected):
+    assert same_args(args1, args2) is expected
+    assert (make_fingerprint(args1) == make_fingerprint(args2)) is expected
+
+
+def test_fingerprint_of_unhashable_args():
+    assert make_fingerprint({"a": [1, {2, 3}]}) is None
+    assert same_args({"a": [1, {2, 3}]}, {"a": [1, {3, 2}]})
@@ -0,0 +1,121 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from splunk_add_on_ucc_modinput_test.functional.common.forge_cache import (
+    ForgeResultCache,
+)
+
+
+def make_config(tmp_path):
+    config = MagicMock()
+    config.cache.mkdir.return_value = tmp_path
+    return config
+
+
+def make_task(cache_version="1", cache_cleanup=None, **kwargs):
+    task = MagicMock()
+    task.forge_key = ("tests.py", "forge", "session")
+    task.cache_version = cache_version
+    task.cache_cleanup = cache_cleanup
+    task.comparable_args = kwargs
+    return task
+
+
+cleaned_up = []
+
+
+def delete_index(splunk_client, name, index):
+    cleaned_up.append((splunk_client, name, index))
+
+
+def failing_cleanup(index):
+    raise RuntimeError(f"{index} can not be deleted")
+
+
+def test_result_is_reused_by_next_session(tmp_path):
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=False, global_builtin_args={}
+    )
+    assert cache.put(make_task(name="index1"), {"index": "index1"})
+
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=False, global_builtin_args={}
+    )
+    assert cache.get(make_task(name="index1")) == {"index": "index1"}
+    assert cache.get(make_task(name="index2")) is None
+    assert cache.get(make_task("2", name="index1")) is None
+
+
+def test_forge_without_cache_version_is_not_cached(tmp_path):
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=False, global_builtin_args={}
+    )
+    assert not cache.put(make_task(None, name="index1"), {"index": "index1"})
+    assert not cache.put(make_task(client=object()), {"index": "index1"})
+
+
+def test_expired_result_is_removed(tmp_path):
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=False, global_builtin_args={}
+    )
+    assert cache.put(make_task(name="index1"), {"index": "index1"})
+
+    with patch(
+        "splunk_add_on_ucc_modinput_test.functional.common.forge_cache.time"
+    ) as time_mock:
+        time_mock.time.return_value = 10**12
+        assert cache.get(make_task(name="index1")) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_purge(tmp_path):
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=False, global_builtin_args={}
+    )
+    assert cache.put(make_task(name="index1"), {"index": "index1"})
+
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=True, global_builtin_args={}
+    )
+    assert not cache.is_enabled
+    assert cache.get(make_task(name="index1")) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_purge_calls_cleanup_of_cached_results(tmp_path):
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=False, global_builtin_args={}
+    )
+    task = make_task(cache_cleanup=delete_index, name="index1")
+    assert cache.put(task, {"index": "index1"})
+    failing_task = make_task(cache_cleanup=failing_cleanup, name="index2")
+    assert cache.put(failing_task, {"index": "index2"})
+    (tmp_path / "leftover.1.tmp").write_bytes(b"")
+
+    cleaned_up.clear()
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path),
+        ttl=60,
+        purge=True,
+        global_builtin_args={"splunk_client": "client", "session_id": "S"},
+    )
+    assert cleaned_up == [("client", "index1", "index1")]
+    # result with failed cleanup is kept for next purge
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_failed_write_is_not_cached(tmp_path):
+    cache = ForgeResultCache()
+    cache.load(
+        make_config(tmp_path), ttl=60, purge=False, global_builtin_args={}
+    )
+    with patch.object(Path, "write_bytes", side_effect=OSError("no space")):
+        assert not cache.put(make_task(name="index1"), {"index": "index1"})
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,49 @@
+import time
+
+from splunk_add_on_ucc_modinput_test.functional.common.forge_profiler import (
+    ForgeProfiler,
+)
+
+
+def busy_forge(duration):
+    end = time.time() + duration
+    while time.time() < end:
+        pass
+    return duration
+
+
+def test_matches_forge_name_or_full_path():
+    profiler = ForgeProfiler()
+    assert not profiler.matches("tests/test_a.py::create_index")
+    profiler._pattern = "create_*"
+    assert profiler.matches("tests/test_a.py::create_index")
+    assert not profiler.matches("tests/test_a.py::delete_index")
+    profiler._pattern = "tests/test_a.py::*"
+    assert profiler.matches("tests/test_a.py::delete_index")
+
+
+def test_profiles_are_saved_per_execution_and_merged(tmp_path):
+    profiler = ForgeProfiler()
+    profiler.start("busy_*", str(tmp_path))
+    forge_path = "tests/test_a.py::busy_forge"
+    assert profiler.profile(forge_path, "1", "setup", busy_forge, 0.1) == 0.1
+    profiler.profile(forge_path, "2", "teardown", busy_forge, 0.1)
+    # forges not matching the filter are called without profiling
+    profiler.profile("tests/test_a.py::other", "3", "setup", busy_forge, 0)
+    profiler.save()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "session.collapsed",
+        "test_a.busy_forge-1.collapsed",
+        "test_a.busy_forge-2.collapsed",
+    ]
+    stacks = (tmp_path / "test_a.busy_forge-1.collapsed").read_text()
+    stack, count = stacks.splitlines()[0].rsplit(" ", 1)
+    assert stack.startswith("setup;busy_forge (test_forge_profiler.py:")
+    assert int(count) > 0
+    session = (tmp_path / "session.collapsed").read_text().splitlines()
+    assert {line.split(";")[:2][1] for line in session} == {
+        "setup",
+        "teardown",
+    }
+    assert all(line.startswith(f"{forge_path};") for line in session)
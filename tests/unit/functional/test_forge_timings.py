@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+from splunk_add_on_ucc_modinput_test.functional.common.forge_timings import (
+    ForgeTimings,
+)
+
+
+def make_task(name, fingerprint=()):
+    return SimpleNamespace(
+        forge_key=("forges.py", name, "session"),
+        forge_full_path=f"forges.py::{name}",
+        initial_args_fingerprint=fingerprint,
+    )
+
+
+def make_timings(**durations):
+    timings = ForgeTimings()
+    timings._timings = {
+        f"forges.py::{name}": duration for name, duration in durations.items()
+    }
+    return timings
+
+
+def test_readiness_without_worker_limit():
+    timings = make_timings(slow=5.0, fast=1.0, next=2.0)
+    chains = [
+        [[make_task("slow")]],
+        [[make_task("fast")], None, [make_task("next")]],
+        [],
+    ]
+    assert timings.predict_readiness(chains, 10) == [5.0, 3.0, 0.0]
+
+
+def test_longest_chains_are_started_first():
+    timings = make_timings(slow=5.0, fast=1.0)
+    chains = [[[make_task("fast")]], [[make_task("slow")]]]
+    assert timings.predict_readiness(chains, 1) == [6.0, 5.0]
+
+
+def test_same_tasks_are_executed_once():
+    timings = make_timings(shared=2.0, first=1.0, second=3.0)
+    chains = [
+        [[make_task("shared")], [make_task("first")]],
+        [[make_task("shared")], [make_task("second")]],
+    ]
+    assert timings.predict_readiness(chains, 1) == [6.0, 5.0]
+
+    # the same forge with different arguments is executed again
+    chains[1][0] = [make_task("shared", fingerprint=(("arg", 1),))]
+    assert timings.predict_readiness(chains, 2) == [3.0, 5.0]
+
+
+def test_unknown_forges_take_average_duration():
+    timings = make_timings(known=3.0, other=1.0)
+    chains = [[[make_task("unknown")]]]
+    assert timings.predict_readiness(chains, 1) == [2.0]
@@ -0,0 +1,52 @@
+import pytest
+from splunk_add_on_ucc_modinput_test.functional.common.latency_stats import (
+    LatencyHistogram,
+    LatencyStats,
+)
+
+
+def test_histogram_percentiles_are_estimated_within_bucket_error():
+    histogram = LatencyHistogram()
+    for i in range(1, 101):
+        histogram.add(i / 100)
+    assert histogram.count == 100
+    assert histogram.max == 1.0
+    assert histogram.total == pytest.approx(50.5)
+    # buckets grow by 2 ** (1 / 8), so estimates are at most 9% higher
+    assert 0.5 <= histogram.p50 <= 0.5 * 1.091
+    assert 0.95 <= histogram.p95 <= 1.0
+    assert histogram.percentile(100) == 1.0
+
+
+def test_histogram_of_tiny_durations():
+    histogram = LatencyHistogram()
+    assert histogram.p50 == 0.0
+    histogram.add(0.0)
+    histogram.add(0.0001)
+    assert histogram.p95 == 0.0001
+
+
+def test_summary_lists_slowest_first():
+    stats = LatencyStats()
+    stats.record_forge("module::fast_forge", 0.1)
+    stats.record_forge("module::slow_forge", 2.0)
+    stats.record_forge("module::slow_forge", 3.0)
+    stats.record_reuse("module::slow_forge")
+    stats.record_probe("module::probe", 1.0)
+    stats.add_worker_time(3.0, 1.0)
+
+    lines = stats.summary_lines(limit=1)
+    assert lines[0] == "Slowest forges:"
+    # p50 is reported as upper bound of the bucket of 2 seconds
+    assert lines[2].split() == ["2", "2.048", "3.000", "3.000", "1"] + [
+        "module::slow_forge"
+    ]
+    assert lines[3] == "Slowest probes:"
+    assert lines[5].endswith("module::probe")
+    assert lines[6] == (
+        "Worker busy time: 3.000 seconds, idle time: 1.000 seconds "
+        "(75% busy)"
+    )
+
+    stats.reset()
+    assert stats.summary_lines(limit=1) == []
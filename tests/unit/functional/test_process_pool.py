@@ -0,0 +1,56 @@
+import os
+
+import pytest
+from splunk_add_on_ucc_modinput_test.functional.common.process_pool import (
+    ForgeProcessPool,
+)
+from splunk_add_on_ucc_modinput_test.functional.exceptions import (
+    SplTaFwkProcessPoolError,
+)
+
+
+def _fail_on_load():
+    raise ImportError("No module named 'test_b'")
+
+
+class NotImportable:
+    # unpickling in the worker fails like for a forge from a module that
+    # was not imported when the worker was forked
+    def __reduce__(self):
+        return _fail_on_load, ()
+
+
+def double(value):
+    return value * 2
+
+
+def exiting_forge():
+    os._exit(3)
+
+
+def generator_forge():
+    yield "setup"
+
+
+@pytest.fixture
+def pool():
+    pool = ForgeProcessPool()
+    pool.deploy(1)
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_survives_command_that_can_not_be_unpickled(pool):
+    with pytest.raises(SplTaFwkProcessPoolError, match="test_b"):
+        pool.execute(double, {"value": NotImportable()})
+    assert pool.execute(double, {"value": 2}) == (4, None)
+
+
+def test_dead_worker_is_replaced(pool):
+    _, teardown = pool.execute(generator_forge, {})
+    with pytest.raises(SplTaFwkProcessPoolError, match="exited"):
+        pool.execute(exiting_forge, {})
+    assert pool.execute(double, {"value": 3}) == (6, None)
+    # teardown state was lost together with the worker process
+    with pytest.raises(SplTaFwkProcessPoolError, match="teardown"):
+        teardown()
@@ -0,0 +1,66 @@
+import math
+import pytest
+from splunk_add_on_ucc_modinput_test.functional.common.resource_limits import (
+    ResourceLimiter,
+    TokenBucket,
+)
+
+
+def test_concurrency_limit():
+    limiter = ResourceLimiter()
+    limiter.register("splunkd", max_concurrency=2)
+    assert limiter.try_acquire(["splunkd"]) == 0
+    assert limiter.try_acquire(["splunkd"]) == 0
+    assert limiter.try_acquire(["splunkd"]) == math.inf
+
+    limiter.release(["splunkd"])
+    assert limiter.try_acquire(["splunkd"]) == 0
+
+
+def test_resources_are_acquired_all_at_once():
+    limiter = ResourceLimiter()
+    limiter.register("splunkd")
+    limiter.register("vendor_api")
+    assert limiter.try_acquire(["vendor_api"]) == 0
+    assert limiter.try_acquire(["splunkd", "vendor_api"]) == math.inf
+
+    # splunkd is not held by the failed attempt
+    assert limiter.try_acquire(["splunkd"]) == 0
+
+
+def test_no_resources_are_always_available():
+    limiter = ResourceLimiter()
+    assert limiter.is_empty
+    assert limiter.try_acquire([]) == 0
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=2.0, burst=2)
+    now = bucket._updated
+    for _ in range(2):
+        assert bucket.delay(now) == 0
+        bucket.take()
+    assert bucket.delay(now) == pytest.approx(0.5)
+    assert bucket.delay(now + 0.25) == pytest.approx(0.25)
+    assert bucket.delay(now + 0.5) == 0
+    # tokens do not accumulate above burst
+    assert bucket.delay(now + 100) == 0
+    bucket.take()
+    bucket.take()
+    assert bucket.delay(now + 100) > 0
+
+
+def test_rate_limit():
+    limiter = ResourceLimiter()
+    limiter.register("vendor_api", max_concurrency=None, rate_limit=1.0)
+    assert limiter.try_acquire(["vendor_api"]) == 0
+    delay = limiter.try_acquire(["vendor_api"])
+    assert 0 < delay <= 1
+
+
+def test_conflicting_definitions():
+    limiter = ResourceLimiter()
+    limiter.register("splunkd", max_concurrency=1)
+    limiter.register("splunkd", max_concurrency=1)
+    with pytest.raises(AssertionError):
+        limiter.register("splunkd", max_concurrency=2)
@@ -0,0 +1,46 @@
+import json
+import threading
+from splunk_add_on_ucc_modinput_test.functional.common.tracing import (
+    SessionTracer,
+)
+
+
+def test_spans_are_recorded_after_start(tmp_path):
+    tracer = SessionTracer()
+    with tracer.span("before", "forge"):
+        pass
+    tracer.save(str(tmp_path / "trace.json"))
+    assert not (tmp_path / "trace.json").exists()
+
+    tracer.start()
+    with tracer.span("forge1", "forge", dict(test="test1")):
+        pass
+    tracer.add_instant("forge1 reused", "forge")
+    tracer.save(str(tmp_path / "trace.json"))
+
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    assert [e["ph"] for e in events] == ["M", "X", "i"]
+    thread = threading.current_thread()
+    assert events[0]["tid"] == thread.ident
+    assert events[0]["args"] == {"name": thread.name}
+    assert events[1]["name"] == "forge1"
+    assert events[1]["args"] == {"test": "test1"}
+    assert events[1]["dur"] >= 0
+
+
+def test_async_spans_are_paired(tmp_path):
+    tracer = SessionTracer()
+    tracer.start()
+    tracer.add_span("probe1", "probe", 1.0, 2.0, is_async=True)
+    tracer.add_span("probe1", "probe", 1.5, 2.5, is_async=True)
+    tracer.save(str(tmp_path / "trace.json"))
+
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"][1:]
+    assert [(e["ph"], e["id"], e["ts"]) for e in events] == [
+        ("b", 0, 1e6),
+        ("e", 0, 2e6),
+        ("b", 1, 1.5e6),
+        ("e", 1, 2.5e6),
+    ]
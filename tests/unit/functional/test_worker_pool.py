@@ -0,0 +1,33 @@
+from splunk_add_on_ucc_modinput_test.functional.executor import (
+    FrmwkParallelExecutor,
+)
+
+pool_growth = FrmwkParallelExecutor.pool_growth
+
+
+def test_pool_grows_by_queued_jobs_when_all_workers_are_blocked():
+    # 12 jobs submitted to 10 workers, all of them running for a second
+    now = 100.0
+    running = [now - 1.0] * 10
+    assert pool_growth(10, 2, running, now, limit=12) == 2
+    # growth does not depend on when individual workers became blocked
+    running = [now - 1.0 - i * 0.3 for i in range(10)]
+    assert pool_growth(10, 2, running, now, limit=12) == 2
+
+
+def test_pool_growth_is_limited():
+    now = 100.0
+    running = [now - 5.0] * 10
+    assert pool_growth(10, 20, running, now, limit=12) == 2
+    assert pool_growth(12, 20, [now - 5.0] * 12, now, limit=12) == 0
+
+
+def test_pool_does_not_grow_while_any_worker_is_available():
+    now = 100.0
+    # idle worker picks the queued job
+    assert pool_growth(10, 2, [now - 5.0] * 9, now, limit=50) == 0
+    # worker that has just started a job is not blocked yet
+    running = [now - 5.0] * 9 + [now - 0.5]
+    assert pool_growth(10, 2, running, now, limit=50) == 0
+    # nothing is waiting for a worker
+    assert pool_growth(10, 0, [now - 5.0] * 10, now, limit=50) == 0